@@ -207,6 +207,13 @@ class AdminPanel {
             }
 
             const manifest = await manifestResponse.json();
+
+            // Prefer the single bundle of all campaigns when the converter produced one
+            const bundled = await this.loadBundle(`campaigns/${directory}/`, manifest, 'campaigns');
+            if (bundled) {
+                return bundled;
+            }
+
             const campaigns = [];
 
             // Load each campaign from the manifest
@@ -229,6 +236,24 @@ class AdminPanel {
         }
     }
 
+    async loadBundle(directory, manifest, key) {
+        // Bundles hold every item of a directory, e.g. {"campaigns": [...]}
+        if (!manifest.bundle) {
+            return null;
+        }
+
+        try {
+            const response = await fetch(`${directory}${manifest.bundle}`);
+            if (response.ok) {
+                const bundle = await response.json();
+                return bundle[key] || [];
+            }
+        } catch (error) {
+            console.error(`Error loading bundle ${manifest.bundle}:`, error);
+        }
+        return null;
+    }
+
     async loadSuccessStories() {
         const stories = [];
         
@@ -241,6 +266,12 @@ class AdminPanel {
             }
             
             const manifest = await manifestResponse.json();
+
+            const bundled = await this.loadBundle('success-stories/', manifest, 'stories');
+            if (bundled) {
+                return bundled;
+            }
+
             const storyFiles = manifest.stories || [];
 
             // Load each story file listed in the manifest
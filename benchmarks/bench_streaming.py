@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Streaming Conversion Memory Benchmark
+
+Generates synthetic campaign CSVs of increasing size and compares the peak
+Python heap of the batch converter (parse everything, then write) with the
+streaming converter (--stream). Each measurement runs in a fresh interpreter
+so results do not leak into each other.
+
+Batch memory grows with the number of CSV rows. Streaming memory is one
+campaign group plus the page caches of the temp databases that hold the
+per-campaign records (build state, snapshot index, search postings) until
+the end of the run, so it stays flat as the CSV grows. The benchmark fails
+if the peak of the largest streaming run exceeds the peak of the smallest
+by more than --max-growth-percent.
+
+Usage:
+    python3 benchmarks/bench_streaming.py
+    python3 benchmarks/bench_streaming.py --rows 25000 50000 100000 200000
+    python3 benchmarks/bench_streaming.py --rows 10000 40000 --max-growth-percent 10
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import write_synthetic_csv
+
+DEFAULT_MAX_GROWTH_PERCENT = 25
+
+
+def measure(mode: str, csv_path: str) -> dict:
+    """Run one conversion in this process and report its peak memory."""
+    sys.path.insert(0, REPO_ROOT)
+    from csv_to_json_converter import CampaignConverter
+    
+    os.chdir(os.path.dirname(csv_path))
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        converter = CampaignConverter(csv_path, streaming=(mode == 'stream'))
+        converter.convert()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"mode": mode, "peakBytes": peak, "seconds": round(elapsed, 3),
+            "campaigns": sum(converter.write_counts.values())}
+
+
+def run_case(mode: str, total_rows: int, rows_per_campaign: int) -> dict:
+    """Generate a CSV and measure one mode in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, 'campaigns.csv')
+        write_synthetic_csv(csv_path, total_rows, rows_per_campaign)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--measure', mode, csv_path],
+            check=True, capture_output=True, text=True
+        ).stdout
+    result = json.loads(output)
+    result["rows"] = total_rows
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batch and streaming conversion memory.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[25000, 50000, 100000, 200000],
+                        help="CSV sizes (rows) to benchmark")
+    parser.add_argument('--rows-per-campaign', type=int, default=50,
+                        help="Timeline rows per campaign")
+    parser.add_argument('--max-growth-percent', type=float, default=DEFAULT_MAX_GROWTH_PERCENT,
+                        help=f"Fail if the streaming peak of the largest size exceeds that of the "
+                             f"smallest by more than this (default: {DEFAULT_MAX_GROWTH_PERCENT})")
+    parser.add_argument('--measure', nargs=2, metavar=('MODE', 'CSV'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        print(json.dumps(measure(*args.measure)))
+        return
+    
+    print(f"{'rows':>8} {'campaigns':>10} {'mode':>7} {'peak MiB':>10} {'seconds':>8}")
+    print("-" * 48)
+    streamed = []
+    for total_rows in sorted(args.rows):
+        for mode in ('batch', 'stream'):
+            result = run_case(mode, total_rows, args.rows_per_campaign)
+            print(f"{result['rows']:>8} {result['campaigns']:>10} {mode:>7} "
+                  f"{result['peakBytes'] / 2 ** 20:>10.1f} {result['seconds']:>8.2f}")
+            if mode == 'stream':
+                streamed.append(result)
+    
+    # Streaming memory should not depend on the size of the CSV
+    first, last = streamed[0], streamed[-1]
+    growth = (last['peakBytes'] - first['peakBytes']) * 100 / first['peakBytes']
+    print(f"\nStreaming peak growth from {first['rows']} to {last['rows']} rows: {growth:+.1f}% "
+          f"(limit {args.max_growth_percent:g}%)")
+    if growth > args.max_growth_percent:
+        print("Error: streaming memory grows with the size of the CSV")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
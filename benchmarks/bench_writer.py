@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Campaign Writer Benchmark
+
+Parses one synthetic CSV, then times CampaignConverter.write_json_files with
+different writer pool configurations against a fresh output tree each time.
+
+Usage:
+    python3 benchmarks/bench_writer.py
+    python3 benchmarks/bench_writer.py --campaigns 5000 --workers 1 4 8
+"""
+
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import write_synthetic_csv
+from csv_to_json_converter import CampaignConverter
+
+
+def time_write(workdir: str, campaigns: dict, workers: int, executor: str) -> float:
+    """Write all campaigns into a clean campaigns/ tree and return the seconds taken."""
+    shutil.rmtree(os.path.join(workdir, 'campaigns'), ignore_errors=True)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        converter = CampaignConverter(os.path.join(workdir, 'campaigns.csv'),
+                                      workers=workers, executor=executor)
+        start = time.perf_counter()
+        converter.write_json_files(campaigns)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the campaign writer stage.")
+    parser.add_argument('--campaigns', type=int, default=4000, help="Number of campaigns")
+    parser.add_argument('--rows-per-campaign', type=int, default=50, help="Timeline rows per campaign")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help="Pool sizes to compare")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        write_synthetic_csv('campaigns.csv', args.campaigns * args.rows_per_campaign,
+                            args.rows_per_campaign)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            campaigns = CampaignConverter('campaigns.csv').parse_csv()
+        
+        print(f"{'executor':>9} {'workers':>8} {'seconds':>8} {'speedup':>8}")
+        print("-" * 36)
+        baseline = None
+        for executor in ('thread', 'process'):
+            for workers in args.workers:
+                if workers == 1 and executor == 'process':
+                    continue
+                seconds = time_write(workdir, campaigns, workers, executor)
+                baseline = baseline or seconds
+                print(f"{executor:>9} {workers:>8} {seconds:>8.2f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Benchmark Suite
+
+Times the converter stages on synthetic data and load-tests dev-server.py,
+then writes all results to one JSON file so runs can be compared over time.
+
+Converter (per scenario, best/median of --repeat runs):
+    parse_csv              reading and grouping the CSV, incl. campaign JSON
+    _create_campaign_json  cumulative time spent in it during parse_csv
+    write_json_files       writing campaign files and manifests to a clean tree
+    convert                a full run from a fresh CampaignConverter
+    convert_incremental    a second, --incremental run with nothing changed
+Scenarios with several CSV files (multi-source) also time
+    read_sources           reading and merging the files one after another
+    read_sources_pool      the same with a process pool of one process per file
+
+Server (each mode started as its own process, as a user would run it):
+    html    GET /           the HTML rewrite path
+    static  GET /script.js  a plain static file
+at each --concurrency level, reporting requests/s and latency percentiles.
+The load generator is threaded Python, so very high concurrency levels
+measure the client as much as the server.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py
+    python3 benchmarks/run_benchmarks.py --scenarios small long-timelines --repeat 5
+    python3 benchmarks/run_benchmarks.py --skip-server --baseline benchmarks/results/previous.json
+"""
+
+import argparse
+import contextlib
+import http.client
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCHMARK_DIR)
+
+from csv_to_json_converter import CampaignConverter
+from synthetic import split_synthetic_csv, write_existing_campaigns, write_synthetic_csv
+
+RESULTS_VERSION = 1
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+
+# Data shapes: rows, timeline rows per campaign, description length, share of
+# campaigns with an existing JSON file to merge, and optionally the number of
+# CSV files the rows are split over
+SCENARIOS = {
+    "small": {"rows": 2000, "rowsPerCampaign": 20, "descriptionWords": 40, "existingFraction": 0.5},
+    "medium": {"rows": 20000, "rowsPerCampaign": 50, "descriptionWords": 40, "existingFraction": 0.5},
+    "many-campaigns": {"rows": 20000, "rowsPerCampaign": 2, "descriptionWords": 40, "existingFraction": 1.0},
+    "long-timelines": {"rows": 20000, "rowsPerCampaign": 1000, "descriptionWords": 40, "existingFraction": 0.5},
+    "long-descriptions": {"rows": 5000, "rowsPerCampaign": 5, "descriptionWords": 2000, "existingFraction": 0.5},
+    "multi-source": {"rows": 20000, "rowsPerCampaign": 20, "descriptionWords": 40, "existingFraction": 0.5,
+                     "sources": 4},
+}
+DEFAULT_SCENARIOS = ["small", "medium", "long-timelines"]
+
+SERVER_TARGETS = {"html": "/", "static": "/script.js"}
+SERVER_MODES = {"dev": [], "production": ["--production"]}
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the converter's progress output."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def summarize(samples: List[float]) -> Dict:
+    return {
+        "min": round(min(samples), 6),
+        "median": round(statistics.median(samples), 6),
+        "mean": round(statistics.mean(samples), 6),
+        "max": round(max(samples), 6),
+        "runs": [round(sample, 6) for sample in samples]
+    }
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def timed(function: Callable, totals: Dict[str, float], name: str) -> Callable:
+    """Wrap function so its cumulative run time is added to totals[name]."""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            totals[name] += time.perf_counter() - start
+    return wrapper
+
+
+class ConverterBenchmark:
+    """Times the converter stages for one data shape in a scratch directory."""
+
+    def __init__(self, shape: Dict, workers: int = 1):
+        self.shape = shape
+        self.workers = workers
+        self.campaigns = (shape["rows"] + shape["rowsPerCampaign"] - 1) // shape["rowsPerCampaign"]
+        self.sources = shape.get("sources", 1)
+        self.inputs = "campaigns-*.csv" if self.sources > 1 else "campaigns.csv"
+
+    def _reset(self, workdir: str):
+        """Restore the output tree to 'existing files only'."""
+        shutil.rmtree(os.path.join(workdir, "campaigns"), ignore_errors=True)
+        return write_existing_campaigns(workdir, self.campaigns, self.shape["existingFraction"])
+
+    def _converter(self, incremental: bool = False, workers: Optional[int] = None) -> CampaignConverter:
+        return CampaignConverter(self.inputs, incremental=incremental, workers=workers or self.workers)
+
+    def _time_read_sources(self, stages: Dict[str, List[float]]):
+        """Time reading the CSV files without and with the process pool."""
+        for stage, workers in (("read_sources", 1), ("read_sources_pool", self.sources)):
+            with quiet():
+                converter = self._converter(workers=workers)
+                start = time.perf_counter()
+                converter.read_campaign_groups()
+                stages[stage].append(time.perf_counter() - start)
+
+    def run(self, repeat: int) -> Dict:
+        names = ["parse_csv", "_create_campaign_json", "write_json_files", "convert", "convert_incremental"]
+        if self.sources > 1:
+            names += ["read_sources", "read_sources_pool"]
+        stages = {name: [] for name in names}
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)
+            try:
+                write_synthetic_csv("campaigns.csv", self.shape["rows"], self.shape["rowsPerCampaign"],
+                                    self.shape["descriptionWords"])
+                if self.sources > 1:
+                    split_synthetic_csv("campaigns.csv", self.sources)
+                    os.remove("campaigns.csv")
+                existing = 0
+                for _ in range(repeat):
+                    existing = self._reset(workdir)
+                    with quiet():
+                        converter = self._converter()
+                        totals = {"_create_campaign_json": 0.0}
+                        converter._create_campaign_json = timed(converter._create_campaign_json,
+                                                                totals, "_create_campaign_json")
+                        start = time.perf_counter()
+                        campaigns = converter.parse_csv()
+                        stages["parse_csv"].append(time.perf_counter() - start)
+                        stages["_create_campaign_json"].append(totals["_create_campaign_json"])
+
+                        start = time.perf_counter()
+                        converter.write_json_files(campaigns)
+                        stages["write_json_files"].append(time.perf_counter() - start)
+
+                    self._reset(workdir)
+                    with quiet():
+                        start = time.perf_counter()
+                        self._converter().convert()
+                        stages["convert"].append(time.perf_counter() - start)
+
+                        start = time.perf_counter()
+                        self._converter(incremental=True).convert()
+                        stages["convert_incremental"].append(time.perf_counter() - start)
+
+                    if self.sources > 1:
+                        self._time_read_sources(stages)
+            finally:
+                os.chdir(cwd)
+
+        return {
+            "shape": self.shape,
+            "campaigns": self.campaigns,
+            "existingFiles": existing,
+            "stages": {name: summarize(samples) for name, samples in stages.items()}
+        }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def dev_server(mode: str):
+    """Run dev-server.py in the given mode; yields its port."""
+    port = free_port()
+    process = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "dev-server.py"), str(port)]
+                               + SERVER_MODES[mode], cwd=REPO_ROOT,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"dev-server.py ({mode}) did not start")
+                time.sleep(0.05)
+        yield port
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def load_test(port: int, path: str, concurrency: int, total_requests: int,
+              headers: Optional[Dict[str, str]] = None) -> Dict:
+    """Send total_requests GETs from `concurrency` threads; report throughput and latency."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    per_thread = max(1, total_requests // concurrency)
+
+    def client():
+        local, failed = [], 0
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                conn.request("GET", path, headers=headers or {})
+                response = conn.getresponse()
+                response.read()
+                conn.close()
+                ok = response.status == 200
+            except OSError:
+                ok = False
+            if ok:
+                local.append(time.perf_counter() - start)
+            else:
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": per_thread * concurrency,
+        "errors": errors[0],
+        "seconds": round(elapsed, 4),
+        "requestsPerSecond": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latencyMs": {name: round(percentile(latencies, fraction) * 1000, 2)
+                      for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))}
+    }
+
+
+def run_server_benchmarks(modes: List[str], levels: List[int], requests: int,
+                          accept_encoding: Optional[str]) -> List[Dict]:
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    results = []
+    for mode in modes:
+        with dev_server(mode) as port:
+            for target, path in SERVER_TARGETS.items():
+                # Warm caches (production HTML/ETag caches, OS page cache)
+                load_test(port, path, 1, 5, headers)
+                for concurrency in levels:
+                    result = load_test(port, path, concurrency, requests, headers)
+                    result.update({"mode": mode, "target": target, "path": path, "concurrency": concurrency})
+                    results.append(result)
+                    print(f"  {mode:>10} {target:>6} c={concurrency:<4} {result['requestsPerSecond']:>9.1f} req/s  "
+                          f"p50 {result['latencyMs']['p50']:>7.2f} ms  p99 {result['latencyMs']['p99']:>7.2f} ms  "
+                          f"errors {result['errors']}")
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict, baseline_path: str):
+    """Print the change against an earlier results file (positive = slower)."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    print(f"\nChange vs {baseline_path} ({baseline.get('commit') or 'unknown commit'}):")
+    for scenario, result in results.get("converter", {}).items():
+        previous = baseline.get("converter", {}).get(scenario)
+        if not previous:
+            continue
+        for stage, timing in result["stages"].items():
+            before = previous["stages"].get(stage, {}).get("median")
+            if before:
+                print(f"  {scenario:>18} {stage:>22} {(timing['median'] - before) / before * 100:+7.1f}%")
+
+    previous_server = {(r["mode"], r["target"], r["concurrency"]): r for r in baseline.get("server", [])}
+    for result in results.get("server", []):
+        before = previous_server.get((result["mode"], result["target"], result["concurrency"]))
+        if before and result["requestsPerSecond"]:
+            change = (before["requestsPerSecond"] - result["requestsPerSecond"]) / result["requestsPerSecond"]
+            print(f"  {result['mode']:>18} {result['target'] + ' c=' + str(result['concurrency']):>22} "
+                  f"{change * 100:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the converter and the dev server.")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=DEFAULT_SCENARIOS,
+                        help=f"Converter data shapes (default: {' '.join(DEFAULT_SCENARIOS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per converter stage (default: 3)")
+    parser.add_argument("--workers", type=int, default=1, help="Converter writer pool size (default: 1)")
+    parser.add_argument("--server-modes", nargs="+", choices=sorted(SERVER_MODES), default=["dev", "production"],
+                        help="dev-server.py modes to load-test")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Concurrent clients per load test (default: 1 4 16)")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per load test (default: 400)")
+    parser.add_argument("--accept-encoding", help="Accept-Encoding header to send, e.g. gzip")
+    parser.add_argument("--skip-converter", action="store_true", help="Only run the server benchmarks")
+    parser.add_argument("--skip-server", action="store_true", help="Only run the converter benchmarks")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<UTC time>.json)")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    started = datetime.now(timezone.utc)
+    results = {
+        "version": RESULTS_VERSION,
+        "timestamp": started.isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "parameters": {name: value for name, value in vars(args).items() if name not in ("output", "baseline")}
+    }
+
+    if not args.skip_converter:
+        print("Converter")
+        print("-" * 50)
+        results["converter"] = {}
+        for scenario in args.scenarios:
+            benchmark = ConverterBenchmark(SCENARIOS[scenario], workers=args.workers)
+            result = benchmark.run(args.repeat)
+            results["converter"][scenario] = result
+            print(f"  {scenario} ({result['campaigns']} campaigns, {result['shape']['rows']} rows)")
+            for stage, timing in result["stages"].items():
+                print(f"    {stage:>22} {timing['median'] * 1000:>10.1f} ms  (min {timing['min'] * 1000:.1f})")
+
+    if not args.skip_server:
+        print("\nDev server")
+        print("-" * 50)
+        results["server"] = run_server_benchmarks(args.server_modes, args.concurrency, args.requests,
+                                                  args.accept_encoding)
+
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, started.strftime("%Y%m%dT%H%M%SZ") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
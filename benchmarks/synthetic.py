@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Synthetic Benchmark Data
+
+Generators for campaign CSVs and previously converted campaign JSON files of
+any size and shape, shared by the benchmarks in this directory.
+
+The CSV has one main row per campaign followed by its timeline rows, grouped
+by title as the streaming converter requires. Shape knobs:
+
+- total_rows / rows_per_campaign: number of campaigns and timeline length
+- description_words: length of fullDescription (in "Long story." pairs)
+- existing_fraction: share of campaigns that already have a JSON file from an
+  earlier conversion, with hand-added timeline events and tags to merge
+- sources: number of CSV files the rows are split over (split_synthetic_csv);
+  half of each campaign's timeline rows go to the next file, so most
+  campaigns are found in two files and have to be merged
+
+Usage:
+    python3 benchmarks/synthetic.py campaigns.csv --rows 100000 --rows-per-campaign 50
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+from typing import Dict, List
+
+CSV_COLUMNS = [
+    'title', 'name', 'age', 'location', 'condition', 'hospital', 'doctor', 'category',
+    'shortDescription', 'fullDescription', 'image (link to images if any)',
+    'targetAmount', 'raisedAmount', 'status', 'urgency', 'date', 'event', 'description'
+]
+
+# Where the converter keeps each status (ended campaigns live in completed/)
+STATUS_DIRECTORIES = {"active": "active", "ended": "completed"}
+
+
+def campaign_title(campaign: int) -> str:
+    return f"Patient {campaign:07d} - Synthetic treatment"
+
+
+def campaign_id(title: str) -> str:
+    """Same slug the converter derives from a title."""
+    slug = re.sub(r'[^\w\s-]', '', title.lower())
+    return re.sub(r'[-\s]+', '-', slug).strip('-')
+
+
+def campaign_status(campaign: int) -> str:
+    return "Active" if campaign % 3 else "Ended"
+
+
+def write_synthetic_csv(path: str, total_rows: int, rows_per_campaign: int,
+                        description_words: int = 40):
+    """Write a CSV with campaigns grouped by title, each with a timeline."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for row_number in range(total_rows):
+            campaign, event = divmod(row_number, rows_per_campaign)
+            title = campaign_title(campaign)
+            if event == 0:
+                writer.writerow([
+                    title, f"Patient {campaign}", str(5 + campaign % 70), "West Bengal, India",
+                    "Chronic kidney disease", "Apollo Hospital, Kolkata", "Dr. Example", "Medical",
+                    "Help fund a life saving treatment", "Long story. " * description_words, "",
+                    "500000", str(campaign * 37 % 500000), campaign_status(campaign),
+                    "High", f"2024-01-{1 + event % 28:02d}", "Campaign launched", "Fundraising started"
+                ])
+            else:
+                writer.writerow([title] + [''] * 14 + [
+                    f"2024-{1 + event // 28 % 12:02d}-{1 + event % 28:02d}",
+                    f"Update {event}", "Progress update from the hospital"
+                ])
+
+
+def split_synthetic_csv(path: str, sources: int) -> List[str]:
+    """Split a synthetic CSV over `sources` files next to it; returns their paths.
+
+    Campaign c goes to file c % sources, every other timeline row of it to
+    the next file, keeping the rows of a campaign contiguous in each file.
+    """
+    stem, extension = os.path.splitext(path)
+    paths = [f"{stem}-{index + 1}{extension}" for index in range(sources)]
+    files = [open(source, 'w', encoding='utf-8', newline='') for source in paths]
+    try:
+        writers = [csv.writer(f) for f in files]
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            for writer in writers:
+                writer.writerow(header)
+            titles = {}
+            for row_number, row in enumerate(reader):
+                campaign = titles.setdefault(row[0], len(titles))
+                shift = 1 if row_number % 2 and not any(row[1:15]) else 0
+                writers[(campaign + shift) % sources].writerow(row)
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def existing_campaign(campaign: int, extra_events: int) -> Dict:
+    """A campaign JSON as an earlier run left it, plus hand edits to merge."""
+    title = campaign_title(campaign)
+    return {
+        "id": campaign_id(title),
+        "title": title,
+        "shortDescription": "Help fund a life saving treatment",
+        "fullDescription": "Edited story.",
+        "image": "assets/sevalog1crop.jpg",
+        "targetAmount": 500000,
+        "raisedAmount": 0,
+        "currency": "INR",
+        "status": campaign_status(campaign).lower(),
+        "urgency": "high",
+        "category": "medical",
+        "patientDetails": {"name": f"Patient {campaign}", "age": str(5 + campaign % 70),
+                           "location": "West Bengal, India", "hospital": "Apollo Hospital, Kolkata"},
+        "timeline": [{"date": f"2023-12-{1 + event % 28:02d}", "event": f"Note {event}",
+                      "description": "Added by hand"} for event in range(extra_events)],
+        "createdDate": "2023-12-01",
+        "lastUpdated": "2024-01-01",
+        "tags": ["kidney", "featured"]
+    }
+
+
+def write_existing_campaigns(root: str, campaigns: int, fraction: float, extra_events: int = 5) -> int:
+    """Write campaigns/<status>/<id>.json for a share of the campaigns; returns the count."""
+    if fraction <= 0:
+        return 0
+    step = max(1, round(1 / fraction))
+    written = 0
+    for campaign in range(0, campaigns, step):
+        data = existing_campaign(campaign, extra_events)
+        directory = os.path.join(root, 'campaigns', STATUS_DIRECTORIES[data['status']])
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"{data['id']}.json"), 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic campaign CSV.")
+    parser.add_argument('csv_file', help="Output CSV path")
+    parser.add_argument('--rows', type=int, default=10000, help="Total CSV rows")
+    parser.add_argument('--rows-per-campaign', type=int, default=50, help="Timeline rows per campaign")
+    parser.add_argument('--description-words', type=int, default=40, help="Length of fullDescription")
+    parser.add_argument('--existing-fraction', type=float, default=0.0,
+                        help="Also write existing campaign JSON for this share of campaigns")
+    args = parser.parse_args()
+
+    write_synthetic_csv(args.csv_file, args.rows, args.rows_per_campaign, args.description_words)
+    campaigns = (args.rows + args.rows_per_campaign - 1) // args.rows_per_campaign
+    existing = write_existing_campaigns(os.path.dirname(os.path.abspath(args.csv_file)),
+                                        campaigns, args.existing_fraction)
+    print(f"Wrote {args.rows} rows ({campaigns} campaigns) to {args.csv_file}, "
+          f"{existing} existing campaign files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Content Build Pipeline
+
+This script builds every content section of the website in one run:
+campaigns from the CSV file, and the success story and news manifests and
+bundles from the JSON files in their directories. Each content type is a
+plugin with source, transform and sink stages; the plugins run concurrently
+and share one JSON file cache and one writer pool. Items flow through the
+stages one at a time, so a streaming source keeps memory flat.
+
+Usage:
+    python3 content_pipeline.py
+    python3 content_pipeline.py --incremental
+    python3 content_pipeline.py --only success-stories news
+
+Requirements:
+    - Python 3.6+
+    - master_campaign_details.csv (or other campaign CSVs) for the campaigns section
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import abc
+import argparse
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from csv_to_json_converter import (DEFAULT_PAGE_SIZE, CampaignConverter, _is_bundle_file,
+                                   image_variants, load_asset_images, publish_directory,
+                                   read_manifest, write_json_file)
+
+# Parsed JSON files kept by a build (most recently used first)
+JSON_CACHE_ENTRIES = 1024
+
+
+class BuildContext:
+    """Resources shared by all plugins of one build."""
+
+    def __init__(self, workers: int = 1, incremental: bool = False):
+        self.workers = max(1, workers)
+        self.incremental = incremental
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.asset_images = load_asset_images()
+        self._files = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read_json(self, filepath: str) -> Dict:
+        """Read and parse a JSON file, at most once per build while it stays cached.
+
+        The cache keeps the JSON_CACHE_ENTRIES most recently used files. The
+        data is shared between stages, so callers must copy it before
+        changing it.
+        """
+        with self._lock:
+            cached = self._files.get(filepath)
+            if cached is not None:
+                self._files.move_to_end(filepath)
+        if cached is None:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            with self._lock:
+                self._files[filepath] = cached
+                while len(self._files) > JSON_CACHE_ENTRIES:
+                    self._files.popitem(last=False)
+        return cached
+
+    def write_json(self, filepath: str, data: Dict):
+        """Queue an atomic write of data to filepath; returns a future."""
+        return self.pool.submit(write_json_file, filepath, data)
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+
+class ContentPlugin(abc.ABC):
+    """One content type, built as source -> transform -> sink."""
+
+    name = ""
+
+    @abc.abstractmethod
+    def source(self, context: BuildContext) -> Iterator[Tuple[str, Dict]]:
+        """Yield (name, raw item) pairs."""
+
+    def transform(self, context: BuildContext, name: str, item: Dict) -> Optional[Dict]:
+        """Return the item as it should be published, or None to drop it."""
+        return item
+
+    @abc.abstractmethod
+    def sink(self, context: BuildContext, items: Iterator[Tuple[str, Dict]]):
+        """Write the transformed items (produced as they are consumed) and their manifest."""
+
+    def items(self, context: BuildContext) -> Iterator[Tuple[str, Dict]]:
+        """The source items that survive the transform, one at a time."""
+        for name, item in self.source(context):
+            result = self.transform(context, name, item)
+            if result is not None:
+                yield name, result
+
+    def run(self, context: BuildContext):
+        self.sink(context, self.items(context))
+
+
+class CampaignPlugin(ContentPlugin):
+    """Campaigns from the CSV files.
+
+    The stages are the converter's: source yields the CSV campaign groups,
+    transform merges a group with the existing campaign file (read through
+    the build's JSON cache) and returns None for unchanged campaigns, and
+    sink writes the campaigns on the shared pool followed by the manifests,
+    pages, search index, stats, build state and snapshot.
+    """
+
+    name = "campaigns"
+
+    def __init__(self, csv_file: Union[str, List[str]], streaming: bool = False,
+                 page_size: int = DEFAULT_PAGE_SIZE):
+        self.csv_file = csv_file
+        self.streaming = streaming
+        self.page_size = page_size
+        self.converter = None
+        self._context = None
+
+    def _converter_for(self, context: BuildContext) -> CampaignConverter:
+        """The converter of this build, created by the first stage that needs it."""
+        if self._context is not context:
+            self._context = context
+            self.converter = CampaignConverter(self.csv_file, incremental=context.incremental,
+                                               streaming=self.streaming, workers=context.workers,
+                                               page_size=self.page_size, writer_pool=context.pool,
+                                               asset_images=context.asset_images,
+                                               load_json=context.read_json)
+            print(f"Starting conversion of {self.converter.csv_file}...")
+        return self.converter
+
+    def source(self, context: BuildContext) -> Iterator[Tuple[str, Dict]]:
+        for group in self._converter_for(context).campaign_groups():
+            yield group['title'], group
+
+    def transform(self, context: BuildContext, name: str, item: Dict) -> Optional[Dict]:
+        return self._converter_for(context).process_group(item)
+
+    def sink(self, context: BuildContext, items: Iterator[Tuple[str, Dict]]):
+        converter = self._converter_for(context)
+        converter.write_campaigns(campaign for _, campaign in items)
+        if not converter.next_state:
+            print("No campaigns found to convert.")
+            return
+        converter.write_manifests()
+        converter.publish(content_bundles=False)
+
+
+class DirectoryPlugin(ContentPlugin):
+    """Items kept as one JSON file each in a directory (success stories, news).
+
+    The manifest lists every item file: files already listed keep their
+    (editorial) order, new files are appended by name and deleted files are
+    dropped, so it no longer has to be maintained by hand.
+    """
+
+    def __init__(self, name: str, directory: str, key: str, required: Tuple[str, ...]):
+        self.name = name
+        self.directory = directory
+        self.key = key
+        self.required = required
+
+    def source(self, context: BuildContext) -> Iterator[Tuple[str, Dict]]:
+        if not os.path.isdir(self.directory):
+            return
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith('.json') or filename == 'manifest.json' or \
+                    filename.startswith('.') or _is_bundle_file(filename):
+                continue
+            filepath = os.path.join(self.directory, filename)
+            try:
+                item = context.read_json(filepath)
+            except Exception as e:
+                print(f"Warning: Could not load {filepath}: {e}")
+                continue
+            yield filename, item
+
+    def transform(self, context: BuildContext, filename: str, item: Dict) -> Optional[Dict]:
+        missing = [field for field in self.required if not item.get(field)]
+        if missing:
+            print(f"Warning: Skipping {self.directory}/{filename}, missing {', '.join(missing)}")
+            return None
+
+        # Point at responsive variants of the image if available
+        item = dict(item)
+        variants = image_variants(context.asset_images, item.get('image', ''))
+        if variants:
+            item['imageVariants'] = variants
+        else:
+            item.pop('imageVariants', None)
+        return item
+
+    def sink(self, context: BuildContext, items: Iterator[Tuple[str, Dict]]):
+        items = list(items)
+        if not items and not os.path.isdir(self.directory):
+            return
+
+        published = {}
+        writes = []
+        for filename, item in items:
+            filepath = os.path.join(self.directory, filename)
+            published[filepath] = item
+            # Hand-written files are only rewritten when the transform changed them
+            if item != context.read_json(filepath):
+                writes.append((filepath, context.write_json(filepath, item)))
+        for filepath, future in writes:
+            try:
+                future.result()
+                print(f"Updated: {filepath}")
+            except Exception as e:
+                print(f"Error writing {filepath}: {e}")
+
+        names = [filename for filename, _ in items]
+        listed = [f for f in read_manifest(self.directory).get(self.key, []) if f in names]
+        files = listed + [f for f in names if f not in listed]
+
+        # Same bundle and manifest step as the converter, fed from the transformed items
+        publish_directory(self.directory, self.key, files, load=published.__getitem__)
+
+
+def default_plugins(csv_file: Union[str, List[str]], streaming: bool = False,
+                    page_size: int = DEFAULT_PAGE_SIZE) -> List[ContentPlugin]:
+    """Return the plugins for every content section of the site."""
+    return [
+        CampaignPlugin(csv_file, streaming=streaming, page_size=page_size),
+        DirectoryPlugin("success-stories", "success-stories", "stories", ("id", "patientName")),
+        DirectoryPlugin("news", "news", "articles", ("id", "title"))
+    ]
+
+
+def run_pipeline(plugins: List[ContentPlugin], workers: int = 1, incremental: bool = False) -> bool:
+    """Run the plugins concurrently; returns False if any of them failed."""
+    context = BuildContext(workers, incremental)
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(plugins))) as runner:
+            futures = [(plugin, runner.submit(plugin.run, context)) for plugin in plugins]
+            for plugin, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error building {plugin.name}: {e}")
+                    failed.append(plugin.name)
+    finally:
+        context.close()
+    return not failed
+
+
+def main():
+    """Main entry point."""
+    plugin_names = ["campaigns", "success-stories", "news"]
+    parser = argparse.ArgumentParser(description="Build all website content in one run.")
+    parser.add_argument("csv_file", nargs="*", default=["master_campaign_details.csv"],
+                        help="Source CSV files or glob patterns for campaigns "
+                             "(default: master_campaign_details.csv)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only reprocess campaigns whose CSV rows changed since the last run")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process one campaign at a time; CSV rows must be grouped by title")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Shared writer pool size (default: number of CPUs)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Campaigns per completed-campaign page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--only", nargs="+", choices=plugin_names, metavar="SECTION",
+                        help=f"Build only these sections ({', '.join(plugin_names)})")
+    args = parser.parse_args()
+
+    print("Sevabrata Foundation - Content Build Pipeline")
+    print("=" * 50)
+
+    plugins = default_plugins(args.csv_file, streaming=args.stream, page_size=args.page_size)
+    if args.only:
+        plugins = [plugin for plugin in plugins if plugin.name in args.only]
+
+    if not run_pipeline(plugins, workers=args.workers, incremental=args.incremental):
+        sys.exit(1)
+    print(f"\nContent build completed: {', '.join(plugin.name for plugin in plugins)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ fi
 
 # Run the converter
 echo "Running CSV to JSON converter..."
-python3 csv_to_json_converter.py
+python3 csv_to_json_converter.py "$@"
 
 # Check if conversion was successful
 if [ $? -eq 0 ]; then
@@ -31,7 +31,7 @@ if [ $? -eq 0 ]; then
     echo ""
     echo "Generated files:"
     echo "📁 campaigns/active/ - Active campaign JSON files"
-    echo "📁 campaigns/ended/ - Completed campaign JSON files"
+    echo "📁 campaigns/completed/ - Completed campaign JSON files"
     echo "📄 manifest.json files in each directory"
     echo ""
     echo "You can now test the website by running:"
@@ -7,6 +7,12 @@ and organizes them into active/ended directories with manifest files.
 
 Usage:
     python3 csv_to_json_converter.py
+    python3 csv_to_json_converter.py --incremental
+    python3 csv_to_json_converter.py --stream
+    python3 csv_to_json_converter.py "sheets/*.csv" extra_campaigns.csv
+    python3 csv_to_json_converter.py --workers 8 --executor process
+    python3 csv_to_json_converter.py --quiet --profile
+    python3 csv_to_json_converter.py --diff-snapshots old.index.json campaigns/_snapshot.index.json
 
 Requirements:
     - Python 3.6+
@@ -15,56 +21,1455 @@ Requirements:
 Author: Generated for Sevabrata Foundation
 """
 
+import argparse
+import bisect
+import contextlib
+import cProfile
 import csv
+import glob
+import hashlib
+import heapq
+import itertools
 import json
+import math
+import mmap
 import os
 import re
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple, Callable, Union
+
+try:
+    import brotli
+except ImportError:  # Optional: .br bundles are skipped without it
+    brotli = None
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: no peak RSS in run reports
+    resource = None
+
+
+# Build state used by incremental mode (lives next to _stats.json/_config.json)
+STATE_FILENAME = "_build_state.json"
+# Bump when the CSV -> JSON mapping changes so every campaign is reprocessed
+STATE_VERSION = 7
+
+# Statuses whose directory is also published as fixed-size summary pages
+PAGED_STATUSES = ("ended",)
+DEFAULT_PAGE_SIZE = 24
+
+# Timeline dates unless the CSV declares a format row, e.g. "(YYYY-MM-DD)"
+DEFAULT_DATE_FORMAT = "YYYY-MM-DD"
+DATE_FORMAT_TOKENS = {"YYYY": "%Y", "MM": "%m", "DD": "%d"}
+# Hex digits kept per timeline dedupe key in the build state
+TIMELINE_KEY_WIDTH = 12
+
+# Inverted index of campaign facets and title/description words
+SEARCH_INDEX_FILENAME = "_search_index.json"
+SEARCH_INDEX_VERSION = 1
+SEARCH_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "he", "her", "his",
+    "in", "is", "it", "its", "of", "on", "or", "our", "she", "that", "the", "their", "this",
+    "to", "us", "was", "we", "who", "will", "with", "you", "your"
+}
+
+# Hand-maintained content directories that get a bundle next to their manifest
+CONTENT_DIRECTORIES = [("success-stories", "stories"), ("news", "articles")]
+
+# Responsive image variants written by optimize_assets.py
+ASSET_MANIFEST = os.path.join("assets", "optimized", "asset-manifest.json")
+
+# Aggregates derived from the campaigns, merged into the hand-maintained figures
+STATS_FILENAME = "_stats.json"
+# Figures the CSV fully covers; the rest is only filled in when missing
+STATS_FROM_CSV = ("activeCampaigns", "completionTimeDays", "byStatus", "byCategory")
+
+# Run report written with --profile
+RUN_REPORT_VERSION = 1
+
+# Single-file copy of every campaign for fast startup and run diffs
+SNAPSHOT_FILENAME = "_snapshot.jsonl"
+SNAPSHOT_INDEX_FILENAME = "_snapshot.index.json"
+SNAPSHOT_VERSION = 1
+
+# Page cache of the temp databases holding the per-campaign records of a run
+SPILL_CACHE_KIB = 2048
+
+# Permissions for new files, as open() would create them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(filepath: str, data: bytes):
+    """Write data to a temp file next to filepath and rename it into place.
+    
+    Readers see either the old file or the complete new one, never a
+    partially written file.
+    """
+    _atomic_write_chunks(filepath, [data])
+
+
+def _same_content(path: str, other_path: str) -> bool:
+    """Compare two files chunk by chunk."""
+    try:
+        if os.path.getsize(path) != os.path.getsize(other_path):
+            return False
+        with open(path, 'rb') as f, open(other_path, 'rb') as other:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                if chunk != other.read(len(chunk)):
+                    return False
+    except OSError:
+        return False
+    return True
+
+
+def _atomic_write_chunks(filepath: str, chunks: Iterable[bytes], only_if_changed: bool = False) -> Tuple[bool, int]:
+    """Like _atomic_write, for content produced piece by piece.
+    
+    The content is never held in memory as a whole. With only_if_changed a
+    file that already holds the same bytes is left untouched (timestamp
+    included). Returns (whether the file was written, its size).
+    """
+    directory = os.path.dirname(filepath) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(filepath)}.",
+                                    suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            size = f.tell()
+            f.flush()
+            if only_if_changed and _same_content(tmp_path, filepath):
+                os.remove(tmp_path)
+                return False, size
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True, size
+
+
+def _open_spill_database(directory: str, prefix: str) -> Tuple[sqlite3.Connection, str]:
+    """Create a hidden temp SQLite file in directory; returns (connection, path).
+    
+    The data is thrown away after the run, so there is no journal or fsync.
+    """
+    fd, path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix='.tmp')
+    os.close(fd)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode = OFF")
+    db.execute("PRAGMA synchronous = OFF")
+    db.execute("PRAGMA temp_store = FILE")
+    db.execute(f"PRAGMA cache_size = -{SPILL_CACHE_KIB}")
+    return db, path
+
+
+def _encode_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode('utf-8')
+
+
+def _json_object_chunks(fields: Dict, key: str, items: Iterable[Tuple[str, Any]]) -> Iterator[str]:
+    """Encode ``{**fields, key: dict(items)}`` piece by piece, one item per line."""
+    yield json.dumps(fields, ensure_ascii=False, separators=(',', ':'))[:-1]
+    yield (',' if fields else '') + json.dumps(key) + ':{'
+    separator = '\n'
+    for name, value in items:
+        yield separator + json.dumps(name, ensure_ascii=False) + ':' + json.dumps(
+            value, ensure_ascii=False, separators=(',', ':'))
+        separator = ',\n'
+    yield '}}\n'
+
+
+def _load_json_file(filepath: str) -> Dict:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_bundle(directory: str, key: str, item_paths: Iterable[str],
+                 load: Callable[[str], Dict] = _load_json_file) -> str:
+    """Combine JSON files into one content-addressed bundle in directory.
+    
+    The bundle is ``{key: [item, ...]}`` in compact JSON, named
+    ``bundle.<hash>.json`` so it can be cached as immutable, with precompressed
+    ``.gz`` (and ``.br`` when the brotli module is installed) siblings. Items
+    are streamed one at a time, each obtained with `load(path)`. Returns the
+    bundle file name; an existing bundle with the same content is left untouched.
+    """
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".bundle.", suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'wb') as f:
+            def emit(chunk: str):
+                data = chunk.encode('utf-8')
+                digest.update(data)
+                f.write(data)
+            
+            emit('{' + json.dumps(key) + ':[')
+            for index, item_path in enumerate(item_paths):
+                item = load(item_path)
+                emit((',' if index else '') + json.dumps(item, ensure_ascii=False, separators=(',', ':')))
+            emit(']}')
+            f.flush()
+            os.fsync(f.fileno())
+        
+        bundle_name = f"bundle.{digest.hexdigest()[:16]}.json"
+        bundle_path = os.path.join(directory, bundle_name)
+        if os.path.exists(bundle_path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, bundle_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    _write_compressed_siblings(bundle_path)
+    return bundle_name
+
+
+def _compressed_chunks(filepath: str, compress: Callable[[bytes], bytes],
+                       finish: Callable[[], bytes]) -> Iterator[bytes]:
+    """Feed a file to a streaming compressor in 64 KiB chunks."""
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            yield compress(chunk)
+    yield finish()
+
+
+def _write_compressed_siblings(filepath: str):
+    """Write deterministic .gz/.br copies of filepath if they are missing.
+    
+    Bundles hold every campaign, so they are compressed a chunk at a time.
+    """
+    if not os.path.exists(filepath + '.gz'):
+        # A gzip stream (wbits 31) has no file name or mtime: identical for identical input
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+        _atomic_write_chunks(filepath + '.gz', _compressed_chunks(filepath, compressor.compress, compressor.flush))
+    if brotli is not None and not os.path.exists(filepath + '.br'):
+        compressor = brotli.Compressor()
+        _atomic_write_chunks(filepath + '.br', _compressed_chunks(filepath, compressor.process, compressor.finish))
+
+
+def image_variants(images: Dict[str, Dict], image: str) -> Optional[Dict]:
+    """Return the imageVariants record for an image path, if it was optimized."""
+    if image and image.startswith('./'):
+        image = image[len('./'):]
+    entry = images.get(image) if image else None
+    if not entry:
+        return None
+    return {
+        "width": entry['width'],
+        "height": entry['height'],
+        "srcset": entry['srcset']
+    }
+
+
+def read_manifest(directory: str) -> Dict:
+    """Read a directory's manifest.json, returning {} if it is missing or invalid."""
+    try:
+        with open(os.path.join(directory, "manifest.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _manifest_chunks(key: str, files: Iterable[str], fields: Dict) -> Iterator[str]:
+    """Encode ``{key: files, **fields}`` as json.dumps(indent=2) would, listing files as they come."""
+    yield '{\n  ' + json.dumps(key) + ': ['
+    separator = '\n    '
+    for filename in files:
+        yield separator + json.dumps(filename, ensure_ascii=False)
+        separator = ',\n    '
+    yield ']' if separator == '\n    ' else '\n  ]'
+    for name, value in fields.items():
+        value = json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        yield ',\n  ' + json.dumps(name) + ': ' + value
+    yield '\n}'
+
+
+def write_manifest(directory: str, key: str, files: Iterable[str], extra: Optional[Dict] = None,
+                   only_if_changed: bool = False, log: Callable[[str], None] = print) -> bool:
+    """Atomically write ``{key: files, "lastUpdated": ..., **extra}`` to manifest.json.
+    
+    With only_if_changed, a manifest that differs only in its timestamp is left
+    alone. `files` may be an iterator; it is only collected in a list to be
+    compared with an existing manifest. Returns whether the manifest was written.
+    """
+    manifest_path = os.path.join(directory, "manifest.json")
+    fields = {"lastUpdated": datetime.now().isoformat() + "Z"}
+    fields.update({name: value for name, value in (extra or {}).items() if value is not None})
+    
+    if only_if_changed:
+        existing = read_manifest(directory)
+        if existing:
+            files = list(files)
+            existing.pop('lastUpdated', None)
+            unchanged_fields = {name: value for name, value in fields.items() if name != 'lastUpdated'}
+            if existing == {key: files, **unchanged_fields}:
+                return False
+    
+    try:
+        _atomic_write_chunks(manifest_path, _encode_chunks(_manifest_chunks(key, files, fields)))
+        log(f"Created manifest: {manifest_path}")
+    except Exception as e:
+        print(f"Error creating manifest {manifest_path}: {e}")
+        return False
+    return True
+
+
+def publish_directory(directory: str, key: str, files: List[str],
+                      load: Callable[[str], Dict] = _load_json_file,
+                      log: Callable[[str], None] = print) -> Tuple[Optional[str], bool]:
+    """Bundle the listed item files of a hand-maintained directory.
+    
+    Writes the bundle, then the manifest listing `files` and the bundle (only
+    if it changed), and removes older bundles only once the manifest points at
+    the new one. Returns (bundle name, or None if it failed; whether the
+    manifest was written).
+    """
+    try:
+        bundle = write_bundle(directory, key, [os.path.join(directory, f) for f in files], load=load)
+    except Exception as e:
+        print(f"Error creating bundle in {directory}: {e}")
+        bundle = None
+    
+    written = write_manifest(directory, key, files, {"bundle": bundle}, only_if_changed=True, log=log)
+    
+    if bundle:
+        for filename in os.listdir(directory):
+            if _is_bundle_file(filename) and not filename.startswith(bundle):
+                os.remove(os.path.join(directory, filename))
+                log(f"Removed: {directory}/{filename}")
+    return bundle, written
+
+
+def load_asset_images() -> Dict[str, Dict]:
+    """Load the optimized images recorded by optimize_assets.py."""
+    if not os.path.exists(ASSET_MANIFEST):
+        return {}
+    try:
+        with open(ASSET_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f).get('images', {})
+    except Exception as e:
+        print(f"Warning: Could not load {ASSET_MANIFEST}: {e}")
+        return {}
+
+
+def _is_bundle_file(filename: str) -> bool:
+    """Check whether filename is a bundle or one of its compressed siblings."""
+    return re.match(r'^bundle\.[0-9a-f]+\.json(\.gz|\.br)?$', filename) is not None
+
+
+def _row_dict(fieldnames: List[str], values: List[str]) -> Dict:
+    """Build a row dict the way csv.DictReader does (None for missing or extra cells)."""
+    row = dict(zip(fieldnames, values))
+    if len(values) > len(fieldnames):
+        row[None] = values[len(fieldnames):]
+    else:
+        for name in fieldnames[len(values):]:
+            row[name] = None
+    return row
+
+
+def read_csv_rows(file) -> Tuple[Dict[str, str], Iterator[Dict]]:
+    """Read the header of a campaign CSV; returns (column formats, row iterator).
+    
+    The spreadsheet export names column groups in its first row (title,
+    patientDetails, ..., timeline), the columns inside the groups in a second
+    row (name, age, ..., date, event, description) and value formats such as
+    "(YYYY-MM-DD)" in a third; the extra header rows have no title. A plain
+    one-row header works as well.
+    """
+    reader = csv.reader(file)
+    fieldnames = [name.strip() for name in next(reader, [])]
+    formats = {}
+    first_row = None
+    for number, values in enumerate(reader):
+        cells = [value.strip() for value in values]
+        if not any(cells):
+            continue
+        if cells[0]:
+            first_row = values
+            break
+        if all(re.match(r'^\(.+\)$', cell) for cell in cells if cell):
+            formats.update({fieldnames[i]: cell[1:-1] for i, cell in enumerate(cells)
+                            if cell and i < len(fieldnames)})
+        elif number == 0:
+            fieldnames = [sub or top for top, sub in
+                          itertools.zip_longest(fieldnames, cells, fillvalue='')]
+    
+    def rows() -> Iterator[Dict]:
+        if first_row is None:
+            return
+        yield _row_dict(fieldnames, first_row)
+        for values in reader:
+            if values:
+                yield _row_dict(fieldnames, values)
+    
+    return formats, rows()
+
+
+def strptime_format(declared: str) -> str:
+    """Translate a declared date format such as YYYY-MM-DD to strptime directives."""
+    return re.sub('|'.join(DATE_FORMAT_TOKENS), lambda match: DATE_FORMAT_TOKENS[match.group(0)],
+                  declared.replace('%', '%%'))
+
+
+class _TimelineDates:
+    """Sequence view of the dates of a timeline, so bisect needs no copy."""
+    
+    def __init__(self, timeline: List[Dict]):
+        self.timeline = timeline
+    
+    def __len__(self) -> int:
+        return len(self.timeline)
+    
+    def __getitem__(self, index: int) -> str:
+        return self.timeline[index].get('date', '')
+
+
+def timeline_key(event: Dict) -> str:
+    """Short digest of the (date, event) pair that identifies a timeline event."""
+    key = f"{event.get('date', '')}\x1f{event.get('event', '')}".encode('utf-8')
+    return hashlib.sha256(key).hexdigest()[:TIMELINE_KEY_WIDTH]
+
+
+class _PackedKeys:
+    """Sequence view of the fixed-width keys in a packed string."""
+    
+    def __init__(self, packed: str):
+        self.packed = packed
+    
+    def __len__(self) -> int:
+        return len(self.packed) // TIMELINE_KEY_WIDTH
+    
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start = index * TIMELINE_KEY_WIDTH
+        return self.packed[start:start + TIMELINE_KEY_WIDTH]
+
+
+class TimelineKeys:
+    """Dedupe keys of a timeline, stored in the build state as one sorted string.
+    
+    Lookups bisect the packed string without unpacking it. Added keys go
+    into a sorted list by bisection and pack() merges the two sorted runs,
+    so keeping the index costs time in the number of new events plus one
+    linear pass to write it out, never a sort of the whole history.
+    """
+    
+    def __init__(self, packed: str = ""):
+        self.packed = packed
+        self.added = []
+    
+    @classmethod
+    def from_keys(cls, keys) -> 'TimelineKeys':
+        return cls("".join(sorted(set(keys))))
+    
+    def __len__(self) -> int:
+        return len(self.packed) // TIMELINE_KEY_WIDTH + len(self.added)
+    
+    def __contains__(self, key: str) -> bool:
+        for keys in (_PackedKeys(self.packed), self.added):
+            position = bisect.bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                return True
+        return False
+    
+    def add(self, key: str):
+        if key not in self:
+            bisect.insort(self.added, key)
+    
+    def pack(self) -> str:
+        """The keys as one sorted, fixed-width string."""
+        if not self.added:
+            return self.packed
+        return "".join(heapq.merge(_PackedKeys(self.packed), self.added))
+
+
+def index_timeline(timeline: List[Dict]) -> TimelineKeys:
+    """Put a timeline in date order (in place) if needed and return its keys.
+    
+    This reads every event; it is only needed for a timeline whose keys the
+    build state does not have (new, hand-edited or from an older state).
+    """
+    dates = _TimelineDates(timeline)
+    if any(dates[i] > dates[i + 1] for i in range(len(timeline) - 1)):
+        timeline.sort(key=lambda x: x.get('date', ''))
+    return TimelineKeys.from_keys(timeline_key(event) for event in timeline)
+
+
+def merge_timeline(timeline: List[Dict], new_events: List[Dict],
+                   keys: Optional[TimelineKeys] = None) -> List[Dict]:
+    """Add new events to a date-ordered timeline, skipping duplicates.
+    
+    Events are identified by timeline_key. `keys` are the keys of the
+    timeline, which must be in date order, and are updated in place; without
+    them they are computed with index_timeline. New events that all come at
+    or after the last one are appended in one go; others are inserted by
+    bisection on the date, after existing events of the same date, in the
+    order given. The timeline is changed in place and returned.
+    """
+    if keys is None:
+        keys = index_timeline(timeline)
+    
+    added = []
+    for new_event in new_events:
+        key = timeline_key(new_event)
+        if key not in keys:
+            keys.add(key)
+            added.append(new_event)
+    if not added:
+        return timeline
+    
+    tail = timeline[-1].get('date', '') if timeline else ''
+    added_dates = [event.get('date', '') for event in added]
+    if added_dates[0] >= tail and all(a <= b for a, b in zip(added_dates, added_dates[1:])):
+        timeline.extend(added)
+        return timeline
+    
+    dates = _TimelineDates(timeline)
+    for new_event in added:
+        timeline.insert(bisect.bisect_right(dates, new_event.get('date', '')), new_event)
+    return timeline
+
+
+def condition_tags(condition: str) -> List[str]:
+    """Tags for a patient condition such as "Right eye surgery (caused by accident)".
+    
+    Conditions are split where the spreadsheet separates them (commas,
+    semicolons, slashes); remarks in parentheses are left out.
+    """
+    condition = re.sub(r'\([^)]*\)', ' ', condition.lower())
+    parts = (' '.join(part.split()) for part in re.split(r'[,;/]', condition))
+    return [part for part in parts if part]
+
+
+def _hash_rows(rows: List[Dict]) -> str:
+    """Hash the CSV rows of one campaign group."""
+    # Keep key/value pairs in column order; DictReader may use None as a key
+    payload = [STATE_VERSION, [list(row.items()) for row in rows]]
+    encoded = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CampaignSource:
+    """One campaign CSV file: its header, declared date format and campaign groups.
+    
+    Holds no converter state, so several sources can be read in parallel by
+    ingestion workers (see read_campaign_source).
+    """
+    
+    def __init__(self, csv_file: str):
+        self.csv_file = csv_file
+        self.declared_date_format = DEFAULT_DATE_FORMAT
+        self.date_format = strptime_format(DEFAULT_DATE_FORMAT)
+        self.row_count = 0
+        self._dates = {}
+    
+    def rows(self) -> Iterator[Dict]:
+        """Yield the rows that have a title, taking the date format from the header."""
+        with open(self.csv_file, 'r', encoding='utf-8') as file:
+            formats, rows = read_csv_rows(file)
+            self.declared_date_format = formats.get('date', DEFAULT_DATE_FORMAT)
+            self.date_format = strptime_format(self.declared_date_format)
+            self._dates = {}
+            for row in rows:
+                self.row_count += 1
+                if (row.get('title') or '').strip():
+                    yield row
+    
+    def iter_groups(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """Yield (title, rows) for each run of rows with the same title."""
+        title, rows = None, []
+        for row in self.rows():
+            row_title = row['title'].strip()
+            if row_title != title:
+                if rows:
+                    yield title, rows
+                title, rows = row_title, []
+            rows.append(row)
+        if rows:
+            yield title, rows
+    
+    def groups(self) -> Dict[str, List[Dict]]:
+        """Return all rows grouped by title, in order of first appearance."""
+        campaign_groups = {}
+        for row in self.rows():
+            campaign_groups.setdefault(row['title'].strip(), []).append(row)
+        return campaign_groups
+    
+    def _parse_date(self, value: str) -> Optional[str]:
+        """Validate a date against the declared format; returns it as YYYY-MM-DD."""
+        if value not in self._dates:
+            try:
+                self._dates[value] = datetime.strptime(value.strip(), self.date_format).date().isoformat()
+            except ValueError:
+                self._dates[value] = None
+        return self._dates[value]
+    
+    def parse_timeline_events(self, rows: List[Dict]) -> List[Dict]:
+        """Parse timeline events for a campaign from multiple CSV rows.
+        
+        Dates are validated once here; the events come back in row order, so
+        rows added to the sheet are at the end (merge_timeline puts them in
+        date order).
+        """
+        timeline = []
+        for row in rows:
+            if row.get('date') and row.get('event'):
+                date = self._parse_date(row['date'])
+                if date is None:
+                    print(f"Warning: Skipping timeline event '{row['event']}' of "
+                          f"{row.get('title', '').strip()}: date '{row['date']}' is not "
+                          f"{self.declared_date_format}")
+                    continue
+                timeline.append({
+                    "date": date,
+                    "event": row['event'],
+                    "description": row.get('description', '')
+                })
+        return timeline
+    
+    def campaign_group(self, title: str, rows: List[Dict]) -> Dict:
+        """Turn the rows of one campaign into {title, rowHash, lastUpdated, data}.
+        
+        lastUpdated is the sheet's lastUpdated column if it has one, else the
+        latest timeline date; it decides conflicts between sources.
+        """
+        # Use the first row as the main campaign data
+        main_row = rows[0]
+        
+        # Parse timeline from all rows
+        timeline = self.parse_timeline_events(rows)
+        
+        # Create campaign data
+        campaign_data = {
+            'title': title,
+            'shortDescription': main_row.get('shortDescription', ''),
+            'fullDescription': main_row.get('fullDescription', ''),
+            'image': main_row.get('image (link to images if any)', ''),
+            'targetAmount': main_row.get('targetAmount', '0'),
+            'raisedAmount': main_row.get('raisedAmount', '0'),
+            'status': main_row.get('status', ''),
+            'urgency': main_row.get('urgency', ''),
+            'category': main_row.get('category', 'medical'),
+            'name': main_row.get('name', ''),
+            'age': main_row.get('age', ''),
+            'location': main_row.get('location', ''),
+            'condition': main_row.get('condition', ''),
+            'hospital': main_row.get('hospital', ''),
+            'doctor': main_row.get('doctor', ''),
+            'timeline': timeline
+        }
+        
+        last_updated = self._parse_date(main_row['lastUpdated']) if main_row.get('lastUpdated') else None
+        return {
+            "title": title,
+            "rowHash": _hash_rows(rows),
+            "lastUpdated": last_updated or max((event['date'] for event in timeline), default=''),
+            "data": campaign_data
+        }
+
+
+def read_campaign_source(csv_file: str) -> Tuple[List[Dict], int]:
+    """Read one CSV into campaign groups; returns (groups, row count).
+    
+    Runs inside ingestion workers, so it must stay a module-level function.
+    """
+    source = CampaignSource(csv_file)
+    groups = [source.campaign_group(title, rows) for title, rows in source.groups().items()]
+    return groups, source.row_count
+
+
+def merge_campaign_groups(groups: List[Dict]) -> Dict:
+    """Merge the groups of one campaign (same id) found in several places.
+    
+    Groups are ranked by lastUpdated, ties going to the later source (each
+    group carries its `order`). Every field comes from the highest ranked
+    group that has a value for it; timelines are unioned, dropping events
+    with the same date and name.
+    """
+    if len(groups) == 1:
+        return groups[0]
+    
+    ranked = sorted(groups, key=lambda group: (group['lastUpdated'], group['order']), reverse=True)
+    data = {}
+    for field, value in ranked[0]['data'].items():
+        if field != 'timeline':
+            data[field] = next((group['data'][field] for group in ranked if group['data'].get(field)), value)
+    data['timeline'] = []
+    keys = TimelineKeys()
+    for group in groups:
+        merge_timeline(data['timeline'], group['data']['timeline'], keys)
+    
+    row_hash = hashlib.sha256(json.dumps([group['rowHash'] for group in groups]).encode('utf-8')).hexdigest()
+    return {
+        "title": ranked[0]['title'],
+        "rowHash": row_hash,
+        "lastUpdated": ranked[0]['lastUpdated'],
+        "order": ranked[0]['order'],
+        "data": data
+    }
+
+
+def expand_csv_inputs(inputs: List[str]) -> List[str]:
+    """Expand glob patterns among the input files, keeping the given order.
+    
+    A pattern that matches nothing is kept as it is, to be reported as missing.
+    """
+    files = []
+    for pattern in inputs:
+        matches = (sorted(glob.glob(pattern)) if re.search(r'[*?[]', pattern) else []) or [pattern]
+        files.extend(path for path in matches if path not in files)
+    return files
+
+
+def _write_campaign_file(filepath: str, campaign: Dict,
+                         only_if_changed: bool) -> Tuple[bool, str, int, int, Dict[str, Tuple[float, float]]]:
+    """Serialize and atomically write one campaign file.
+    
+    Runs inside writer pool workers, so it must stay a module-level function.
+    Returns (written, output hash, size, mtime_ns, timings), where timings
+    maps "serialize" and "fileIO" to the (wall, CPU) seconds they took.
+    """
+    start_wall, start_cpu = time.perf_counter(), time.thread_time()
+    data = json.dumps(campaign, indent=2, ensure_ascii=False).encode('utf-8')
+    output_hash = hashlib.sha256(data).hexdigest()
+    serialized_wall, serialized_cpu = time.perf_counter(), time.thread_time()
+    
+    written = True
+    if only_if_changed:
+        try:
+            with open(filepath, 'rb') as f:
+                written = f.read() != data
+        except FileNotFoundError:
+            pass
+    if written:
+        _atomic_write(filepath, data)
+    stat = os.stat(filepath)
+    
+    timings = {
+        "serialize": (serialized_wall - start_wall, serialized_cpu - start_cpu),
+        "fileIO": (time.perf_counter() - serialized_wall, time.thread_time() - serialized_cpu)
+    }
+    return written, output_hash, stat.st_size, stat.st_mtime_ns, timings
+
+
+def write_json_file(filepath: str, data: Dict, only_if_changed: bool = True) -> bool:
+    """Atomically write data as indented JSON, the format of the content files.
+    
+    With only_if_changed a file that already holds the same JSON is left
+    untouched. Returns whether the file was written; like the campaign
+    writer it can run inside pool workers.
+    """
+    return _write_campaign_file(filepath, data, only_if_changed)[0]
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs tasks immediately (workers=1)."""
+    
+    class _Done:
+        def __init__(self, fn, args):
+            try:
+                self._result, self._error = fn(*args), None
+            except Exception as e:
+                self._result, self._error = None, e
+        
+        def result(self):
+            if self._error:
+                raise self._error
+            return self._result
+    
+    def submit(self, fn, *args):
+        return self._Done(fn, args)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+class _SharedExecutor:
+    """Executor owned by the caller; leaving the `with` block does not shut it down."""
+    
+    def __init__(self, pool):
+        self._pool = pool
+    
+    def submit(self, fn, *args):
+        return self._pool.submit(fn, *args)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+class CampaignStats:
+    """Running aggregates over campaign summaries.
+    
+    Campaigns can be added and removed one at a time, so an incremental run
+    only applies the campaigns that changed to the totals saved by the
+    previous run. Completion times are kept as the number of campaigns that
+    took each number of days, which answers percentile queries and does not
+    grow with the number of campaigns.
+    """
+    
+    def __init__(self, data: Optional[Dict] = None):
+        data = data or {}
+        self.by_status = data.get('byStatus', {})
+        self.by_category = data.get('byCategory', {})
+        self.successful = data.get('successful', 0)
+        # JSON object keys are strings
+        self.completion_days = {int(days): count for days, count in data.get('completionDays', {}).items()}
+    
+    def to_dict(self) -> Dict:
+        return {
+            "byStatus": self.by_status,
+            "byCategory": self.by_category,
+            "successful": self.successful,
+            "completionDays": {str(days): count for days, count in sorted(self.completion_days.items())}
+        }
+    
+    @staticmethod
+    def _completion_days(summary: Dict) -> Optional[int]:
+        """Days from the first to the last recorded date of a finished campaign."""
+        if summary.get('status') != 'ended':
+            return None
+        try:
+            start = datetime.strptime(summary.get('startDate', ''), "%Y-%m-%d")
+            end = datetime.strptime(summary.get('completedDate', ''), "%Y-%m-%d")
+        except ValueError:
+            return None
+        return max(0, (end - start).days)
+    
+    def _apply(self, entry: Dict, sign: int):
+        summary = entry['summary']
+        category = entry.get('search', {}).get('category') or 'uncategorized'
+        raised, target = summary.get('raisedAmount', 0), summary.get('targetAmount', 0)
+        
+        for group, key in ((self.by_status, summary.get('status', '')), (self.by_category, category)):
+            bucket = group.setdefault(key, {"count": 0, "raised": 0, "target": 0})
+            bucket["count"] += sign
+            bucket["raised"] += sign * raised
+            bucket["target"] += sign * target
+            if bucket["count"] == 0:
+                del group[key]
+        
+        if summary.get('status') == 'ended' and target and raised >= target:
+            self.successful += sign
+        
+        days = self._completion_days(summary)
+        if days is not None and (sign > 0 or days in self.completion_days):
+            self.completion_days[days] = self.completion_days.get(days, 0) + sign
+            if self.completion_days[days] == 0:
+                del self.completion_days[days]
+    
+    def add(self, entry: Dict):
+        """Count a campaign (a build-state entry with a summary)."""
+        self._apply(entry, 1)
+    
+    def remove(self, entry: Dict):
+        """Undo add() for a campaign that changed or disappeared."""
+        self._apply(entry, -1)
+    
+    def _percentile(self, fraction: float) -> Optional[int]:
+        """Nearest-rank percentile of the completion times."""
+        total = sum(self.completion_days.values())
+        if not total:
+            return None
+        rank = min(max(1, math.ceil(fraction * total)), total)
+        seen = 0
+        for days, count in sorted(self.completion_days.items()):
+            seen += count
+            if seen >= rank:
+                return days
+    
+    def report(self) -> Dict:
+        """Build the _stats.json document."""
+        total = sum(bucket["count"] for bucket in self.by_status.values())
+        raised = sum(bucket["raised"] for bucket in self.by_status.values())
+        ended = self.by_status.get('ended', {}).get('count', 0)
+        finished = sum(self.completion_days.values())
+        total_days = sum(days * count for days, count in self.completion_days.items())
+        average_days = total_days / finished if finished else 0
+        
+        return {
+            "totalCampaigns": total,
+            "activeCampaigns": self.by_status.get('active', {}).get('count', 0),
+            "completedCampaigns": ended,
+            "totalAmountRaised": raised,
+            "livesImpacted": ended,
+            "averageCampaignAmount": round(raised / total) if total else 0,
+            "successRate": round(100 * self.successful / ended) if ended else 0,
+            # Months, as shown on the website
+            "averageCompletionTime": round(average_days / 30.44, 1),
+            "completionTimeDays": {
+                "mean": round(average_days, 1),
+                "p50": self._percentile(0.5),
+                "p90": self._percentile(0.9)
+            },
+            "byStatus": dict(sorted(self.by_status.items())),
+            "byCategory": dict(sorted(self.by_category.items()))
+        }
+
+
+def merge_stats(existing: Dict, derived: Dict, filled: Dict) -> Tuple[Dict, Dict]:
+    """Merge derived aggregates into the hand-maintained _stats.json.
+    
+    The CSV only holds the campaigns managed on the website, so figures such
+    as livesImpacted or totalAmountRaised are normally kept as entered by
+    hand. STATS_FROM_CSV fields always come from the data; any other field
+    is taken from the data when it is missing, or when it still holds the
+    value the converter filled in last time (`filled`). Returns the document
+    and the fields filled in by this run.
+    """
+    stats = dict(existing)
+    next_filled = {}
+    for key, value in derived.items():
+        if key in STATS_FROM_CSV:
+            stats[key] = value
+        elif key not in existing or (key in filled and filled[key] == existing[key]):
+            stats[key] = value
+            next_filled[key] = value
+    return stats, next_filled
+
+
+class BuildMetrics:
+    """Stage timers and counters for one conversion run.
+    
+    Stages time the calling thread and are exclusive: entering a nested stage
+    pauses the enclosing one, so stage times add up to the run time. Work
+    done by writer tasks is reported separately under `tasks`, summed over
+    all tasks; with a pool it overlaps the main thread's `write` stage, and
+    with workers=1 it is part of it.
+    """
+    
+    def __init__(self):
+        self.stages = {}
+        self.tasks = {}
+        self.counters = {"csvRows": 0, "campaignsProcessed": 0, "campaignsUnchanged": 0,
+                         "filesChanged": 0, "filesSkipped": 0, "filesRemoved": 0, "bytesWritten": 0}
+        self._stack = []
+        self._started = (time.perf_counter(), time.process_time())
+        self.started_at = datetime.now().isoformat() + "Z"
+    
+    @staticmethod
+    def _add(timers: Dict, name: str, wall: float, cpu: float, calls: int = 1):
+        timer = timers.setdefault(name, {"wallSeconds": 0.0, "cpuSeconds": 0.0, "calls": 0})
+        timer["wallSeconds"] += wall
+        timer["cpuSeconds"] += cpu
+        timer["calls"] += calls
+    
+    def _pause(self, calls: int = 0):
+        """Charge the running stage for the time since it (re)started."""
+        if self._stack:
+            frame = self._stack[-1]
+            now = (time.perf_counter(), time.thread_time())
+            self._add(self.stages, frame[0], now[0] - frame[1], now[1] - frame[2], calls)
+    
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        self._pause()
+        self._stack.append([name, time.perf_counter(), time.thread_time()])
+        try:
+            yield
+        finally:
+            self._pause(calls=1)
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1:] = [time.perf_counter(), time.thread_time()]
+    
+    def add_task(self, timings: Dict[str, Tuple[float, float]]):
+        for name, (wall, cpu) in timings.items():
+            self._add(self.tasks, name, wall, cpu)
+    
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def record_write(self, filepath: str, written: bool, size: Optional[int] = None):
+        """Count a file that was written, or skipped because it was unchanged."""
+        if not written:
+            self.count("filesSkipped")
+            return
+        self.count("filesChanged")
+        if size is None:
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                size = 0
+        self.count("bytesWritten", size)
+    
+    @staticmethod
+    def peak_rss() -> Dict[str, Optional[int]]:
+        """Peak resident set size of this process and its finished children, in bytes."""
+        if resource is None:
+            return {"self": None, "children": None}
+        # ru_maxrss is in KiB on Linux and in bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return {"self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+                "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale}
+    
+    def report(self) -> Dict:
+        rounded = lambda timers: {name: {"wallSeconds": round(timer["wallSeconds"], 6),
+                                         "cpuSeconds": round(timer["cpuSeconds"], 6),
+                                         "calls": timer["calls"]}
+                                  for name, timer in timers.items()}
+        return {
+            "wallSeconds": round(time.perf_counter() - self._started[0], 6),
+            "cpuSeconds": round(time.process_time() - self._started[1], 6),
+            "stages": rounded(self.stages),
+            "tasks": rounded(self.tasks),
+            "counters": dict(self.counters),
+            "peakRssBytes": self.peak_rss()
+        }
+    
+    def print_summary(self):
+        report = self.report()
+        print(f"\nRun metrics ({report['wallSeconds']:.2f}s wall, {report['cpuSeconds']:.2f}s CPU):")
+        for group in ("stages", "tasks"):
+            for name, timer in report[group].items():
+                print(f"  {name:<16} {timer['wallSeconds']:>9.3f}s wall {timer['cpuSeconds']:>9.3f}s CPU")
+        counters = report['counters']
+        print(f"  Files: {counters['filesChanged']} changed, {counters['filesSkipped']} unchanged, "
+              f"{counters['filesRemoved']} removed, {counters['bytesWritten'] / 2 ** 20:.1f} MiB written")
+        if report['peakRssBytes']['self']:
+            print(f"  Peak RSS: {report['peakRssBytes']['self'] / 2 ** 20:.1f} MiB")
+
+
+def _is_campaign_file(filename: str) -> bool:
+    """Check whether a file in a status directory holds a single campaign."""
+    return (filename.endswith('.json') and filename != 'manifest.json' and
+            not filename.startswith('.') and not _is_bundle_file(filename) and
+            re.match(r'^page-\d+\.json$', filename) is None)
+
+
+def _snapshot_line(campaign: Dict) -> bytes:
+    """Encode a campaign as one line of the snapshot."""
+    return json.dumps(campaign, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def read_snapshot_index(index_path: str) -> Dict:
+    """Read a snapshot index, returning {} if it is missing, invalid or outdated."""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except Exception:
+        return {}
+    if index.get('version') != SNAPSHOT_VERSION:
+        return {}
+    return index
+
+
+def diff_snapshots(old_index: Dict, new_index: Dict) -> Dict[str, List[str]]:
+    """Compare two snapshot indexes by content hash, without reading the snapshots."""
+    old = {campaign_id: entry[5] for campaign_id, entry in old_index.get('campaigns', {}).items()}
+    new = {campaign_id: entry[5] for campaign_id, entry in new_index.get('campaigns', {}).items()}
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "changed": sorted(campaign_id for campaign_id in old.keys() & new.keys()
+                          if old[campaign_id] != new[campaign_id])
+    }
+
+
+class CampaignSnapshot(Mapping):
+    """Read-only view of the existing campaign JSON files keyed by id.
+    
+    Each run leaves a snapshot of every campaign file: ``_snapshot.jsonl``
+    holds one compact JSON line per campaign, and ``_snapshot.index.json``
+    maps ids to ``[offset, length, path, size, mtime_ns, hash]``. Opening only
+    reads the index and lists the campaign directories. A lookup stats the
+    campaign file and, if it still has the size and mtime recorded in the
+    index, parses just its line from the memory-mapped snapshot; files that
+    are new or were edited since are read from disk, so hand edits are never
+    missed. Nothing is cached, so memory does not grow with the number of
+    campaigns. Files are indexed by name, which is how the converter writes
+    them (``<id>.json``). Files are parsed with `load(path)`.
+    """
+    
+    def __init__(self, directories: List[str], snapshot_path: str, index_path: str,
+                 load: Callable[[str], Dict] = _load_json_file):
+        self._load = load
+        self._paths = {}
+        for directory in directories:
+            if not os.path.exists(directory):
+                continue
+            for filename in os.listdir(directory):
+                if _is_campaign_file(filename):
+                    self._paths.setdefault(filename[:-len('.json')], os.path.join(directory, filename))
+        
+        # The previous index is kept for diffs even if the snapshot is unusable
+        self.previous_index = read_snapshot_index(index_path)
+        self.index = {}
+        self.hits = 0
+        self.misses = 0
+        self._map = None
+        if not self.previous_index:
+            return
+        try:
+            with open(snapshot_path, 'rb') as f:
+                # The header line ties the snapshot to its index
+                header = json.loads(f.readline().decode('utf-8'))
+                if (header.get('generation') == self.previous_index.get('generation') and
+                        os.fstat(f.fileno()).st_size == self.previous_index.get('size')):
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.index = self.previous_index.get('campaigns', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring snapshot {snapshot_path}: {e}")
+    
+    def _snapshot_entry(self, campaign_id: str) -> Optional[List]:
+        """Return the index entry if the campaign file is unchanged since the snapshot."""
+        entry = self.index.get(campaign_id)
+        if entry is None or entry[2] != self._paths.get(campaign_id):
+            return None
+        try:
+            stat = os.stat(entry[2])
+        except OSError:
+            return None
+        if stat.st_size != entry[3] or stat.st_mtime_ns != entry[4]:
+            return None
+        return entry
+    
+    def _read_file(self, campaign_id: str) -> Dict:
+        filepath = self._paths[campaign_id]
+        try:
+            campaign_data = self._load(filepath)
+        except Exception as e:
+            print(f"Warning: Could not load {filepath}: {e}")
+            raise KeyError(campaign_id)
+        if campaign_data.get('id') != campaign_id:
+            raise KeyError(campaign_id)
+        return campaign_data
+    
+    def path(self, campaign_id: str) -> str:
+        return self._paths[campaign_id]
+    
+    def is_current(self) -> bool:
+        """Check whether the snapshot still matches every campaign file."""
+        return (self._map is not None and self.index.keys() == self._paths.keys() and
+                all(self._snapshot_entry(campaign_id) for campaign_id in self.index))
+    
+    def line(self, campaign_id: str) -> Tuple[bytes, int, int]:
+        """Return (snapshot line, file size, file mtime_ns) for a campaign."""
+        entry = self._snapshot_entry(campaign_id)
+        if entry is not None:
+            self.hits += 1
+            return self._map[entry[0]:entry[0] + entry[1]], entry[3], entry[4]
+        stat = os.stat(self._paths[campaign_id])
+        self.misses += 1
+        return _snapshot_line(self._read_file(campaign_id)), stat.st_size, stat.st_mtime_ns
+    
+    def __getitem__(self, campaign_id: str) -> Dict:
+        entry = self._snapshot_entry(campaign_id)
+        if entry is not None:
+            self.hits += 1
+            return json.loads(self._map[entry[0]:entry[0] + entry[1]])
+        self.misses += 1
+        return self._read_file(campaign_id)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+    
+    def __len__(self) -> int:
+        return len(self._paths)
+    
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class CampaignRecords(Mapping):
+    """Per-campaign JSON records of the current run, spilled to a temp database.
+    
+    Records live in a hidden SQLite file in `directory` (created on first
+    use, removed by close(), or by _create_directories of the next run if
+    this one dies) whose page cache is capped at SPILL_CACHE_KIB, so a run
+    keeps neither the records nor their ids in memory, whatever the number
+    of campaigns. Iteration is in id order; a lookup reads one record.
+    Build-state entries are also listed by status: ids() in file name order
+    for manifests, newest() by completion date for pages.
+    """
+    
+    def __init__(self, directory: str, prefix: str):
+        self._directory = directory
+        self._prefix = prefix
+        self._db = None
+        self._path = None
+    
+    def _execute(self, sql: str, parameters: Tuple = ()):
+        if self._db is None:
+            return iter(())
+        return self._db.execute(sql, parameters)
+    
+    def __setitem__(self, campaign_id: str, record: Any):
+        if self._db is None:
+            self._db, self._path = _open_spill_database(self._directory, self._prefix)
+            self._db.execute("CREATE TABLE records (id TEXT PRIMARY KEY, status TEXT, "
+                             "completed TEXT, record TEXT NOT NULL)")
+        status = completed = None
+        if isinstance(record, dict) and 'summary' in record:
+            status, completed = record.get('status'), record['summary'].get('completedDate', '')
+        self._db.execute("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                         (campaign_id, status, completed,
+                          json.dumps(record, ensure_ascii=False, separators=(',', ':'))))
+    
+    def __getitem__(self, campaign_id: str) -> Any:
+        for (record,) in self._execute("SELECT record FROM records WHERE id = ?", (campaign_id,)):
+            return json.loads(record)
+        raise KeyError(campaign_id)
+    
+    def __contains__(self, campaign_id) -> bool:
+        return any(self._execute("SELECT 1 FROM records WHERE id = ?", (campaign_id,)))
+    
+    def __iter__(self) -> Iterator[str]:
+        for (campaign_id,) in self._execute("SELECT id FROM records ORDER BY id"):
+            yield campaign_id
+    
+    def __len__(self) -> int:
+        for (count,) in self._execute("SELECT COUNT(*) FROM records"):
+            return count
+        return 0
+    
+    def ids(self, status: str) -> Iterator[str]:
+        """Ids of the entries with `status`, in the order of their ``<id>.json`` file names."""
+        for (campaign_id,) in self._execute("SELECT id FROM records WHERE status = ? "
+                                            "ORDER BY id || '.json'", (status,)):
+            yield campaign_id
+    
+    def newest(self, status: str) -> Iterator[Any]:
+        """Entries with `status`, latest completion date first and ties in id order."""
+        for (record,) in self._execute("SELECT record FROM records WHERE status = ? "
+                                       "ORDER BY completed DESC, id", (status,)):
+            yield json.loads(record)
+    
+    def count(self, status: str) -> int:
+        for (count,) in self._execute("SELECT COUNT(*) FROM records WHERE status = ?", (status,)):
+            return count
+        return 0
+    
+    def close(self):
+        """Remove the temp database and forget every record."""
+        if self._db is not None:
+            self._db.close()
+            os.remove(self._path)
+            self._db = None
 
 
 class CampaignConverter:
     """Converts CSV campaign data to JSON files organized by status."""
     
-    def __init__(self, csv_file: str = "master_campaign_details.csv"):
-        self.csv_file = csv_file
+    def __init__(self, csv_file: Union[str, List[str]] = "master_campaign_details.csv",
+                 incremental: bool = False, state_file: Optional[str] = None,
+                 streaming: bool = False, workers: int = 1, executor: str = "thread",
+                 page_size: int = DEFAULT_PAGE_SIZE, writer_pool=None,
+                 asset_images: Optional[Dict[str, Dict]] = None, verbose: bool = True,
+                 load_json: Callable[[str], Dict] = _load_json_file):
+        # One CSV, or several (file names or glob patterns) merged into one campaign set
+        inputs = [csv_file] if isinstance(csv_file, str) else list(csv_file)
+        self.csv_files = expand_csv_inputs(inputs)
+        self.csv_file = ", ".join(inputs)
         self.campaigns_dir = "campaigns"
         self.active_dir = os.path.join(self.campaigns_dir, "active")
-        self.ended_dir = os.path.join(self.campaigns_dir, "ended")
+        self.ended_dir = os.path.join(self.campaigns_dir, "completed")
         self.archived_dir = os.path.join(self.campaigns_dir, "archived")
         
-        # Store existing campaign data
+        # Incremental mode only reprocesses campaigns whose CSV rows changed
+        self.incremental = incremental
+        self.state_file = state_file or os.path.join(self.campaigns_dir, STATE_FILENAME)
+        
+        # Streaming mode processes one campaign group at a time (CSV grouped by title)
+        self.streaming = streaming
+        
+        # Writer pool: "thread" overlaps file I/O, "process" also parallelizes serialization
+        self.workers = max(1, workers)
+        self.executor = executor
+        # A pool shared with other content builds (see content_pipeline.py)
+        self.writer_pool = writer_pool
+        self._pending_writes = []
+        self._stale_files = []
+        self._changed_dirs = set()
+        self._bundled_dirs = {}
+        self.write_counts = {"active": 0, "ended": 0, "archived": 0}
+        
+        # Completed campaigns are also listed in pages of summary records
+        self.page_size = max(1, page_size)
+        
+        # Existing campaign data, read through the snapshot of the last run
+        self.snapshot_path = os.path.join(self.campaigns_dir, SNAPSHOT_FILENAME)
+        self.snapshot_index_path = os.path.join(self.campaigns_dir, SNAPSHOT_INDEX_FILENAME)
         self.existing_campaigns = {}
+        # Reads edited or new campaign files; may return shared (cached) data
+        self.load_json = load_json
+        self._snapshot_file = None
+        self._snapshot_tmp = None
+        self._snapshot_generation = None
+        self._snapshot_entries = CampaignRecords(self.campaigns_dir, ".snapshot-index.")
+        
+        # Per-campaign hashes from the previous run and the one being built; entries
+        # move to next_state (on disk) once their file is written
+        self.state = {}
+        self._new_entries = {}
+        self.next_state = CampaignRecords(self.campaigns_dir, ".state.")
+        self.state_stats = None
+        self.state_stats_filled = {}
+        self.stats = None
+        self.stats_filled = {}
+        self.unchanged_count = 0
         
-        # Ensure directories exist
-        self._create_directories()
+        # Stage timers and counters; verbose=False drops the per-file lines
+        self.metrics = BuildMetrics()
+        self.verbose = verbose
         
-        # Load existing campaigns
-        self._load_existing_campaigns()
+        with self.metrics.stage("loadExisting"):
+            # Ensure directories exist
+            self._create_directories()
+            
+            # Load existing campaigns
+            self._load_existing_campaigns()
+            
+            # Load build state from the previous run
+            self._load_state()
+            
+            # Optimized image variants, if optimize_assets.py has been run
+            self.asset_images = asset_images if asset_images is not None else load_asset_images()
+    
+    def _log(self, message: str):
+        """Print per-file progress unless running quietly."""
+        if self.verbose:
+            print(message)
     
     def _create_directories(self):
         """Create necessary directories if they don't exist."""
         for directory in [self.campaigns_dir, self.active_dir, self.ended_dir, self.archived_dir]:
             os.makedirs(directory, exist_ok=True)
+            
+            # Drop temp files left behind by an interrupted run
+            for filename in os.listdir(directory):
+                if filename.startswith('.') and filename.endswith('.tmp'):
+                    os.remove(os.path.join(directory, filename))
     
     def _load_existing_campaigns(self):
-        """Load existing campaign JSON files to preserve existing data."""
-        for directory in [self.active_dir, self.ended_dir, self.archived_dir]:
-            if os.path.exists(directory):
-                for filename in os.listdir(directory):
-                    if filename.endswith('.json') and filename != 'manifest.json':
-                        filepath = os.path.join(directory, filename)
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                campaign_data = json.load(f)
-                                campaign_id = campaign_data.get('id')
-                                if campaign_id:
-                                    self.existing_campaigns[campaign_id] = campaign_data
-                                    print(f"Loaded existing campaign: {campaign_data.get('title', campaign_id)}")
-                        except Exception as e:
-                            print(f"Warning: Could not load {filepath}: {e}")
-        
-        print(f"Loaded {len(self.existing_campaigns)} existing campaigns")
+        """Index existing campaign JSON files to preserve existing data.
+        
+        Campaigns are parsed on lookup, from the snapshot where their file is
+        unchanged, so startup does not open every file.
+        """
+        self.existing_campaigns = CampaignSnapshot(
+            [self.active_dir, self.ended_dir, self.archived_dir],
+            self.snapshot_path, self.snapshot_index_path, load=self.load_json)
+        source = "snapshot" if self.existing_campaigns.index else "campaign files"
+        print(f"Indexed {len(self.existing_campaigns)} existing campaigns ({source})")
+    
+    def _load_state(self):
+        """Load per-campaign row and output hashes recorded by the previous run."""
+        if not os.path.exists(self.state_file):
+            return
+        
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load {self.state_file}: {e}")
+            return
+        
+        # State written by an older mapping is useless, reprocess everything
+        if state.get('version') != STATE_VERSION:
+            print(f"Build state version changed, reprocessing all campaigns")
+            return
+        
+        self.state = state.get('campaigns', {})
+        self.state_stats = state.get('stats')
+        self.state_stats_filled = state.get('statsFilled', {})
+    
+    def _save_state(self):
+        """Persist the hashes of this run for the next incremental run.
+        
+        The campaign entries are streamed from next_state, one per line.
+        """
+        header = {"version": STATE_VERSION}
+        if self.stats is not None:
+            header["stats"] = self.stats.to_dict()
+            header["statsFilled"] = self.stats_filled
+        try:
+            self._write_chunks_if_changed(self.state_file,
+                                          _json_object_chunks(header, "campaigns", self.next_state.items()))
+        except Exception as e:
+            print(f"Error writing build state {self.state_file}: {e}")
+    
+    def _hash_content(self, content: str) -> str:
+        """Hash serialized output content."""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _is_unchanged(self, campaign_id: str, row_hash: str) -> bool:
+        """Check whether a campaign's rows and output file match the last run."""
+        entry = self.state.get(campaign_id)
+        if not entry or entry.get('rowHash') != row_hash:
+            return False
+        
+        # Reprocess when the optimized variants of the campaign image changed
+        summary = entry.get('summary', {})
+        if summary.get('imageVariants') != image_variants(self.asset_images, summary.get('image', '')):
+            return False
+        
+        path = entry.get('path', '')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        
+        # Cheap check first; fall back to hashing if the file was touched
+        if stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime'):
+            return True
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if self._hash_content(f.read()) != entry.get('outputHash'):
+                    return False
+        except (OSError, UnicodeDecodeError):
+            return False
+        
+        entry['size'] = stat.st_size
+        entry['mtime'] = stat.st_mtime_ns
+        return True
+    
+    def _write_if_changed(self, filepath: str, content: str) -> bool:
+        """Write content to filepath unless the file already holds the same bytes."""
+        data = content.encode('utf-8')
+        try:
+            with open(filepath, 'rb') as f:
+                if f.read() == data:
+                    self.metrics.record_write(filepath, False)
+                    return False
+        except FileNotFoundError:
+            pass
+        
+        _atomic_write(filepath, data)
+        self.metrics.record_write(filepath, True, len(data))
+        return True
+    
+    def _write_chunks_if_changed(self, filepath: str, chunks: Iterable[str]) -> bool:
+        """Like _write_if_changed, for content too large to build as one string."""
+        written, size = _atomic_write_chunks(filepath, _encode_chunks(chunks), only_if_changed=True)
+        self.metrics.record_write(filepath, written, size)
+        return written
     
     def _slugify(self, text: str) -> str:
         """Convert text to URL-friendly slug."""
@@ -116,20 +1521,48 @@ class CampaignConverter:
         """Create a unique campaign ID from title."""
         return self._slugify(title)
     
-    def _parse_timeline_events(self, rows: List[Dict]) -> List[Dict]:
-        """Parse timeline events for a campaign from multiple CSV rows."""
-        timeline = []
-        for row in rows:
-            if row.get('date') and row.get('event'):
-                timeline.append({
-                    "date": row['date'],
-                    "event": row['event'],
-                    "description": row.get('description', '')
-                })
-        return sorted(timeline, key=lambda x: x['date'])
+    def _timeline_keys(self, campaign_id: str, timeline: List[Dict]) -> Optional[TimelineKeys]:
+        """Dedupe keys of an existing timeline, if it is the one this converter wrote.
+        
+        The build state records the keys of every timeline written (always in
+        date order); they hold while the file's size and mtime are unchanged.
+        """
+        entry = self.state.get(campaign_id, {})
+        packed = entry.get('timelineKeys')
+        if packed is None or len(packed) != len(timeline) * TIMELINE_KEY_WIDTH:
+            return None
+        try:
+            stat = os.stat(entry.get('path', ''))
+        except OSError:
+            return None
+        if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime'):
+            return None
+        return TimelineKeys(packed)
     
-    def _create_campaign_json(self, campaign_data: Dict) -> Dict:
-        """Create the campaign JSON structure, merging with existing data."""
+    def _new_csv_events(self, campaign_id: str, events: List[Dict]) -> List[Dict]:
+        """CSV timeline events not merged into the campaign by the last run.
+        
+        The build state records how many CSV events were merged and the keys
+        of the first and last; when those still match, only the events after
+        them are new. Events edited in the middle of a campaign's rows are
+        picked up by a full run.
+        """
+        recorded = self.state.get(campaign_id, {}).get('csvEvents')
+        if not recorded:
+            return events
+        count, head, tail = recorded
+        if (len(events) < count or timeline_key(events[0]) != head
+                or timeline_key(events[count - 1]) != tail):
+            return events
+        return events[count:]
+    
+    def _create_campaign_json(self, campaign_data: Dict) -> Tuple[Dict, str]:
+        """Create the campaign JSON structure, merging with existing data.
+        
+        Returns the campaign and the packed dedupe keys of its timeline.
+        Incremental runs only merge the CSV events added since the last run
+        into a timeline the build state has the keys of.
+        """
         campaign_id = self._create_campaign_id(campaign_data['title'])
         
         # Start with existing campaign data if available
@@ -145,8 +1578,8 @@ class CampaignConverter:
         if not csv_status and existing.get('status'):
             status = existing['status']
         
-        # Create patient details (merge CSV with existing)
-        patient_details = existing.get('patientDetails', {})
+        # Create patient details (merge CSV with existing; existing data may be shared)
+        patient_details = dict(existing.get('patientDetails', {}))
         if campaign_data.get('name'):
             csv_patient = {
                 "name": campaign_data.get('name', ''),
@@ -161,18 +1594,16 @@ class CampaignConverter:
                 if value or key not in patient_details:
                     patient_details[key] = value
         
-        # Merge timeline (combine CSV timeline with existing)
-        timeline = existing.get('timeline', [])
-        if campaign_data.get('timeline'):
-            csv_timeline = campaign_data['timeline']
-            # Add CSV timeline events that don't already exist
-            existing_events = {(t.get('date'), t.get('event')) for t in timeline}
-            for csv_event in csv_timeline:
-                event_key = (csv_event.get('date'), csv_event.get('event'))
-                if event_key not in existing_events:
-                    timeline.append(csv_event)
-            # Sort timeline by date
-            timeline = sorted(timeline, key=lambda x: x.get('date', ''))
+        # Merge timeline (add new CSV events to the date-ordered existing one)
+        timeline = list(existing.get('timeline', []))
+        new_events = campaign_data.get('timeline') or []
+        timeline_keys = self._timeline_keys(campaign_id, timeline)
+        if timeline_keys is None:
+            timeline_keys = index_timeline(timeline)
+        elif self.incremental:
+            new_events = self._new_csv_events(campaign_id, new_events)
+        if new_events:
+            timeline = merge_timeline(timeline, new_events, timeline_keys)
         
         # Create campaign JSON (prefer existing values, update with CSV)
         campaign_json = {
@@ -189,6 +1620,11 @@ class CampaignConverter:
             "category": campaign_data.get('category', '').lower() or existing.get('category', 'medical')
         }
         
+        # Point at responsive variants of the image if available
+        variants = image_variants(self.asset_images, campaign_json['image'])
+        if variants:
+            campaign_json["imageVariants"] = variants
+        
         # Add patient details if available
         if patient_details and patient_details.get('name'):
             campaign_json["patientDetails"] = patient_details
@@ -207,7 +1643,7 @@ class CampaignConverter:
         
         # Add tags from CSV data
         if campaign_data.get('condition'):
-            csv_tags.update(campaign_data['condition'].lower().split())
+            csv_tags.update(condition_tags(campaign_data['condition']))
         if campaign_data.get('category'):
             csv_tags.add(campaign_data['category'].lower())
         if patient_details.get('age'):
@@ -222,67 +1658,91 @@ class CampaignConverter:
         all_tags = existing_tags.union(csv_tags)
         campaign_json["tags"] = sorted(list(all_tags))
         
+        return campaign_json, timeline_keys.pack()
+    
+    def process_group(self, group: Dict) -> Optional[Dict]:
+        """Build the campaign JSON for one campaign group (see CampaignSource.campaign_group).
+        
+        Returns None when incremental mode finds the group unchanged.
+        """
+        title = group['title']
+        campaign_id = self._create_campaign_id(title)
+        row_hash = group['rowHash']
+        
+        # Skip groups whose rows and output are unchanged since last run
+        if self.incremental and self._is_unchanged(campaign_id, row_hash):
+            self.next_state[campaign_id] = self.state[campaign_id]
+            self.unchanged_count += 1
+            self.metrics.count("campaignsUnchanged")
+            return None
+        
+        # Create campaign JSON
+        with self.metrics.stage("merge"):
+            campaign_json, timeline_keys = self._create_campaign_json(group['data'])
+        entry = {"rowHash": row_hash, "timelineKeys": timeline_keys}
+        events = group['data'].get('timeline')
+        if events:
+            entry["csvEvents"] = [len(events), timeline_key(events[0]), timeline_key(events[-1])]
+        self._new_entries[campaign_json['id']] = entry
+        self.metrics.count("campaignsProcessed")
+        
+        self._log(f"Processed campaign: {title} -> {campaign_json['status']}")
         return campaign_json
     
+    def _missing_inputs(self) -> List[str]:
+        """Report input files that do not exist; returns them."""
+        if not self.csv_files:
+            print("Error: no CSV files given!")
+            return [self.csv_file]
+        missing = [path for path in self.csv_files if not os.path.exists(path)]
+        for path in missing:
+            print(f"Error: {path} not found!")
+        return missing
+    
+    def read_campaign_groups(self) -> List[Dict]:
+        """Read every input CSV and merge the campaign groups by id.
+        
+        Several files are read in parallel by a process pool of up to
+        `workers` processes. A campaign found in more than one group (other
+        files, or titles that differ only in case or punctuation) is merged
+        with merge_campaign_groups.
+        """
+        if len(self.csv_files) > 1 and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(self.csv_files))) as pool:
+                results = list(pool.map(read_campaign_source, self.csv_files))
+        else:
+            results = [read_campaign_source(path) for path in self.csv_files]
+        
+        by_id = {}
+        for file_index, (groups, row_count) in enumerate(results):
+            self.metrics.count("csvRows", row_count)
+            for group_index, group in enumerate(groups):
+                group["order"] = (file_index, group_index)
+                by_id.setdefault(self._create_campaign_id(group['title']), []).append(group)
+        
+        merged = []
+        for campaign_id, groups in by_id.items():
+            if len(groups) > 1:
+                sources = sorted({self.csv_files[group['order'][0]] for group in groups})
+                self._log(f"Merged {len(groups)} groups of {campaign_id} from {', '.join(sources)}")
+            merged.append(merge_campaign_groups(groups))
+        return merged
+    
     def parse_csv(self) -> Dict[str, List[Dict]]:
-        """Parse the CSV file and return campaigns organized by status."""
+        """Parse the CSV file(s) and return campaigns organized by status."""
         campaigns = {"active": [], "ended": [], "archived": []}
         
-        if not os.path.exists(self.csv_file):
-            print(f"Error: {self.csv_file} not found!")
+        if self._missing_inputs():
             return campaigns
         
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                # Group rows by campaign title
-                campaign_groups = {}
-                for row in reader:
-                    title = row.get('title', '').strip()
-                    if not title:
-                        continue
-                    
-                    if title not in campaign_groups:
-                        campaign_groups[title] = []
-                    campaign_groups[title].append(row)
+            # Process each campaign group
+            for group in self.read_campaign_groups():
+                campaign_json = self.process_group(group)
                 
-                # Process each campaign group
-                for title, rows in campaign_groups.items():
-                    # Use the first row as the main campaign data
-                    main_row = rows[0]
-                    
-                    # Parse timeline from all rows
-                    timeline = self._parse_timeline_events(rows)
-                    
-                    # Create campaign data
-                    campaign_data = {
-                        'title': title,
-                        'shortDescription': main_row.get('shortDescription', ''),
-                        'fullDescription': main_row.get('fullDescription', ''),
-                        'image': main_row.get('image (link to images if any)', ''),
-                        'targetAmount': main_row.get('targetAmount', '0'),
-                        'raisedAmount': main_row.get('raisedAmount', '0'),
-                        'status': main_row.get('status', ''),
-                        'urgency': main_row.get('urgency', ''),
-                        'category': main_row.get('category', 'medical'),
-                        'name': main_row.get('name', ''),
-                        'age': main_row.get('age', ''),
-                        'location': main_row.get('location', ''),
-                        'condition': main_row.get('condition', ''),
-                        'hospital': main_row.get('hospital', ''),
-                        'doctor': main_row.get('doctor', ''),
-                        'timeline': timeline
-                    }
-                    
-                    # Create campaign JSON
-                    campaign_json = self._create_campaign_json(campaign_data)
-                    
-                    # Add to appropriate status group
-                    status = campaign_json['status']
-                    campaigns[status].append(campaign_json)
-                    
-                    print(f"Processed campaign: {title} -> {status}")
+                # Add to appropriate status group
+                if campaign_json:
+                    campaigns[campaign_json['status']].append(campaign_json)
         
         except Exception as e:
             print(f"Error parsing CSV: {e}")
@@ -290,94 +1750,673 @@ class CampaignConverter:
         
         return campaigns
     
+    def iter_campaign_groups(self) -> Iterator[Dict]:
+        """Yield each campaign group while reading the CSV files one after another.
+        
+        Rows of a campaign must be contiguous (e.g. the export is sorted by
+        title) and in a single file; only the current group is held in memory.
+        """
+        # Ids seen so far are kept on disk too (see CampaignRecords)
+        seen_ids = CampaignRecords(self.campaigns_dir, ".seen.")
+        try:
+            for path in self.csv_files:
+                source = CampaignSource(path)
+                try:
+                    for title, rows in source.iter_groups():
+                        campaign_id = self._create_campaign_id(title)
+                        if campaign_id in seen_ids:
+                            raise ValueError(f"Rows for '{title}' are not contiguous or are in more than "
+                                             f"one file; sort {path} by title or run without --stream")
+                        seen_ids[campaign_id] = None
+                        yield source.campaign_group(title, rows)
+                finally:
+                    self.metrics.count("csvRows", source.row_count)
+        finally:
+            seen_ids.close()
+    
+    def campaign_groups(self) -> Iterator[Dict]:
+        """Yield the campaign groups of the input files, one at a time when streaming.
+        
+        Yields nothing (after reporting them) if input files are missing.
+        """
+        if self._missing_inputs():
+            return
+        if self.streaming:
+            yield from self.iter_campaign_groups()
+        else:
+            yield from self.read_campaign_groups()
+    
+    def write_campaigns(self, campaigns: Iterable[Optional[Dict]]):
+        """Write campaigns on the writer pool as they are produced.
+        
+        None entries (unchanged campaigns, see process_group) are skipped.
+        Every queued write is waited for, even if producing the campaigns
+        fails.
+        """
+        with self._create_writer_pool() as pool:
+            try:
+                for campaign_json in campaigns:
+                    if campaign_json:
+                        with self.metrics.stage("write"):
+                            self._write_campaign(campaign_json, pool)
+            finally:
+                with self.metrics.stage("write"):
+                    self._finish_writes()
+    
+    def stream_csv(self) -> Dict[str, int]:
+        """Convert and write campaigns one group at a time.
+        
+        Returns the number of campaigns written per status.
+        """
+        if self._missing_inputs():
+            return self.write_counts
+        
+        try:
+            self.write_campaigns(self.process_group(group) for group in self.iter_campaign_groups())
+        except Exception as e:
+            print(f"Error parsing CSV: {e}")
+        
+        return self.write_counts
+    
+    def _status_directory(self, status: str) -> str:
+        """Return the output directory for a campaign status."""
+        if status == "active":
+            return self.active_dir
+        elif status == "ended":
+            return self.ended_dir
+        else:
+            return self.archived_dir
+    
+    def _create_writer_pool(self):
+        """Create the executor used to serialize and write campaign files."""
+        if self.writer_pool is not None:
+            return _SharedExecutor(self.writer_pool)
+        if self.workers <= 1:
+            return _InlineExecutor()
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers)
+    
     def write_json_files(self, campaigns: Dict[str, List[Dict]]):
-        """Write campaign JSON files to appropriate directories."""
+        """Write campaign JSON files to appropriate directories.
+        
+        Campaign files are written first (atomically, in parallel when
+        workers > 1); manifests are only committed once every campaign file
+        is in place, and files of campaigns that changed status are removed
+        last.
+        """
+        with self.metrics.stage("write"), self._create_writer_pool() as pool:
+            try:
+                for status, campaign_list in campaigns.items():
+                    # Write individual campaign files
+                    for campaign in campaign_list:
+                        self._write_campaign(campaign, pool)
+            finally:
+                self._finish_writes()
+        
+        # Create manifest files
+        self.write_manifests()
+    
+    def _campaign_summary(self, campaign: Dict) -> Dict:
+        """Build the lightweight record used in listing pages."""
+        timeline = campaign.get('timeline') or []
+        summary = {
+            "id": campaign['id'],
+            "title": campaign['title'],
+            "shortDescription": campaign.get('shortDescription', ''),
+            "image": campaign.get('image', ''),
+            "imageVariants": campaign.get('imageVariants'),
+            "targetAmount": campaign.get('targetAmount', 0),
+            "raisedAmount": campaign.get('raisedAmount', 0),
+            "currency": campaign.get('currency', 'INR'),
+            "status": campaign['status'],
+            "urgency": campaign.get('urgency', 'medium'),
+            "tags": campaign.get('tags', []),
+            "lastUpdated": campaign.get('lastUpdated', ''),
+            # Earliest known date, used for completion times
+            "startDate": min([t.get('date', '') for t in timeline if t.get('date')] +
+                             [campaign.get('createdDate', '')]),
+            # The last timeline event marks completion; fall back to the update date
+            "completedDate": max((t.get('date', '') for t in timeline), default='') or campaign.get('lastUpdated', '')
+        }
+        patient = campaign.get('patientDetails') or {}
+        if patient.get('age') or patient.get('condition'):
+            summary["patientDetails"] = {"age": patient.get('age', ''), "condition": patient.get('condition', '')}
+        return summary
+    
+    def _search_fields(self, campaign: Dict) -> Dict:
+        """Collect the facet values indexed for search besides the summary."""
+        patient = campaign.get('patientDetails') or {}
+        return {
+            "category": campaign.get('category', ''),
+            "location": patient.get('location', ''),
+            "hospital": patient.get('hospital', '')
+        }
+    
+    def _write_campaign(self, campaign: Dict, pool):
+        """Queue one campaign file on the writer pool."""
+        entry = self._new_entries.pop(campaign['id'], {})
+        entry["summary"] = self._campaign_summary(campaign)
+        entry["search"] = self._search_fields(campaign)
+        target_dir = self._status_directory(campaign['status'])
+        filepath = os.path.join(target_dir, f"{campaign['id']}.json")
+        future = pool.submit(_write_campaign_file, filepath, campaign, self.incremental)
+        self._pending_writes.append((campaign['id'], entry, campaign['status'], filepath,
+                                     _snapshot_line(campaign), future))
         
-        for status, campaign_list in campaigns.items():
-            if not campaign_list:
+        # Bound the number of queued campaigns (and the rows they hold)
+        if len(self._pending_writes) >= 2 * self.workers:
+            self._finish_writes(keep=self.workers)
+    
+    def _finish_writes(self, keep: int = 0):
+        """Wait for queued writes (oldest first) until at most `keep` remain."""
+        while len(self._pending_writes) > keep:
+            campaign_id, entry, status, filepath, line, future = self._pending_writes.pop(0)
+            try:
+                written, output_hash, size, mtime, timings = future.result()
+            except Exception as e:
+                print(f"Error writing {filepath}: {e}")
+                # Keep pointing at the previous (complete) file if there is one
+                previous = self.state.get(campaign_id)
+                if previous and os.path.exists(previous.get('path', '')):
+                    self.next_state[campaign_id] = previous
                 continue
             
-            # Determine target directory
-            if status == "active":
-                target_dir = self.active_dir
-            elif status == "ended":
-                target_dir = self.ended_dir
-            else:
-                target_dir = self.archived_dir
+            self.metrics.add_task(timings)
+            self.metrics.record_write(filepath, written, size)
+            if written:
+                self._log(f"{'Updated' if self.incremental else 'Created'}: {filepath}")
+                self._changed_dirs.add(os.path.dirname(filepath))
+            self.write_counts[status] += 1
+            self._record_output(campaign_id, entry, status, filepath, output_hash, size, mtime)
+            self._add_to_snapshot(campaign_id, line, filepath, size, mtime)
+    
+    def _record_output(self, campaign_id: str, entry: Dict, status: str, filepath: str,
+                       output_hash: str, size: int, mtime: int):
+        """Complete a campaign's build-state entry with its written file, noting a moved file."""
+        previous = self.state.get(campaign_id, {}).get('path')
+        if previous and previous != filepath:
+            # Status changed since the last run, the old copy is stale
+            self._stale_files.append(previous)
+            self._changed_dirs.add(os.path.dirname(previous))
+        
+        entry.update({
+            "path": filepath,
+            "status": status,
+            "outputHash": output_hash,
+            "size": size,
+            "mtime": mtime
+        })
+        self.next_state[campaign_id] = entry
+    
+    def _add_to_snapshot(self, campaign_id: str, line: bytes, filepath: str, size: int, mtime: int):
+        """Append a campaign line to the snapshot being built."""
+        if self._snapshot_file is None:
+            fd, self._snapshot_tmp = tempfile.mkstemp(dir=self.campaigns_dir, prefix=".snapshot.",
+                                                      suffix='.tmp')
+            os.fchmod(fd, 0o666 & ~_UMASK)
+            self._snapshot_file = os.fdopen(fd, 'wb')
+            self._snapshot_generation = os.urandom(8).hex()
+            self._snapshot_file.write(json.dumps({"version": SNAPSHOT_VERSION,
+                                                  "generation": self._snapshot_generation}).encode('utf-8') + b'\n')
+        offset = self._snapshot_file.tell()
+        self._snapshot_file.write(line)
+        self._snapshot_entries[campaign_id] = [offset, len(line), filepath, size, mtime,
+                                               hashlib.sha256(line).hexdigest()[:16]]
+    
+    def write_snapshot(self):
+        """Write the snapshot of every campaign file and report what changed.
+        
+        Campaigns written in this run are already in it; the others (unchanged,
+        or no longer in the CSV) are copied from the previous snapshot, or read
+        from their file if it was edited.
+        """
+        existing = self.existing_campaigns
+        if self._snapshot_file is None and existing.is_current():
+            # Nothing was written and no file was touched (a no-op incremental run)
+            existing.close()
+            return
+        
+        for campaign_id in existing:
+            if campaign_id in self._snapshot_entries or not os.path.exists(existing.path(campaign_id)):
+                continue
+            try:
+                line, size, mtime = existing.line(campaign_id)
+            except (KeyError, OSError):
+                continue
+            self._add_to_snapshot(campaign_id, line, existing.path(campaign_id), size, mtime)
+        if self._snapshot_file is None:
+            existing.close()
+            return
+        
+        try:
+            self._snapshot_file.flush()
+            os.fsync(self._snapshot_file.fileno())
+            size = self._snapshot_file.tell()
+            self._snapshot_file.close()
+            os.replace(self._snapshot_tmp, self.snapshot_path)
+            header = {"version": SNAPSHOT_VERSION, "generation": self._snapshot_generation, "size": size}
+            self._write_chunks_if_changed(self.snapshot_index_path,
+                                          _json_object_chunks(header, "campaigns", self._snapshot_entries.items()))
+            self.metrics.record_write(self.snapshot_path, True, size)
+        except Exception as e:
+            print(f"Error writing snapshot {self.snapshot_path}: {e}")
+            if os.path.exists(self._snapshot_tmp):
+                os.remove(self._snapshot_tmp)
+            return
+        finally:
+            self._snapshot_file = None
+            existing.close()
+        
+        self.metrics.count("snapshotHits", existing.hits)
+        self.metrics.count("snapshotMisses", existing.misses)
+        if existing.previous_index:
+            diff = diff_snapshots(existing.previous_index, {"campaigns": self._snapshot_entries})
+            print(f"Snapshot: {len(self._snapshot_entries)} campaigns, {len(diff['added'])} added, "
+                  f"{len(diff['removed'])} removed, {len(diff['changed'])} changed since the last run")
+            for change in ("added", "removed", "changed"):
+                for campaign_id in diff[change]:
+                    self._log(f"  {change}: {campaign_id}")
+    
+    def _remove_stale_files(self):
+        """Remove moved campaign files and bundles no manifest points at anymore."""
+        for directory, bundle_name in self._bundled_dirs.items():
+            for filename in os.listdir(directory):
+                if _is_bundle_file(filename) and not filename.startswith(bundle_name):
+                    self._stale_files.append(os.path.join(directory, filename))
+        
+        for filepath in self._stale_files:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+                self.metrics.count("filesRemoved")
+                self._log(f"Removed: {filepath}")
+        self._stale_files = []
+        self._bundled_dirs = {}
+    
+    def _manifest_files(self, status: str) -> Iterator[str]:
+        """List the campaign files of a status directory, read from next_state in order."""
+        for campaign_id in self.next_state.ids(status):
+            yield f"{campaign_id}.json"
+    
+    def write_manifests(self):
+        """Create manifest.json files and bundles from the campaigns recorded in this run."""
+        with self.metrics.stage("manifests"):
+            for status in ("active", "ended", "archived"):
+                target_dir = self._status_directory(status)
+                # Incremental runs also rewrite manifests that became empty
+                if self.next_state.count(status) or (self.incremental and
+                                                     os.path.exists(os.path.join(target_dir, "manifest.json"))):
+                    extra = {"bundle": self._bundle_directory(target_dir, "campaigns", self._manifest_files(status))}
+                    if status in PAGED_STATUSES:
+                        extra["pageCount"] = self._write_pages(target_dir, status)
+                        extra["pageSize"] = self.page_size
+                    self._create_manifest(target_dir, self._manifest_files(status), extra)
+    
+    def _write_pages(self, directory: str, status: str) -> int:
+        """Write page-NNNN.json files of campaign summaries, newest completion first.
+        
+        Only pages whose content changed are rewritten; pages beyond the new
+        page count are removed after the manifest is updated.
+        """
+        total = self.next_state.count(status)
+        summaries = (entry['summary'] for entry in self.next_state.newest(status))
+        
+        page_count = (total + self.page_size - 1) // self.page_size
+        for index in range(page_count):
+            page = {
+                "page": index + 1,
+                "totalPages": page_count,
+                "pageSize": self.page_size,
+                "totalCampaigns": total,
+                "campaigns": list(itertools.islice(summaries, self.page_size))
+            }
+            page_path = os.path.join(directory, f"page-{index + 1:04d}.json")
+            try:
+                if self._write_if_changed(page_path, json.dumps(page, indent=2, ensure_ascii=False)):
+                    self._log(f"Created page: {page_path}")
+            except Exception as e:
+                print(f"Error writing {page_path}: {e}")
+        
+        for filename in os.listdir(directory):
+            match = re.match(r'^page-(\d+)\.json$', filename)
+            if match and int(match.group(1)) > page_count:
+                self._stale_files.append(os.path.join(directory, filename))
+        
+        return page_count
+    
+    def _tokenize(self, text: str) -> List[str]:
+        """Split text into unique lowercase search terms."""
+        terms = []
+        for token in re.findall(r'\w+', text.lower()):
+            if len(token) > 1 and token not in SEARCH_STOPWORDS and token not in terms:
+                terms.append(token)
+        return terms
+    
+    def write_search_index(self):
+        """Write an inverted index of all campaigns to campaigns/_search_index.json.
+        
+        Campaigns are numbered by their position in `ids`; every field maps a
+        normalized value (or word, for `term`) to the sorted list of campaign
+        numbers that have it, so the site can filter and search without
+        loading any campaign file. The postings are collected in a temp
+        database and the index is written from it piece by piece.
+        """
+        fields = ("tag", "category", "status", "location", "hospital", "term")
+        db, db_path = _open_spill_database(self.campaigns_dir, ".search.")
+        try:
+            db.execute("CREATE TABLE ids (number INTEGER PRIMARY KEY, id TEXT NOT NULL)")
+            db.execute("CREATE TABLE postings (field INTEGER, value TEXT, number INTEGER, "
+                       "PRIMARY KEY (field, value, number)) WITHOUT ROWID")
             
-            # Write individual campaign files
-            manifest_files = []
-            for campaign in campaign_list:
-                filename = f"{campaign['id']}.json"
-                filepath = os.path.join(target_dir, filename)
-                
-                try:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(campaign, f, indent=2, ensure_ascii=False)
-                    
-                    manifest_files.append(filename)
-                    print(f"Created: {filepath}")
-                
-                except Exception as e:
-                    print(f"Error writing {filepath}: {e}")
+            # next_state is read in id order
+            number = 0
+            for campaign_id, entry in self.next_state.items():
+                if 'summary' not in entry:
+                    continue
+                summary, search = entry['summary'], entry.get('search', {})
+                values = {
+                    "tag": summary.get('tags', []),
+                    "category": [search.get('category', '')],
+                    "status": [summary.get('status', '')],
+                    "location": [search.get('location', '')],
+                    "hospital": [search.get('hospital', '')],
+                    "term": self._tokenize(f"{summary.get('title', '')} {summary.get('shortDescription', '')}")
+                }
+                db.execute("INSERT INTO ids VALUES (?, ?)", (number, campaign_id))
+                db.executemany("INSERT OR IGNORE INTO postings VALUES (?, ?, ?)",
+                               ((field_number, value.strip().lower(), number)
+                                for field_number, field in enumerate(fields)
+                                for value in values[field] if value.strip()))
+                number += 1
             
-            # Create manifest file
-            if manifest_files:
-                self._create_manifest(target_dir, manifest_files)
-    
-    def _create_manifest(self, directory: str, campaign_files: List[str]):
-        """Create manifest.json file for a directory."""
-        manifest = {
-            "campaigns": sorted(campaign_files),
-            "lastUpdated": datetime.now().isoformat() + "Z"
-        }
+            def chunks():
+                # The same bytes as compact json.dumps of the whole index
+                yield '{"version":' + json.dumps(SEARCH_INDEX_VERSION) + ',"ids":['
+                for position, campaign_id in db.execute("SELECT number, id FROM ids ORDER BY number"):
+                    yield (',' if position else '') + json.dumps(campaign_id, ensure_ascii=False)
+                yield '],"fields":{'
+                for field_number, field in enumerate(fields):
+                    yield (',' if field_number else '') + json.dumps(field) + ':{'
+                    previous = None
+                    for value, posting in db.execute("SELECT value, number FROM postings WHERE field = ? "
+                                                     "ORDER BY value, number", (field_number,)):
+                        if value == previous:
+                            yield ',' + str(posting)
+                        else:
+                            yield (('],' if previous is not None else '') +
+                                   json.dumps(value, ensure_ascii=False) + ':[' + str(posting))
+                            previous = value
+                    yield (']' if previous is not None else '') + '}'
+                yield '}}'
+            
+            index_path = os.path.join(self.campaigns_dir, SEARCH_INDEX_FILENAME)
+            try:
+                if self._write_chunks_if_changed(index_path, chunks()):
+                    self._log(f"Created search index: {index_path}")
+            except Exception as e:
+                print(f"Error writing search index {index_path}: {e}")
+        finally:
+            db.close()
+            os.remove(db_path)
+    
+    def write_stats(self):
+        """Update the aggregates and merge them into campaigns/_stats.json.
         
-        manifest_path = os.path.join(directory, "manifest.json")
+        Incremental runs start from the aggregates saved in the build state
+        and only remove/add the campaigns whose entries changed; other runs
+        compute them in one pass over the campaign summaries. Hand-maintained
+        figures are kept, see merge_stats().
+        """
+        if self.incremental and self.state_stats is not None:
+            self.stats = CampaignStats(self.state_stats)
+            for campaign_id, entry in self.state.items():
+                # Unchanged campaigns carry an equal entry into next_state
+                if 'summary' in entry and self.next_state.get(campaign_id) != entry:
+                    self.stats.remove(entry)
+            for campaign_id, entry in self.next_state.items():
+                if 'summary' in entry and self.state.get(campaign_id) != entry:
+                    self.stats.add(entry)
+        else:
+            self.stats = CampaignStats()
+            for entry in self.next_state.values():
+                if 'summary' in entry:
+                    self.stats.add(entry)
+        
+        stats_path = os.path.join(self.campaigns_dir, STATS_FILENAME)
+        existing = {}
+        if os.path.exists(stats_path):
+            try:
+                existing = _load_json_file(stats_path)
+            except Exception as e:
+                print(f"Warning: Could not load {stats_path}: {e}")
+        report, self.stats_filled = merge_stats(existing, self.stats.report(), self.state_stats_filled)
         try:
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
-            print(f"Created manifest: {manifest_path}")
+            if self._write_if_changed(stats_path, json.dumps(report, indent=2, ensure_ascii=False)):
+                self._log(f"Created stats: {stats_path}")
         except Exception as e:
-            print(f"Error creating manifest {manifest_path}: {e}")
+            print(f"Error writing stats {stats_path}: {e}")
     
-    def convert(self):
-        """Main conversion process."""
-        print(f"Starting conversion of {self.csv_file}...")
-        print("-" * 50)
+    def write_content_bundles(self):
+        """Bundle the hand-maintained success story and news directories.
+        
+        Uses the files their manifests list; content_pipeline.py also picks up
+        new files and image variants, through the same publish_directory.
+        """
+        for directory, key in CONTENT_DIRECTORIES:
+            manifest = self._read_manifest(directory)
+            if key not in manifest:
+                continue
+            # The converter never changes these files, so an incremental run keeps their bundle
+            previous = manifest.get('bundle')
+            if self.incremental and previous and os.path.exists(os.path.join(directory, previous)):
+                continue
+            
+            bundle, written = publish_directory(directory, key, manifest[key], log=self._log)
+            # Bundles are content-addressed: a new name means new content
+            if bundle:
+                self.metrics.record_write(os.path.join(directory, bundle), bundle != previous)
+            self.metrics.record_write(os.path.join(directory, "manifest.json"), written)
+    
+    def _read_manifest(self, directory: str) -> Dict:
+        """Read a directory's manifest.json, returning {} if it is missing or invalid."""
+        return read_manifest(directory)
+    
+    def _bundle_directory(self, directory: str, key: str, files: Iterable[str]) -> Optional[str]:
+        """Write the bundle for the listed files, reusing it if nothing changed."""
+        if self.incremental and directory not in self._changed_dirs:
+            # Compared with the manifest, which is read whole anyway
+            files = list(files)
+            manifest = self._read_manifest(directory)
+            bundle = manifest.get('bundle')
+            if (manifest.get(key) == files and bundle and
+                    os.path.exists(os.path.join(directory, bundle))):
+                self._bundled_dirs[directory] = bundle
+                return bundle
         
-        # Parse CSV
-        campaigns = self.parse_csv()
+        previous = self._read_manifest(directory).get('bundle')
+        try:
+            bundle = write_bundle(directory, key, (os.path.join(directory, f) for f in files))
+        except Exception as e:
+            print(f"Error creating bundle in {directory}: {e}")
+            return None
         
-        # Display summary
-        total_campaigns = sum(len(campaign_list) for campaign_list in campaigns.values())
-        print(f"\nConversion Summary:")
-        print(f"Total campaigns: {total_campaigns}")
-        for status, campaign_list in campaigns.items():
-            print(f"  {status.title()}: {len(campaign_list)}")
+        # Bundles are content-addressed: a new name means new content
+        self.metrics.record_write(os.path.join(directory, bundle), bundle != previous)
+        self._bundled_dirs[directory] = bundle
+        return bundle
+    
+    def _create_manifest(self, directory: str, campaign_files: Iterable[str], extra: Optional[Dict] = None,
+                         key: str = "campaigns", only_if_changed: bool = True):
+        """Create manifest.json file for a directory.
         
-        if total_campaigns == 0:
-            print("No campaigns found to convert.")
-            return
+        `extra` holds additional fields such as the bundle name and page count.
+        A manifest whose content did not change keeps its file and timestamp,
+        so deploys (sync_static.py) do not upload it again.
+        """
+        written = write_manifest(directory, key, campaign_files, extra, only_if_changed, log=self._log)
+        self.metrics.record_write(os.path.join(directory, "manifest.json"), written)
+    
+    def _print_summary(self, counts: Dict[str, int]):
+        """Display the number of converted campaigns per status."""
+        print(f"\nConversion Summary:")
+        print(f"Total campaigns: {sum(counts.values())}")
+        for status, count in counts.items():
+            print(f"  {status.title()}: {count}")
+        if self.incremental:
+            print(f"  Unchanged: {self.unchanged_count}")
+    
+    def convert(self, content_bundles: bool = True):
+        """Main conversion process.
         
-        # Write JSON files
-        print(f"\nWriting JSON files...")
+        content_bundles=False leaves success stories and news to the caller
+        (content_pipeline.py builds them itself).
+        """
+        print(f"Starting conversion of {self.csv_file}...")
         print("-" * 50)
-        self.write_json_files(campaigns)
+        
+        if self.streaming:
+            # Parse and write each campaign as soon as its rows are complete
+            with self.metrics.stage("parse"):
+                counts = self.stream_csv()
+            self._print_summary(counts)
+            if not self.next_state:
+                print("No campaigns found to convert.")
+                return
+            self.write_manifests()
+        else:
+            # Parse CSV
+            with self.metrics.stage("parse"):
+                campaigns = self.parse_csv()
+            counts = {status: len(campaign_list) for status, campaign_list in campaigns.items()}
+            self._print_summary(counts)
+            
+            if sum(counts.values()) == 0 and not self.next_state:
+                print("No campaigns found to convert.")
+                return
+            
+            # Write JSON files
+            print(f"\nWriting JSON files...")
+            print("-" * 50)
+            self.write_json_files(campaigns)
+        
+        self.publish(content_bundles)
+    
+    def publish(self, content_bundles: bool = True):
+        """Finish a run once the campaign files and manifests are written.
+        
+        Writes the search index and stats (and, with content_bundles, the
+        success story and news bundles), removes stale files, and saves the
+        build state and snapshot.
+        """
+        with self.metrics.stage("searchIndex"):
+            self.write_search_index()
+        with self.metrics.stage("stats"):
+            self.write_stats()
+        if content_bundles:
+            with self.metrics.stage("contentBundles"):
+                self.write_content_bundles()
+        with self.metrics.stage("cleanup"):
+            self._remove_stale_files()
+            self._save_state()
+        with self.metrics.stage("snapshot"):
+            self.write_snapshot()
+        self.next_state.close()
+        self._snapshot_entries.close()
         
         print(f"\nConversion completed successfully!")
         print(f"JSON files created in: {self.campaigns_dir}/")
         print(f"  - Active campaigns: {self.active_dir}/")
-        print(f"  - Ended campaigns: {self.ended_dir}/")
+        print(f"  - Completed campaigns: {self.ended_dir}/")
         print(f"  - Archived campaigns: {self.archived_dir}/")
+        self.metrics.print_summary()
+    
+    def run_report(self) -> Dict:
+        """Describe this run (options, stage timings, counters) for --profile."""
+        report = {
+            "version": RUN_REPORT_VERSION,
+            "startedAt": self.metrics.started_at,
+            "csvFile": self.csv_file,
+            "csvFiles": self.csv_files,
+            "options": {
+                "incremental": self.incremental,
+                "streaming": self.streaming,
+                "workers": self.workers,
+                "executor": self.executor,
+                "pageSize": self.page_size
+            }
+        }
+        report.update(self.metrics.report())
+        return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Convert campaign CSV data to JSON files.")
+    parser.add_argument("csv_file", nargs="*", default=["master_campaign_details.csv"],
+                        help="Source CSV files or glob patterns, merged into one campaign set "
+                             "(default: master_campaign_details.csv)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only reprocess campaigns whose CSV rows changed since the last run")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process one campaign at a time; CSV rows must be grouped by title")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Parallel campaign writers and CSV readers "
+                             "(default: number of CPUs, 1 = sequential)")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="Writer pool type; 'process' also parallelizes JSON serialization")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Campaigns per completed-campaign page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--state-file",
+                        help=f"Build state file (default: campaigns/{STATE_FILENAME})")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Only print the summary, warnings and errors, not every file")
+    parser.add_argument("--profile", nargs="?", const="convert-profile", metavar="PREFIX",
+                        help="Write a cProfile dump to PREFIX.pstats and a run report to PREFIX.json "
+                             "(default prefix: convert-profile)")
+    parser.add_argument("--diff-snapshots", nargs=2, metavar=("OLD", "NEW"),
+                        help=f"List the campaigns added, removed and changed between two copies "
+                             f"of {SNAPSHOT_INDEX_FILENAME}, then exit")
+    return parser.parse_args(argv)
 
 
 def main():
     """Main entry point."""
+    args = parse_args()
+    
+    if args.diff_snapshots:
+        old_path, new_path = args.diff_snapshots
+        indexes = [read_snapshot_index(path) for path in (old_path, new_path)]
+        for path, index in zip((old_path, new_path), indexes):
+            if not index:
+                print(f"Error: {path} is not a snapshot index (version {SNAPSHOT_VERSION})")
+                sys.exit(1)
+        diff = diff_snapshots(*indexes)
+        for change in ("added", "removed", "changed"):
+            print(f"{change.title()}: {len(diff[change])}")
+            for campaign_id in diff[change]:
+                print(f"  {campaign_id}")
+        return
+    
     print("Sevabrata Foundation - CSV to JSON Converter")
     print("=" * 50)
     
-    converter = CampaignConverter()
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    
+    converter = CampaignConverter(args.csv_file, incremental=args.incremental,
+                                  state_file=args.state_file, streaming=args.stream,
+                                  workers=args.workers, executor=args.executor,
+                                  page_size=args.page_size, verbose=not args.quiet)
     converter.convert()
+    
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(f"{args.profile}.pstats")
+        with open(f"{args.profile}.json", 'w', encoding='utf-8') as f:
+            json.dump(converter.run_report(), f, indent=2)
+        print(f"\nProfile written to {args.profile}.pstats "
+              f"(python3 -m pstats {args.profile}.pstats), run report to {args.profile}.json")
 
 
 if __name__ == "__main__":
@@ -2,17 +2,265 @@
 """
 Advanced development server with automatic cache-busting for Sevabrata Foundation website
 This version modifies HTML to add timestamp query parameters to JS/CSS files
+
+With --production it instead serves the site the way a CDN/load balancer
+would: threaded, content-hash ETags, 304 revalidation, long-lived caching for
+hashed assets, Range requests, and HTML rewritten once per file change.
+
+Both modes negotiate Accept-Encoding: precompressed .br/.gz siblings are
+served when present, other text responses are gzip (or brotli, if the module
+is installed) compressed on the fly and cached in a bounded LRU.
+
+With --watch (development mode only) the server also watches the CSV and the
+content JSON files, rebuilds just the affected section incrementally and
+tells open pages over Server-Sent Events which files changed, so they reload
+only those (stylesheets, campaign/story/news data) instead of the whole page.
+
+Usage:
+    python3 dev-server.py [port]
+    python3 dev-server.py [port] --watch
+    python3 dev-server.py [port] --production
+    python3 dev-server.py [port] --production --root dist
 """
 
+import argparse
+import email.utils
+import gzip
+import hashlib
 import http.server
+import json
+import queue
 import socketserver
 import os
-import sys
+import threading
 import time
 import re
-from urllib.parse import urlparse
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
+from file_watcher import RESCAN, create_watcher
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip is compressed on the fly
+    brotli = None
+
+# File names like bundle.3f2a9c1d4e5b6a7f.json never change content
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,64}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+DEFAULT_CACHE_CONTROL = 'public, max-age=3600'
+COPY_CHUNK_SIZE = 64 * 1024
+# Production handler caches of file ETags and rewritten HTML pages
+FILE_ETAG_CACHE_ENTRIES = 4096
+HTML_PAGE_CACHE_ENTRIES = 256
+# Length of the content hash in the ?v= added to HTML references
+VERSION_LENGTH = 12
+
+# Compression: text-like types only, small bodies are not worth it
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json',
+                      'application/xml', 'image/svg+xml')
+MIN_COMPRESS_SIZE = 1024
+COMPRESSION_CACHE_BYTES = 32 * 1024 * 1024
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+# Live reload (--watch): pages subscribe to an event stream of changed paths
+LIVERELOAD_PATH = '/__livereload'
+LIVERELOAD_SCRIPT_PATH = '/__livereload.js'
+LIVERELOAD_PING_SECONDS = 15
+CONTENT_SECTIONS = ('campaigns', 'success-stories', 'news')
+LIVERELOAD_SCRIPT = """// Live reload client injected by dev-server.py --watch
+(function () {
+    const loaders = {'campaigns': 'loadCampaigns', 'success-stories': 'loadSuccessStories', 'news': 'loadNews'};
+    const source = new EventSource('%s');
+    source.onmessage = (event) => {
+        const site = window.SevabrataWebsite;
+        const reloads = new Set();
+        for (const path of JSON.parse(event.data).paths) {
+            const section = path.split('/')[0];
+            if (path === '%s') {
+                // Changes were lost: anything may be stale
+                window.location.reload();
+                return;
+            } else if (path.endsWith('.css')) {
+                // Swap the stylesheet in place
+                document.querySelectorAll('link[rel="stylesheet"]').forEach(link => {
+                    const url = new URL(link.href);
+                    if (url.pathname === '/' + path) {
+                        url.searchParams.set('v', Date.now());
+                        link.href = url.toString();
+                    }
+                });
+            } else if (section in loaders && site) {
+                reloads.add(loaders[section]);
+            } else if (/\\.(html|js)$/.test(path)) {
+                window.location.reload();
+                return;
+            }
+        }
+        reloads.forEach(loader => site[loader]());
+    };
+})();
+""" % (LIVERELOAD_PATH, RESCAN)
+
+
+class CompressionCache:
+    """Thread-safe LRU of compressed bodies, bounded by total size in bytes.
+    
+    Keys include the file's content version (mtime/ETag), so stale entries
+    are never served; they simply age out.
+    """
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key, load, encoding):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        
+        data = compress(load(), encoding)
+        with self.lock:
+            if key not in self.entries and len(data) <= self.max_bytes:
+                self.entries[key] = data
+                self.size += len(data)
+                while self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return data
+
+
+compression_cache = CompressionCache(COMPRESSION_CACHE_BYTES)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by its number of entries."""
+    
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+    
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+class LiveReloadHub:
+    """Fans change notifications out to every connected event stream."""
+    
+    def __init__(self):
+        self.clients = set()
+        self.lock = threading.Lock()
+    
+    def subscribe(self):
+        events = queue.Queue()
+        with self.lock:
+            self.clients.add(events)
+        return events
+    
+    def unsubscribe(self, events):
+        with self.lock:
+            self.clients.discard(events)
+    
+    def broadcast(self, paths):
+        with self.lock:
+            clients = list(self.clients)
+        for events in clients:
+            events.put(paths)
+
+
+def compress(data, encoding):
+    """Compress data with a fast, deterministic setting for on-the-fly use."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
 
-class CacheBustingHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+def accepted_encodings(header):
+    """Return the supported encodings the client accepts, best first."""
+    accepted = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        match = re.search(r'q=([0-9.]+)', params)
+        if match:
+            try:
+                quality = float(match.group(1))
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    
+    wildcard = accepted.get('*', 0.0)
+    return [encoding for encoding in ('br', 'gzip') if accepted.get(encoding, wildcard) > 0]
+
+
+def is_compressible(content_type, size):
+    """Skip small bodies and types that are already compressed (images, PDFs)."""
+    return size >= MIN_COMPRESS_SIZE and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMixin:
+    """Accept-Encoding negotiation shared by both server modes.
+    
+    Precompressed .br/.gz siblings are preferred when they are at least as
+    new as the original; otherwise compressible bodies are compressed on the
+    fly and kept in the shared LRU cache.
+    """
+    
+    def choose_encoding(self, path, content_type, size):
+        """Return (encoding, precompressed sibling path, negotiable)."""
+        accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+        negotiable = is_compressible(content_type, size)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            sibling = path + suffix
+            try:
+                sibling_stat = os.stat(sibling)
+            except OSError:
+                continue
+            negotiable = True
+            if encoding in accepted and mtime is not None and sibling_stat.st_mtime_ns >= mtime:
+                return encoding, sibling, True
+        
+        if negotiable and is_compressible(content_type, size):
+            for encoding in accepted:
+                if encoding != 'br' or brotli is not None:
+                    return encoding, None, True
+        return None, None, negotiable
+    
+    def compressed_body(self, key, load, encoding):
+        """Compress (or fetch from the cache) a response body."""
+        return compression_cache.get((key, encoding), load, encoding)
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class CacheBustingHTTPRequestHandler(CompressionMixin, http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
         # Add aggressive no-cache headers
         self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate, max-age=0, private')
@@ -24,6 +272,19 @@ class CacheBustingHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     
     def do_GET(self):
         """Override GET to modify HTML files with cache-busting timestamps"""
+        livereload = getattr(self.server, 'livereload', None)
+        if livereload and urlparse(self.path).path == LIVERELOAD_PATH:
+            self.send_events(livereload)
+            return
+        if livereload and urlparse(self.path).path == LIVERELOAD_SCRIPT_PATH:
+            body = LIVERELOAD_SCRIPT.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/javascript; charset=utf-8')
+            self.send_header('Content-Length', len(body))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        
         if self.path == '/' or self.path.endswith('.html'):
             # For HTML files, add cache-busting timestamps to JS/CSS references
             if self.path == '/':
@@ -39,34 +300,103 @@ class CacheBustingHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                     # Add timestamp to JS and CSS files
                     timestamp = str(int(time.time()))
                     
+                    # Fingerprinted names (fingerprint_assets.py) already change with their content
+                    def busted(ref):
+                        return ref if HASHED_NAME.search(ref) else f'{ref}?v={timestamp}'
+                    
                     # Replace script src
                     content = re.sub(
                         r'<script src="([^"]+\.js)"',
-                        f'<script src="\\1?v={timestamp}"',
+                        lambda m: f'<script src="{busted(m.group(1))}"',
                         content
                     )
                     
                     # Replace CSS href
                     content = re.sub(
                         r'<link[^>]+href="([^"]+\.css)"',
-                        lambda m: m.group(0).replace(m.group(1), f'{m.group(1)}?v={timestamp}'),
+                        lambda m: m.group(0).replace(m.group(1), busted(m.group(1))),
                         content
                     )
                     
+                    if livereload:
+                        content = content.replace(
+                            '</body>', f'<script src="{LIVERELOAD_SCRIPT_PATH}"></script>\n</body>', 1)
+                    
                     # Send response
+                    body = content.encode('utf-8')
                     self.send_response(200)
                     self.send_header('Content-Type', 'text/html; charset=utf-8')
-                    self.send_header('Content-Length', len(content.encode('utf-8')))
+                    encoding, _, negotiable = self.choose_encoding(file_path, 'text/html', len(body))
+                    if encoding:
+                        body = compress(body, encoding)
+                        self.send_header('Content-Encoding', encoding)
+                    if negotiable:
+                        self.send_header('Vary', 'Accept-Encoding')
+                    self.send_header('Content-Length', len(body))
                     self.end_headers()
-                    self.wfile.write(content.encode('utf-8'))
+                    self.wfile.write(body)
                     return
                     
                 except Exception as e:
                     print(f"Error processing HTML file: {e}")
         
+        # Compress static files when the client accepts it
+        if self.send_compressed_file():
+            return
+        
         # For all other files, use default behavior
         super().do_GET()
     
+    def send_events(self, livereload):
+        """Stream changed paths to the page as Server-Sent Events until it disconnects."""
+        events = livereload.subscribe()
+        self.close_connection = True
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.end_headers()
+            self.wfile.write(b'retry: 1000\n\n')
+            self.wfile.flush()
+            while True:
+                try:
+                    paths = events.get(timeout=LIVERELOAD_PING_SECONDS)
+                    message = f"data: {json.dumps({'paths': paths})}\n\n"
+                except queue.Empty:
+                    # Comment line; detects closed connections
+                    message = ': ping\n\n'
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            livereload.unsubscribe(events)
+    
+    def send_compressed_file(self):
+        """Send a static file compressed; returns False to fall back to the default."""
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path) or self.headers.get('Range'):
+            return False
+        
+        stat = os.stat(path)
+        content_type = self.guess_type(path)
+        encoding, sibling, _ = self.choose_encoding(path, content_type, stat.st_size)
+        if not encoding:
+            return False
+        
+        if sibling:
+            body = read_file(sibling)
+        else:
+            body = self.compressed_body((path, stat.st_mtime_ns, stat.st_size),
+                                        lambda: read_file(path), encoding)
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Encoding', encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+    
     def log_message(self, format, *args):
         # Enhanced logging with cache-busting indication
         message = format % args
@@ -75,18 +405,371 @@ class CacheBustingHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         else:
             print(f"[{self.log_date_time_string()}] {message}")
 
-def run_server(port=8000):
+class ProductionHTTPRequestHandler(CompressionMixin, http.server.SimpleHTTPRequestHandler):
+    """Static file handler with real HTTP caching semantics.
+    
+    ETags are content hashes cached per (mtime, size), so unchanged files are
+    hashed once. HTML files get ?v=<content hash> added to their JS/CSS
+    references; the rewritten page is cached until the HTML file or one of the
+    referenced files changes. Both caches are shared by all request threads
+    and keep the most recently used entries.
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    
+    # path -> ((mtime_ns, size), etag)
+    file_etags = LRUCache(FILE_ETAG_CACHE_ENTRIES)
+    # path -> {'key', 'deps', 'body', 'etag'}
+    html_pages = LRUCache(HTML_PAGE_CACHE_ENTRIES)
+    
+    @staticmethod
+    def _stat_key(stat):
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    @classmethod
+    def file_etag(cls, path, stat):
+        """Return the content-hash ETag of a file, hashing it only after changes."""
+        key = cls._stat_key(stat)
+        cached = cls.file_etags.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        cls.file_etags.put(path, (key, etag))
+        return etag
+    
+    @classmethod
+    def render_html(cls, path, stat):
+        """Return the cached rewritten HTML page, rebuilding it if anything changed."""
+        key = cls._stat_key(stat)
+        cached = cls.html_pages.get(path)
+        if cached and cached['key'] == key and all(cls._current_key(dep) == dep_key
+                                                   for dep, dep_key in cached['deps']):
+            return cached
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        deps = []
+        
+        def versioned(ref):
+            # Only local files can be fingerprinted, and hashed names already are
+            if '://' in ref or ref.startswith('//') or '?' in ref or HASHED_NAME.search(ref):
+                return ref
+            dep = os.path.normpath(os.path.join(os.path.dirname(path), ref.lstrip('/')))
+            try:
+                dep_stat = os.stat(dep)
+            except OSError:
+                return ref
+            deps.append((dep, cls._stat_key(dep_stat)))
+            return f'{ref}?v={cls.version(cls.file_etag(dep, dep_stat))}'
+        
+        content = re.sub(
+            r'<script src="([^"]+\.js)"',
+            lambda m: f'<script src="{versioned(m.group(1))}"',
+            content
+        )
+        content = re.sub(
+            r'<link[^>]+href="([^"]+\.css)"',
+            lambda m: m.group(0).replace(m.group(1), versioned(m.group(1))),
+            content
+        )
+        
+        body = content.encode('utf-8')
+        page = {
+            'key': key,
+            'deps': deps,
+            # The page changes when any referenced file does
+            'mtime': max([stat.st_mtime_ns] + [dep_key[0] for _, dep_key in deps]) / 1e9,
+            'body': body,
+            'etag': f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        }
+        cls.html_pages.put(path, page)
+        return page
+    
+    @staticmethod
+    def version(etag):
+        """The ?v= value for a file with this content-hash ETag."""
+        return etag.strip('"')[:VERSION_LENGTH]
+    
+    @classmethod
+    def _current_key(cls, path):
+        try:
+            return cls._stat_key(os.stat(path))
+        except OSError:
+            return None
+    
+    def do_GET(self):
+        self._serve(head_only=False)
+    
+    def do_HEAD(self):
+        self._serve(head_only=True)
+    
+    def _cache_control(self, path, etag):
+        """Pick Cache-Control: immutable for hashed names, revalidate HTML/JSON.
+        
+        A ?v= URL is only immutable while v is the file's current content
+        hash; an outdated or made-up version must not be cached for a year.
+        """
+        if HASHED_NAME.search(os.path.basename(path)):
+            return IMMUTABLE_CACHE_CONTROL
+        versions = parse_qs(urlparse(self.path).query).get('v')
+        if versions:
+            return IMMUTABLE_CACHE_CONTROL if versions[-1] == self.version(etag) else REVALIDATE_CACHE_CONTROL
+        if path.endswith(('.html', '.json')):
+            return REVALIDATE_CACHE_CONTROL
+        return DEFAULT_CACHE_CONTROL
+    
+    def _not_modified(self, etag, mtime):
+        """Evaluate If-None-Match (preferred) and If-Modified-Since."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            candidates = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in candidates or any(tag.replace('W/', '', 1) == etag for tag in candidates)
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+    
+    def _parse_range(self, size, etag):
+        """Return (start, end) for a single satisfiable byte range, None to send
+        the whole file, or 'unsatisfiable'."""
+        header = self.headers.get('Range')
+        if not header:
+            return None
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range.strip() != etag:
+            return None
+        
+        # Multiple ranges are rare for static files; serving the full body is allowed
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', header.strip())
+        if not match or not (match.group(1) or match.group(2)):
+            return None
+        
+        if not match.group(1):
+            suffix = int(match.group(2))
+            if suffix == 0:
+                return 'unsatisfiable'
+            return max(0, size - suffix), size - 1
+        
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else size - 1
+        if start >= size:
+            return 'unsatisfiable'
+        if end < start:
+            return None
+        return start, min(end, size - 1)
+    
+    def _resolve(self):
+        """Map the request to a file path, or None if a directory listing is needed."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, 'index.html')
+            return index if os.path.exists(index) else None
+        return path
+    
+    def _serve(self, head_only):
+        path = self._resolve()
+        if path is None:
+            # Directory without index.html: keep the standard listing/redirect
+            return super().do_HEAD() if head_only else super().do_GET()
+        
+        try:
+            stat = os.stat(path)
+            if path.endswith('.html'):
+                page = self.render_html(path, stat)
+                body, etag, size, mtime = page['body'], page['etag'], len(page['body']), page['mtime']
+                content_type = 'text/html; charset=utf-8'
+            else:
+                body, etag, size, mtime = None, self.file_etag(path, stat), stat.st_size, stat.st_mtime
+                content_type = self.guess_type(path)
+            cache_control = self._cache_control(path, etag)
+            
+            # Each encoding is its own representation with its own ETag
+            source = path
+            encoding, sibling, negotiable = self.choose_encoding(path, content_type, size)
+            if encoding:
+                etag = f'{etag[:-1]}-{encoding}"'
+                if sibling:
+                    body, source, size = None, sibling, os.stat(sibling).st_size
+                else:
+                    original = body
+                    body = self.compressed_body(
+                        (path, etag), lambda: original if original is not None else read_file(path), encoding)
+                    size = len(body)
+        except (OSError, UnicodeDecodeError):
+            self.send_error(404, "File not found")
+            return
+        
+        if self._not_modified(etag, mtime):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            if negotiable:
+                self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        byte_range = self._parse_range(size, etag)
+        if byte_range == 'unsatisfiable':
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        start, end = byte_range or (0, size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(max(0, end - start + 1)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if negotiable:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', email.utils.formatdate(mtime, usegmt=True))
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Accept-Ranges', 'bytes')
+        if byte_range:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.end_headers()
+        
+        if head_only or size == 0:
+            return
+        try:
+            if body is not None:
+                self.wfile.write(body[start:end + 1])
+            else:
+                self._copy_file(source, start, end - start + 1)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def _copy_file(self, path, start, length):
+        """Stream `length` bytes of a file starting at `start`."""
+        with open(path, 'rb') as f:
+            f.seek(start)
+            while length > 0:
+                chunk = f.read(min(COPY_CHUNK_SIZE, length))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                length -= len(chunk)
+
+
+class TCPServer(socketserver.TCPServer):
+    # The default listen backlog of 5 drops connections when a page load opens
+    # many at once, and each dropped one waits a full second for the SYN retry
+    request_queue_size = 128
+
+
+class ThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    request_queue_size = 128
+
+
+def run_production_server(port=8000, root=None):
+    """Serve the site (or a build of it, such as dist/) with the production handler."""
+    try:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        os.chdir(os.path.join(script_dir, root) if root else script_dir)
+        
+        with ThreadingHTTPServer(("", port), ProductionHTTPRequestHandler) as httpd:
+            print(f"🚀 Production Static Server Starting...")
+            print(f"📁 Serving directory: {os.getcwd()}")
+            print(f"🌐 Server running at: http://localhost:{port}/")
+            print(f"🧵 Threaded, content-hash ETags, 304 revalidation and Range support")
+            print(f"📦 Hashed assets are served as immutable")
+            print(f"⏹️  Press Ctrl+C to stop the server")
+            print("-" * 60)
+            
+            httpd.serve_forever()
+    
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped by user")
+    except OSError as e:
+        print(f"❌ Error starting server: {e}")
+
+def affected_sections(paths, csv_file):
+    """Return the content sections that must be rebuilt for the changed paths.
+    
+    Generated files (manifests, bundles, pages, _*.json) never trigger a
+    rebuild, only the CSV and individual item files do. RESCAN, sent when
+    the watcher lost events, rebuilds every section.
+    """
+    if RESCAN in paths:
+        return set(CONTENT_SECTIONS)
+    sections = set()
+    for path in paths:
+        parts = os.path.normpath(path).split(os.sep)
+        filename = parts[-1]
+        if os.path.normpath(path) == os.path.normpath(csv_file):
+            sections.add('campaigns')
+        elif (parts[0] in CONTENT_SECTIONS and len(parts) > 1 and filename.endswith('.json') and
+              filename != 'manifest.json' and not filename.startswith(('_', 'page-', 'bundle.'))):
+            sections.add(parts[0])
+    return sections
+
+
+def watch_content(livereload, csv_file):
+    """Rebuild changed content sections and notify pages; runs in a thread."""
+    from content_pipeline import default_plugins, run_pipeline
+    
+    def watched_directories():
+        directories = ['.']
+        for section in CONTENT_SECTIONS:
+            directories += [root for root, _, _ in os.walk(section)
+                            if not os.path.basename(root).startswith('.')]
+        return directories
+    
+    directories = watched_directories()
+    watcher = create_watcher(directories)
+    
+    while True:
+        changed = watcher.wait()
+        sections = affected_sections(changed, csv_file)
+        if sections:
+            print(f"🔄 Rebuilding {', '.join(sorted(sections))}...")
+            plugins = [plugin for plugin in default_plugins(csv_file) if plugin.name in sections]
+            run_pipeline(plugins, workers=os.cpu_count() or 1, incremental=True)
+            # The rebuild's own output: pass it on to the pages, but don't rebuild from it
+            changed |= watcher.wait(0)
+            
+            # Also watch directories the rebuild created
+            if watched_directories() != directories:
+                watcher.close()
+                directories = watched_directories()
+                watcher = create_watcher(directories)
+        paths = sorted(path.replace(os.sep, '/') for path in changed)
+        print(f"🔔 Changed: {', '.join(paths)}")
+        livereload.broadcast(paths)
+
+
+def run_server(port=8000, watch=False, csv_file="master_campaign_details.csv"):
     try:
         # Change to the script's directory
         script_dir = os.path.dirname(os.path.abspath(__file__))
         os.chdir(script_dir)
         
-        with socketserver.TCPServer(("", port), CacheBustingHTTPRequestHandler) as httpd:
+        # Event streams stay open, so watching needs a threaded server
+        server_class = ThreadingHTTPServer if watch else TCPServer
+        with server_class(("", port), CacheBustingHTTPRequestHandler) as httpd:
             print(f"🚀 Advanced Development Server Starting...")
             print(f"📁 Serving directory: {os.getcwd()}")
             print(f"🌐 Server running at: http://localhost:{port}/")
             print(f"🚫 Cache completely disabled with timestamp injection")
             print(f"💡 JS/CSS files will have ?v=timestamp automatically added")
+            if watch:
+                httpd.livereload = LiveReloadHub()
+                threading.Thread(target=watch_content, args=(httpd.livereload, csv_file),
+                                 daemon=True).start()
+                print(f"👀 Watching {csv_file} and content JSON; pages reload changed files live")
             print(f"⏹️  Press Ctrl+C to stop the server")
             print("-" * 60)
             
@@ -102,11 +785,29 @@ def run_server(port=8000):
             print(f"❌ Error starting server: {e}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sevabrata Foundation development server")
+    parser.add_argument("port", nargs="?", default="8000", help="Port to listen on (default: 8000)")
+    parser.add_argument("--production", action="store_true",
+                        help="Serve with real caching semantics instead of cache busting")
+    parser.add_argument("--watch", action="store_true",
+                        help="Rebuild content when the CSV or JSON files change and live reload pages")
+    parser.add_argument("--csv", default="master_campaign_details.csv",
+                        help="Campaign CSV watched with --watch (default: master_campaign_details.csv)")
+    parser.add_argument("--root",
+                        help="With --production, serve this directory (e.g. dist) instead of the source tree")
+    args = parser.parse_args()
+    if args.watch and args.production:
+        parser.error("--watch is only available in development mode")
+    if args.root and not args.production:
+        parser.error("--root is only available in production mode")
+    
     port = 8000
-    if len(sys.argv) > 1:
-        try:
-            port = int(sys.argv[1])
-        except ValueError:
-            print("❌ Invalid port number. Using default port 8000.")
+    try:
+        port = int(args.port)
+    except ValueError:
+        print("❌ Invalid port number. Using default port 8000.")
     
-    run_server(port)
\ No newline at end of file
+    if args.production:
+        run_production_server(port, root=args.root)
+    else:
+        run_server(port, watch=args.watch, csv_file=args.csv)
\ No newline at end of file
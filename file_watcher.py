@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - File Watcher
+
+Reports changed files in a set of directories. On Linux it uses inotify
+through ctypes (no third-party packages); elsewhere, or when inotify is not
+available, it falls back to polling modification times.
+
+Usage:
+    from file_watcher import create_watcher
+
+    watcher = create_watcher([".", "campaigns/active"])
+    while True:
+        changed = watcher.wait()   # set of paths like "campaigns/active/x.json"
+        if RESCAN in changed:      # events were lost, anything may have changed
+            ...
+
+Requirements:
+    - Python 3.6+
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+# Editors and atomic writers produce bursts of events; collect them together
+SETTLE_SECONDS = 0.2
+
+# Reported by wait() when the kernel dropped events, in place of the lost paths
+RESCAN = '*'
+
+
+def is_ignored(filename: str) -> bool:
+    """Skip temp files of atomic writes and editors."""
+    return (filename.startswith('.') or filename.endswith(('.tmp', '.swp', '~')) or
+            filename == '4913')
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime, size) snapshots of the directories."""
+
+    def __init__(self, directories: Iterable[str], interval: float = 1.0):
+        self.directories = list(directories)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if is_ignored(entry.name) or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[os.path.normpath(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Return the paths changed since the last call, waiting up to timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(0.0, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher for a fixed set of directories (not recursive)."""
+
+    def __init__(self, directories: Iterable[str]):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                self.close()
+                raise OSError(error, f"Cannot watch {directory}")
+            self._directories[wd] = os.path.normpath(directory)
+
+    def _read_events(self, created: Set[str]) -> Tuple[Set[str], bool]:
+        """Read pending events; returns (changed paths, queue overflowed).
+
+        Paths of files that appeared are also added to `created`.
+        """
+        changed = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b'\0')
+                offset += EVENT_HEADER.size + length
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                filename = os.fsdecode(name)
+                if mask & IN_ISDIR or not filename or is_ignored(filename) or wd not in self._directories:
+                    continue
+                path = os.path.normpath(os.path.join(self._directories[wd], filename))
+                changed.add(path)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    created.add(path)
+        return changed, overflow
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block until files change (or timeout) and return their paths.
+
+        If the event queue overflowed the result also contains RESCAN, as
+        the changes that were dropped are unknown.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        created = set()
+        changed, overflow = self._read_events(created)
+        # Let the burst settle so one save is reported once
+        while select.select([self._fd], [], [], SETTLE_SECONDS)[0]:
+            more, more_overflow = self._read_events(created)
+            changed |= more
+            overflow = overflow or more_overflow
+
+        # Files that came and went within the burst (temp files of `sed -i`
+        # and similar tools) are not changes
+        changed = {path for path in changed if path not in created or os.path.exists(path)}
+        if overflow:
+            changed.add(RESCAN)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directories: List[str], poll_interval: float = 1.0):
+    """Return an inotify watcher, or a polling watcher if inotify is unavailable."""
+    directories = [d for d in directories if os.path.isdir(d)]
+    try:
+        return InotifyWatcher(directories)
+    except (OSError, AttributeError) as e:
+        # AttributeError: the C library has no inotify (not Linux)
+        print(f"inotify unavailable ({e}), polling every {poll_interval}s")
+        return PollingWatcher(directories, poll_interval)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Static Asset Fingerprinting
+
+This script builds a deployable copy of the website in dist/ in which the
+scripts, stylesheets and images are renamed by content hash
+(script.js -> script.3f2a9c1d4e5b.js), and index.html and the fingerprinted
+files themselves are rewritten to reference the hashed names.
+Hashed files never change, so the server and CDN can serve them as immutable
+with a year-long max-age; HTML and data JSON keep their names and are
+revalidated. dist/asset-map.json maps every original path to its hashed
+name. Data JSON is copied unchanged, so the images it references are also
+kept under their original names.
+
+The admin panel (admin.html, admin.js, admin-auth.js) is left out of the
+build unless --include-admin is given, e.g. for a staging deploy.
+
+Usage:
+    python3 fingerprint_assets.py
+    python3 fingerprint_assets.py --output build
+    python3 fingerprint_assets.py --output staging --include-admin
+
+Requirements:
+    - Python 3.6+
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+from typing import Dict, List
+
+from csv_to_json_converter import (SNAPSHOT_FILENAME, SNAPSHOT_INDEX_FILENAME, STATE_FILENAME,
+                                   _atomic_write, _write_compressed_siblings)
+
+DEFAULT_OUTPUT_DIR = "dist"
+ASSET_MAP_FILENAME = "asset-map.json"
+HTML_PAGES = ["index.html"]
+# Fingerprinted in this order: stylesheets and scripts may reference images
+CODE_ASSETS = ["styles.css", "script.js"]
+# Only built with include_admin: the panel must not reach production by accident
+ADMIN_PAGES = ["admin.html"]
+ADMIN_ASSETS = ["admin-auth.js", "admin.js"]
+IMAGE_DIRS = ["assets", "images"]
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.avif', '.ico')
+# Copied as they are: fetched by fixed names at runtime
+DATA_DIRS = ["campaigns", "success-stories", "news", "annual-reports"]
+# Converter bookkeeping that the site never fetches
+BUILD_ONLY_FILES = (STATE_FILENAME, SNAPSHOT_FILENAME, SNAPSHOT_INDEX_FILENAME)
+HASH_LENGTH = 12
+# Already content-addressed (bundles, optimized image variants)
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,64}\.[A-Za-z0-9]+$')
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path: str, data: bytes) -> str:
+    """Insert the content hash before the extension: a/b.png -> a/b.<hash>.png."""
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{content_hash(data)}{extension}"
+
+
+class AssetFingerprinter:
+    """Copies the site to an output directory with content-hashed asset names."""
+
+    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR, include_admin: bool = False):
+        self.output_dir = output_dir
+        self.html_pages = HTML_PAGES + (ADMIN_PAGES if include_admin else [])
+        self.code_assets = CODE_ASSETS + (ADMIN_ASSETS if include_admin else [])
+        self.asset_map = {}
+        self.outputs = set()
+        self.written = 0
+
+    def _find_images(self) -> List[str]:
+        images = []
+        for directory in IMAGE_DIRS:
+            for root, _, files in os.walk(directory):
+                for filename in files:
+                    if filename.lower().endswith(IMAGE_EXTENSIONS):
+                        images.append(os.path.join(root, filename).replace(os.sep, '/'))
+        return sorted(images)
+
+    def _emit(self, path: str, data: bytes):
+        """Write data to path in the output directory unless it is already there."""
+        target = os.path.join(self.output_dir, path)
+        self.outputs.add(os.path.normpath(target))
+        try:
+            with open(target, 'rb') as f:
+                if f.read() == data:
+                    return
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        _atomic_write(target, data)
+        self.written += 1
+
+    def _emit_compressed(self, path: str):
+        """Add precompressed .gz/.br siblings for an emitted file."""
+        target = os.path.join(self.output_dir, path)
+        _write_compressed_siblings(target)
+        for suffix in ('.gz', '.br'):
+            if os.path.exists(target + suffix):
+                self.outputs.add(os.path.normpath(target + suffix))
+
+    def _copy(self, path: str):
+        """Copy a file unchanged, skipping it if size and mtime already match."""
+        target = os.path.join(self.output_dir, path)
+        self.outputs.add(os.path.normpath(target))
+        source_stat = os.stat(path)
+        try:
+            target_stat = os.stat(target)
+            if (target_stat.st_size == source_stat.st_size and
+                    target_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                return
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        shutil.copy2(path, target)
+        self.written += 1
+
+    def _rewrite_references(self, text: str) -> str:
+        """Replace references to fingerprinted files with their hashed names."""
+        if not self.asset_map:
+            return text
+        # Longest first, and only whole paths (not admin.js inside admin.json)
+        names = sorted(self.asset_map, key=len, reverse=True)
+        pattern = re.compile(r'(?<![\w-])(' + '|'.join(re.escape(name) for name in names) + r')(?![\w.-])')
+        return pattern.sub(lambda m: self.asset_map[m.group(1)], text)
+
+    def build(self) -> Dict[str, str]:
+        """Build the output directory and return the asset map."""
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Images first: they reference nothing; keep the originals for data JSON
+        for path in self._find_images():
+            self._copy(path)
+            if HASHED_NAME.search(path):
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.asset_map[path] = hashed_name(path, data)
+            self._emit(self.asset_map[path], data)
+
+        # Then code, rewritten before hashing so the hash covers the new references
+        for path in self.code_assets:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                data = self._rewrite_references(f.read()).encode('utf-8')
+            self.asset_map[path] = hashed_name(path, data)
+            self._emit(self.asset_map[path], data)
+            self._emit_compressed(self.asset_map[path])
+
+        # Pages keep their names and point at the hashed files
+        for path in self.html_pages:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._emit(path, self._rewrite_references(f.read()).encode('utf-8'))
+                print(f"Rewrote: {path}")
+
+        for directory in DATA_DIRS:
+            for root, dirs, files in os.walk(directory):
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                for filename in files:
+                    if not filename.startswith('.') and filename not in BUILD_ONLY_FILES:
+                        self._copy(os.path.join(root, filename))
+
+        asset_map = dict(sorted(self.asset_map.items()))
+        self._emit(ASSET_MAP_FILENAME, json.dumps({"assets": asset_map}, indent=2).encode('utf-8'))
+        self._remove_stale_outputs()
+        return asset_map
+
+    def _remove_stale_outputs(self):
+        """Delete files left in the output directory by earlier builds."""
+        for root, _, files in os.walk(self.output_dir):
+            for filename in files:
+                path = os.path.normpath(os.path.join(root, filename))
+                if path not in self.outputs:
+                    os.remove(path)
+                    print(f"Removed: {path}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the site with content-hashed asset names.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR,
+                        help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--include-admin", action="store_true",
+                        help="Also build the admin panel (admin.html, admin.js, admin-auth.js)")
+    args = parser.parse_args()
+
+    print("Sevabrata Foundation - Asset Fingerprinting")
+    print("=" * 50)
+
+    fingerprinter = AssetFingerprinter(args.output, include_admin=args.include_admin)
+    asset_map = fingerprinter.build()
+    for path in fingerprinter.code_assets:
+        if path in asset_map:
+            print(f"  {path} -> {asset_map[path]}")
+
+    print(f"\nFingerprinted {len(asset_map)} assets into {args.output}/ "
+          f"({fingerprinter.written} files written)")
+    print(f"Asset map: {os.path.join(args.output, ASSET_MAP_FILENAME)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Image Asset Optimizer
+
+This script generates resized, re-encoded variants of the images in assets/
+and images/, records them in an asset manifest, and points the campaign,
+success story and news JSON files at those variants so pages can use srcset.
+Success story and news bundles are rebuilt when their files change; campaign
+bundles and listing pages come from the converter, which has to be rerun.
+
+Usage:
+    python3 optimize_assets.py
+    python3 optimize_assets.py --widths 320 640 1280 --workers 4
+
+Requirements:
+    - Python 3.6+
+    - Pillow (pip install Pillow); AVIF variants need a Pillow build with
+      AVIF support, otherwise only WebP and the original format are produced
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from csv_to_json_converter import (ASSET_MANIFEST, CONTENT_DIRECTORIES, _atomic_write,
+                                   _InlineExecutor, image_variants, publish_directory, read_manifest,
+                                   write_json_file)
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+
+SOURCE_DIRS = ["assets", "images"]
+OUTPUT_DIR = os.path.dirname(ASSET_MANIFEST)
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+DEFAULT_WIDTHS = [320, 640, 1280]
+# Bump when encoder settings change so every image is regenerated
+OPTIMIZER_VERSION = 1
+QUALITY = {"webp": 80, "avif": 55, "jpeg": 82}
+
+
+def _file_hash(path: str) -> str:
+    """Hash a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _output_formats() -> List[str]:
+    """Return the modern formats this Pillow build can encode."""
+    formats = []
+    if features.check('webp'):
+        formats.append("webp")
+    if features.check('avif'):
+        formats.append("avif")
+    return formats
+
+
+def _encode(image, image_format: str) -> bytes:
+    """Encode a PIL image to bytes in the given format."""
+    buffer = io.BytesIO()
+    if image_format == "png":
+        image.save(buffer, "PNG", optimize=True)
+    elif image_format == "jpeg":
+        image.convert("RGB").save(buffer, "JPEG", quality=QUALITY["jpeg"], optimize=True, progressive=True)
+    else:
+        image.save(buffer, image_format.upper(), quality=QUALITY[image_format])
+    return buffer.getvalue()
+
+
+def build_variants(source: str, source_hash: str, widths: List[int], formats: List[str]) -> Dict:
+    """Generate all variants of one image and return its manifest entry.
+
+    Runs in worker processes, so it must stay a module-level function.
+    Variant file names carry a content hash, so they can be cached forever.
+    """
+    with Image.open(source) as original:
+        original.load()
+        width, height = original.size
+        has_alpha = original.mode in ("RGBA", "LA") or "transparency" in original.info
+        image = original.convert("RGBA" if has_alpha else "RGB")
+
+    # Never upscale; the largest variant is capped at the original width
+    target_widths = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+    fallback_format = "png" if has_alpha else "jpeg"
+    stem = os.path.splitext(os.path.basename(source))[0]
+
+    variants = []
+    for target_width in target_widths:
+        target_height = max(1, round(height * target_width / width))
+        resized = image if target_width == width else image.resize((target_width, target_height), Image.LANCZOS)
+        for image_format in formats + [fallback_format]:
+            data = _encode(resized, image_format)
+            extension = "jpg" if image_format == "jpeg" else image_format
+            filename = f"{stem}-{target_width}.{hashlib.sha256(data).hexdigest()[:12]}.{extension}"
+            path = os.path.join(OUTPUT_DIR, filename)
+            if not os.path.exists(path):
+                _atomic_write(path, data)
+            variants.append({
+                "path": path.replace(os.sep, '/'),
+                "format": image_format,
+                "width": target_width,
+                "height": target_height,
+                "bytes": len(data)
+            })
+
+    srcset = {}
+    for variant in variants:
+        srcset.setdefault(variant["format"], []).append(f"{variant['path']} {variant['width']}w")
+
+    return {
+        "sourceHash": source_hash,
+        "width": width,
+        "height": height,
+        "fallbackFormat": fallback_format,
+        "variants": variants,
+        "srcset": {image_format: ", ".join(entries) for image_format, entries in srcset.items()}
+    }
+
+
+class AssetOptimizer:
+    """Builds responsive image variants and the asset manifest."""
+
+    def __init__(self, widths: Optional[List[int]] = None, workers: int = 1):
+        self.widths = sorted(set(widths or DEFAULT_WIDTHS))
+        self.workers = max(1, workers)
+        self.formats = _output_formats()
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        """Load the previous asset manifest, which doubles as the hash cache."""
+        try:
+            with open(ASSET_MANIFEST, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        settings = manifest.get('settings', {})
+        if settings != self._settings():
+            print("Optimizer settings changed, regenerating all images")
+            return {}
+        return manifest.get('images', {})
+
+    def _settings(self) -> Dict:
+        return {"version": OPTIMIZER_VERSION, "widths": self.widths, "formats": self.formats}
+
+    def _find_sources(self) -> List[str]:
+        """List the source images, skipping generated variants."""
+        sources = []
+        for directory in SOURCE_DIRS:
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                if filename.lower().endswith(SOURCE_EXTENSIONS):
+                    sources.append(f"{directory}/{filename}")
+        return sources
+
+    def _is_current(self, source: str, entry: Optional[Dict]) -> Tuple[bool, Optional[str]]:
+        """Check a source against the cache; returns (current, content hash)."""
+        if not entry:
+            return False, None
+        stat = os.stat(source)
+        variants_exist = all(os.path.exists(v['path']) for v in entry.get('variants', []))
+        if entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime_ns:
+            return variants_exist, None
+
+        # Touched but maybe not modified: compare content
+        source_hash = _file_hash(source)
+        return variants_exist and source_hash == entry.get('sourceHash'), source_hash
+
+    def optimize(self) -> Dict[str, Dict]:
+        """Generate variants for new or changed images, in parallel."""
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        images = {}
+        jobs = []
+
+        for source in self._find_sources():
+            entry = self.manifest.get(source)
+            current, source_hash = self._is_current(source, entry)
+            if current:
+                images[source] = entry
+                continue
+            jobs.append((source, source_hash or _file_hash(source)))
+
+        print(f"Images: {len(images)} unchanged, {len(jobs)} to process")
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else _InlineExecutor()
+        with pool:
+            futures = [(source, pool.submit(build_variants, source, source_hash, self.widths, self.formats))
+                       for source, source_hash in jobs]
+            for source, future in futures:
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    print(f"Error processing {source}: {e}")
+                    continue
+                stat = os.stat(source)
+                entry.update({"size": stat.st_size, "mtime": stat.st_mtime_ns})
+                images[source] = entry
+                smallest = min(variant['bytes'] for variant in entry['variants'])
+                print(f"Optimized: {source} ({len(entry['variants'])} variants, "
+                      f"{stat.st_size // 1024} KiB -> {smallest // 1024} KiB smallest)")
+
+        self.manifest = dict(sorted(images.items()))
+        self._remove_unused_variants()
+        self._save_manifest()
+        return self.manifest
+
+    def _save_manifest(self):
+        content = json.dumps({"settings": self._settings(), "images": self.manifest},
+                             indent=2, ensure_ascii=False).encode('utf-8')
+        try:
+            with open(ASSET_MANIFEST, 'rb') as f:
+                if f.read() == content:
+                    return
+        except OSError:
+            pass
+        _atomic_write(ASSET_MANIFEST, content)
+        print(f"Created asset manifest: {ASSET_MANIFEST}")
+
+    def _remove_unused_variants(self):
+        """Delete variants no manifest entry refers to anymore."""
+        used = {os.path.basename(v['path']) for entry in self.manifest.values() for v in entry['variants']}
+        for filename in os.listdir(OUTPUT_DIR):
+            if filename not in used and filename != os.path.basename(ASSET_MANIFEST):
+                os.remove(os.path.join(OUTPUT_DIR, filename))
+
+    def rewrite_references(self) -> List[str]:
+        """Add imageVariants to campaign, success story and news JSON files.
+
+        Rebuilds the bundles of the success story and news directories that
+        changed; returns the campaign directories that changed, whose bundles
+        and pages only the converter can rebuild.
+        """
+        campaign_dirs = [os.path.join("campaigns", d) for d in ("active", "completed", "archived")]
+        content_keys = dict(CONTENT_DIRECTORIES)
+
+        changed = []
+        for directory in campaign_dirs + list(content_keys):
+            if not os.path.isdir(directory):
+                continue
+            updated = False
+            for filename in sorted(os.listdir(directory)):
+                # Skip manifests, bundles and listing pages
+                if not filename.endswith('.json') or filename == 'manifest.json' or \
+                        filename.startswith(('bundle.', 'page-')):
+                    continue
+                updated = self._rewrite_file(os.path.join(directory, filename)) or updated
+            if updated:
+                changed.append(directory)
+
+        for directory in changed:
+            key = content_keys.get(directory)
+            files = read_manifest(directory).get(key) if key else None
+            if files is not None:
+                publish_directory(directory, key, files)
+        return [directory for directory in changed if directory in campaign_dirs]
+
+    def _rewrite_file(self, filepath: str) -> bool:
+        """Update the imageVariants of one JSON file; returns whether it changed."""
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                item = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load {filepath}: {e}")
+            return False
+
+        variants = image_variants(self.manifest, item.get('image', ''))
+        if item.get('imageVariants') == variants:
+            return False
+        if variants:
+            item['imageVariants'] = variants
+        else:
+            item.pop('imageVariants', None)
+
+        write_json_file(filepath, item, only_if_changed=False)
+        print(f"Updated image references: {filepath}")
+        return True
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate responsive image variants.")
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS,
+                        help=f"Variant widths in pixels (default: {' '.join(map(str, DEFAULT_WIDTHS))})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Parallel image workers (default: number of CPUs)")
+    parser.add_argument("--no-rewrite", action="store_true",
+                        help="Only build variants, do not update image references in JSON files")
+    args = parser.parse_args()
+
+    print("Sevabrata Foundation - Image Asset Optimizer")
+    print("=" * 50)
+
+    if Image is None:
+        print("Error: Pillow is required. Install it with: pip install Pillow")
+        sys.exit(1)
+
+    optimizer = AssetOptimizer(args.widths, args.workers)
+    print(f"Formats: {', '.join(optimizer.formats + ['original'])}")
+    optimizer.optimize()
+    if not args.no_rewrite:
+        stale = optimizer.rewrite_references()
+        if stale:
+            print(f"Campaign files changed in {', '.join(stale)}: rerun csv_to_json_converter.py "
+                  f"(or content_pipeline.py) to rebuild their bundles and pages")
+
+    print(f"\nAsset optimization completed!")
+
+
+if __name__ == "__main__":
+    main()
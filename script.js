@@ -241,6 +241,18 @@ class SevabrataWebsite {
                 return;
             }
             
+            // Large archives are published as pages of summaries; show the first page only
+            const firstPage = await this.loadCampaignPage('campaigns/completed/', 1);
+            if (firstPage) {
+                this.completedCampaignPages = {
+                    page: firstPage.page,
+                    totalPages: firstPage.totalPages,
+                    campaigns: (firstPage.campaigns || []).map(campaign => this.transformCampaignData(campaign))
+                };
+                this.renderCompletedCampaignPages();
+                return;
+            }
+
             // Load completed campaigns from directory
             console.log('Loading completed campaigns from campaigns/completed/ directory...');
             const completedCampaigns = await this.loadCampaignsFromDirectory('campaigns/completed/');
@@ -255,6 +267,47 @@ class SevabrataWebsite {
         }
     }
 
+    async loadCampaignPage(directory, pageNumber) {
+        // Pages are named page-0001.json, page-0002.json, ...
+        try {
+            const response = await fetch(`${directory}page-${String(pageNumber).padStart(4, '0')}.json`);
+            if (response.ok) {
+                return await response.json();
+            }
+        } catch (error) {
+            console.error(`Error loading campaign page ${pageNumber}:`, error);
+        }
+        return null;
+    }
+
+    renderCompletedCampaignPages() {
+        const { page, totalPages, campaigns } = this.completedCampaignPages;
+        this.renderCampaigns(campaigns, 'completed');
+
+        const container = document.getElementById('campaigns-container');
+        if (!container || page >= totalPages) {
+            return;
+        }
+
+        // Fetch the next page only when asked for
+        container.insertAdjacentHTML('beforeend', `
+            <div class="load-more-container">
+                <button class="btn btn-secondary load-more-btn">Load more campaigns</button>
+            </div>
+        `);
+        container.querySelector('.load-more-btn').addEventListener('click', async () => {
+            const nextPage = await this.loadCampaignPage('campaigns/completed/', page + 1);
+            if (nextPage) {
+                this.completedCampaignPages = {
+                    page: nextPage.page,
+                    totalPages: nextPage.totalPages,
+                    campaigns: campaigns.concat((nextPage.campaigns || []).map(campaign => this.transformCampaignData(campaign)))
+                };
+                this.renderCompletedCampaignPages();
+            }
+        });
+    }
+
     async loadActiveCampaigns() {
         try {
             console.log('Loading active campaigns from directory...');
@@ -278,6 +331,13 @@ class SevabrataWebsite {
             }
             
             const manifest = await manifestResponse.json();
+
+            // Prefer the single bundle of all campaigns when the converter produced one
+            const bundled = await this.loadBundle(directory, manifest, 'campaigns');
+            if (bundled) {
+                return bundled.map(campaign => this.transformCampaignData(campaign));
+            }
+
             const campaignFiles = manifest.campaigns || [];
             const campaigns = [];
 
@@ -301,6 +361,24 @@ class SevabrataWebsite {
         }
     }
 
+    async loadBundle(directory, manifest, key) {
+        // Bundles hold every item of a directory, e.g. {"campaigns": [...]}
+        if (!manifest.bundle) {
+            return null;
+        }
+
+        try {
+            const response = await fetch(`${directory}${manifest.bundle}`);
+            if (response.ok) {
+                const bundle = await response.json();
+                return bundle[key] || [];
+            }
+        } catch (error) {
+            console.error(`Error loading bundle ${manifest.bundle}:`, error);
+        }
+        return null;
+    }
+
     async loadStats() {
         try {
             const response = await fetch('campaigns/_stats.json');
@@ -333,6 +411,7 @@ class SevabrataWebsite {
             description: campaignData.shortDescription,
             fullDescription: campaignData.fullDescription,
             image: campaignData.image,
+            imageVariants: campaignData.imageVariants,
             targetAmount: campaignData.targetAmount,
             raisedAmount: campaignData.raisedAmount,
             status: campaignData.status,
@@ -343,7 +422,9 @@ class SevabrataWebsite {
             lastUpdated: campaignData.lastUpdated,
             category: campaignData.category,
             timeline: campaignData.timeline,
-            updates: campaignData.updates
+            updates: campaignData.updates,
+            // Listing pages carry summaries; the full record is fetched for the detail view
+            isSummary: !('fullDescription' in campaignData)
         };
     }
 
@@ -368,6 +449,14 @@ class SevabrataWebsite {
             }
             
             const manifest = await manifestResponse.json();
+
+            const bundled = await this.loadBundle('success-stories/', manifest, 'stories');
+            if (bundled) {
+                console.log('Success stories loaded from bundle:', bundled);
+                this.renderSuccessStories(bundled);
+                return;
+            }
+
             const storyFiles = manifest.stories || [];
             const successStories = [];
 
@@ -431,7 +520,7 @@ class SevabrataWebsite {
         return `
             <div class="story-card clickable" data-story-id="${story.id}" role="button" tabindex="0">
                 <div class="story-image">
-                    <img src="${story.image}" alt="${story.patientName}" onerror="this.src='assets/sevalog1crop.jpg'">
+                    ${this.renderImage(story.image, story.patientName, story.imageVariants)}
                 </div>
                 <div class="story-content">
                     <h3>${story.patientName}</h3>
@@ -466,6 +555,7 @@ class SevabrataWebsite {
         }
 
         container.innerHTML = campaigns.map(campaign => this.createCampaignCard(campaign, type)).join('');
+        this.renderedCampaigns = new Map(campaigns.map(campaign => [String(campaign.id), campaign]));
         
         // Add event listeners to campaign cards
         this.setupCampaignInteractions();
@@ -513,7 +603,7 @@ class SevabrataWebsite {
         
         return `
             <div class="campaign-card ${urgencyClass} ${completedClass}" data-campaign-id="${campaign.id}">
-                <img src="${campaign.image}" alt="${campaign.title}" class="campaign-image" onerror="this.src='assets/sevalog1crop.jpg'">
+                ${this.renderImage(campaign.image, campaign.title, campaign.imageVariants, 'campaign-image')}
                 <div class="campaign-content">
                     <h3 class="campaign-title">${campaign.title}${successBadge}</h3>
                     <p class="campaign-description">${campaign.description}</p>
@@ -616,7 +706,7 @@ class SevabrataWebsite {
                     </div>
                     <div class="modal-body">
                         <div class="story-hero">
-                            <img src="${story.image}" alt="${story.patientName}" onerror="this.src='assets/sevalog1crop.jpg'">
+                            ${this.renderImage(story.image, story.patientName, story.imageVariants, '', '100vw')}
                             <div class="story-summary">
                                 <div class="story-detail">
                                     <strong>Condition:</strong> ${story.condition}
@@ -796,6 +886,15 @@ class SevabrataWebsite {
             }
             
             const manifest = await manifestResponse.json();
+
+            const bundled = await this.loadBundle('news/', manifest, 'articles');
+            if (bundled) {
+                console.log('News articles loaded from bundle:', bundled);
+                this.newsArticles = bundled;
+                this.renderNews(bundled);
+                return;
+            }
+
             const articleFiles = manifest.articles || [];
             const newsArticles = [];
 
@@ -853,7 +952,7 @@ class SevabrataWebsite {
         return `
             <div class="news-card">
                 <div class="news-image clickable" data-news-id="${article.id}" role="button" tabindex="0" aria-label="Expand image for ${article.title}">
-                    <img src="${imageUrl}" alt="${article.title}" onerror="this.src='assets/sevalog1crop.jpg'">
+                    ${this.renderImage(imageUrl, article.title, article.imageVariants)}
                 </div>
                 <div class="news-content">
                     <h3>${article.title}</h3>
@@ -921,7 +1020,7 @@ class SevabrataWebsite {
                         </button>
                     </div>
                     <div class="modal-body">
-                        <img src="${imageUrl}" alt="${article.title}" class="expanded-image" onerror="this.src='assets/sevalog1crop.jpg'">
+                        ${this.renderImage(imageUrl, article.title, article.imageVariants, 'expanded-image', '100vw')}
                     </div>
                 </div>
             </div>
@@ -1343,7 +1442,8 @@ class SevabrataWebsite {
 
     async showCampaignDetails(campaignId) {
         // Load detailed information from the new directory structure
-        const campaignDetails = await this.getCampaignDetails(campaignId);
+        const campaign = this.renderedCampaigns ? this.renderedCampaigns.get(String(campaignId)) : null;
+        const campaignDetails = await this.getCampaignDetails(campaignId, campaign);
         // Check if campaign is completed by looking for it in completed directory
         const isCompleted = await this.isCampaignCompleted(campaignId);
         this.createCampaignModal(campaignDetails, isCompleted);
@@ -1359,7 +1459,7 @@ class SevabrataWebsite {
         }
     }
 
-    async getCampaignDetails(campaignId) {
+    async getCampaignDetails(campaignId, campaign = null) {
         try {
             // Note: file:// protocol is not supported due to CORS restrictions
             if (window.location.protocol === 'file:') {
@@ -1371,8 +1471,11 @@ class SevabrataWebsite {
                 };
             }
             
-            // Try to find the campaign in different directories
-            const directories = ['active', 'completed'];
+            // Try to find the campaign in different directories; a page summary
+            // already says which one holds its full record
+            const directories = campaign && campaign.isSummary && campaign.status !== 'active'
+                ? ['completed', 'active']
+                : ['active', 'completed'];
             
             for (const directory of directories) {
                 try {
@@ -1584,6 +1687,28 @@ class SevabrataWebsite {
     }
 
     // Utility functions
+    renderImage(src, alt, variants, className = '', sizes = '(max-width: 768px) 100vw, 400px') {
+        // Plain <img> unless optimize_assets.py produced responsive variants
+        const classAttr = className ? ` class="${className}"` : '';
+        const fallback = `onerror="this.onerror=null; this.closest('picture')?.querySelectorAll('source').forEach(s => s.remove()); this.src='assets/sevalog1crop.jpg'"`;
+        if (!variants || !variants.srcset) {
+            return `<img src="${src}" alt="${alt}"${classAttr} onerror="this.src='assets/sevalog1crop.jpg'">`;
+        }
+
+        // Modern formats first; the browser picks the first type it supports
+        const sources = ['avif', 'webp']
+            .filter(format => variants.srcset[format])
+            .map(format => `<source type="image/${format}" srcset="${variants.srcset[format]}" sizes="${sizes}">`)
+            .join('');
+        const fallbackSrcset = variants.srcset.jpeg || variants.srcset.png || '';
+        return `
+            <picture class="responsive-picture">
+                ${sources}
+                <img src="${src}" srcset="${fallbackSrcset}" sizes="${sizes}" alt="${alt}"${classAttr}
+                     loading="lazy" decoding="async" ${fallback}>
+            </picture>`;
+    }
+
     formatAmount(amount) {
         return new Intl.NumberFormat('en-IN').format(amount);
     }
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Differential Static Sync
+
+This script deploys the built site (dist/, see fingerprint_assets.py) to a
+static hosting target by copying only what changed since the last deploy.
+A record of what was deployed to each target (path -> content hash) is kept
+outside the target, in .deploy-state/, so it is never served; each run hashes
+the build, writes a change set of added, modified and deleted paths with
+their hashes, and copies just those files with a bounded pool of workers.
+The change set also lists the paths to invalidate on a CDN: only modified
+and deleted ones, since added paths were never cached and fingerprinted
+assets never change.
+
+New files go up first and HTML pages and manifests last, so pages never
+point at files that are not there yet; deleted files are removed at the
+end, and only if every copy succeeded. Fingerprinted files that the build
+no longer has (script.<old hash>.js) are retired instead: they stay for
+one more deploy, so pages still cached at the CDN or in browsers can load
+them, and are deleted by the next successful sync.
+
+The target is a directory, which stands in for a bucket when testing
+locally (or is a mounted bucket / web root in production).
+
+Usage:
+    python3 sync_static.py /var/www/sevabrata
+    python3 sync_static.py /var/www/sevabrata --dry-run
+    python3 sync_static.py /mnt/bucket --source dist --workers 16 --changeset changeset.json
+    python3 sync_static.py /mnt/bucket --state /var/lib/sevabrata/bucket-state.json
+
+Requirements:
+    - Python 3.6+
+    - A build in dist/ (python3 fingerprint_assets.py)
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from csv_to_json_converter import _atomic_write
+from fingerprint_assets import DEFAULT_OUTPUT_DIR, HASHED_NAME
+
+# One state file per target, next to the build rather than in the (public) target
+DEPLOY_STATE_DIR = ".deploy-state"
+DEPLOY_STATE_VERSION = 1
+DEFAULT_CHANGESET = "deploy-changeset.json"
+DEFAULT_WORKERS = 8
+# Entry points are copied after everything they may reference
+ENTRY_POINT_NAMES = ("manifest.json", "asset-map.json")
+ENTRY_POINT_EXTENSIONS = (".html",)
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_fingerprinted(path: str) -> bool:
+    """Content-hashed names (and their .gz/.br siblings) never change content."""
+    stem, extension = os.path.splitext(path)
+    return HASHED_NAME.search(stem if extension in ('.gz', '.br') else path) is not None
+
+
+def is_entry_point(path: str) -> bool:
+    return os.path.basename(path) in ENTRY_POINT_NAMES or path.endswith(ENTRY_POINT_EXTENSIONS)
+
+
+def default_state_path(target: str) -> str:
+    """Return .deploy-state/<target path as a file name>.json for target."""
+    name = re.sub(r'[^\w.-]+', '_', os.path.abspath(target)).strip('_') or 'root'
+    return os.path.join(DEPLOY_STATE_DIR, f"{name}.json")
+
+
+def read_deploy_state(state_path: str) -> Dict[str, Dict]:
+    """Return the files recorded by the last deploy ({} if none)."""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Warning: Could not read deploy state, treating every file as new: {e}")
+        return {}
+    if state.get('version') != DEPLOY_STATE_VERSION:
+        return {}
+    return state.get('files', {})
+
+
+def scan_source(source: str, deployed: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Hash every file of the build as {path: {hash, size, mtime}}.
+
+    Files whose size and mtime match what the last deploy recorded reuse its
+    hash, so only files that were touched are read.
+    """
+    files = {}
+    for root, dirs, filenames in os.walk(source):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for filename in sorted(filenames):
+            if filename.startswith('.'):
+                continue
+            full_path = os.path.join(root, filename)
+            path = os.path.relpath(full_path, source).replace(os.sep, '/')
+            stat = os.stat(full_path)
+            previous = deployed.get(path, {})
+            if previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime_ns:
+                digest = previous['hash']
+            else:
+                digest = file_hash(full_path)
+            files[path] = {"hash": digest, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+    return files
+
+
+def compute_changeset(files: Dict[str, Dict], deployed: Dict[str, Dict]) -> Dict:
+    """Compare the build with the deployed files by content hash.
+
+    Fingerprinted files missing from the build are `retired` (kept one more
+    deploy) the first time, and `deleted` once they were already retired.
+    """
+    added = {path: entry['hash'] for path, entry in files.items() if path not in deployed}
+    modified = {path: entry['hash'] for path, entry in files.items()
+                if path in deployed and deployed[path]['hash'] != entry['hash']}
+    removed = [path for path in deployed if path not in files]
+    retired = sorted(path for path in removed if is_fingerprinted(path) and not deployed[path].get('retired'))
+    deleted = sorted(path for path in removed if path not in retired)
+    return {
+        "added": added,
+        "modified": modified,
+        "deleted": deleted,
+        "retired": retired,
+        "unchanged": len(files) - len(added) - len(modified),
+        "uploadBytes": sum(files[path]['size'] for path in list(added) + list(modified)),
+        "invalidate": sorted('/' + path for path in list(modified) + deleted if not is_fingerprinted(path))
+    }
+
+
+def copy_file(source: str, target: str, path: str):
+    """Copy one file into the target atomically (temp file + rename)."""
+    destination = os.path.join(target, path)
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(destination) or '.',
+                                    prefix=f".{os.path.basename(destination)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as dst, open(os.path.join(source, path), 'rb') as src:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(tmp_path, destination)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class StaticSync:
+    """Copies the changed files of a build to a target directory."""
+
+    def __init__(self, source: str, target: str, workers: int = DEFAULT_WORKERS,
+                 state_path: Optional[str] = None):
+        self.source = source
+        self.target = target
+        self.workers = max(1, workers)
+        self.state_path = state_path or default_state_path(target)
+        self.deployed = read_deploy_state(self.state_path)
+        self.files = scan_source(source, self.deployed)
+        self.changeset = compute_changeset(self.files, self.deployed)
+
+    def _copy_all(self, paths: List[str]) -> Tuple[List[str], List[str]]:
+        """Copy paths with the worker pool; returns (copied, failed)."""
+        copied, failed = [], []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [(path, pool.submit(copy_file, self.source, self.target, path)) for path in paths]
+            for path, future in futures:
+                try:
+                    future.result()
+                    copied.append(path)
+                    print(f"Uploaded: {path}")
+                except Exception as e:
+                    print(f"Error uploading {path}: {e}")
+                    failed.append(path)
+        return copied, failed
+
+    def _save_state(self, copied: List[str], deleted: List[str], retired: List[str]):
+        """Record what the target holds now; failed copies keep their old entry."""
+        files = dict(self.deployed)
+        copied = set(copied)
+        for path, entry in self.files.items():
+            # Unchanged files get their current size/mtime, so the next scan does not rehash them
+            if path in copied or (path in files and files[path]['hash'] == entry['hash']):
+                files[path] = entry
+        for path in deleted:
+            files.pop(path, None)
+        for path in retired:
+            files[path] = dict(files[path], retired=True)
+        state = {
+            "version": DEPLOY_STATE_VERSION,
+            "deployedAt": datetime.now().isoformat() + "Z",
+            "files": dict(sorted(files.items()))
+        }
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        _atomic_write(self.state_path, json.dumps(state, indent=2).encode('utf-8'))
+
+    def sync(self) -> bool:
+        """Copy added and modified files, then delete removed ones; returns success."""
+        os.makedirs(self.target, exist_ok=True)
+        changed = sorted(list(self.changeset['added']) + list(self.changeset['modified']))
+
+        copied, failed = self._copy_all([path for path in changed if not is_entry_point(path)])
+        if not failed:
+            more, failed = self._copy_all([path for path in changed if is_entry_point(path)])
+            copied += more
+
+        deleted, retired = [], []
+        if failed:
+            print(f"{len(failed)} uploads failed; keeping deleted files until the next sync")
+        else:
+            for path in self.changeset['deleted']:
+                try:
+                    os.remove(os.path.join(self.target, path))
+                except FileNotFoundError:
+                    pass
+                deleted.append(path)
+                print(f"Deleted: {path}")
+            # Only retire once the new pages are live, or the next sync would delete them too early
+            retired = self.changeset['retired']
+            for path in retired:
+                print(f"Retired: {path}")
+
+        self._save_state(copied, deleted, retired)
+        return not failed
+
+
+def write_changeset(path: str, sync: StaticSync):
+    """Write the change set with where it was computed from and to."""
+    changeset = {
+        "version": DEPLOY_STATE_VERSION,
+        "source": sync.source,
+        "target": sync.target,
+        "generatedAt": datetime.now().isoformat() + "Z"
+    }
+    changeset.update(sync.changeset)
+    _atomic_write(path, json.dumps(changeset, indent=2).encode('utf-8'))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Copy only the changed files of the build to a target.")
+    parser.add_argument("target", help="Target directory (web root, mounted bucket or local stand-in)")
+    parser.add_argument("--source", default=DEFAULT_OUTPUT_DIR,
+                        help=f"Built site to deploy (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Parallel copies (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--changeset", default=DEFAULT_CHANGESET,
+                        help=f"Where to write the change set (default: {DEFAULT_CHANGESET})")
+    parser.add_argument("--state",
+                        help=f"Deploy state of this target, kept out of the target "
+                             f"(default: {DEPLOY_STATE_DIR}/<target path>.json)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only write the change set, do not copy anything")
+    args = parser.parse_args()
+
+    print("Sevabrata Foundation - Static Sync")
+    print("=" * 50)
+
+    if not os.path.isdir(args.source):
+        print(f"Error: {args.source}/ not found, run python3 fingerprint_assets.py first")
+        sys.exit(1)
+
+    sync = StaticSync(args.source, args.target, args.workers, args.state)
+    changeset = sync.changeset
+    print(f"{len(changeset['added'])} added, {len(changeset['modified'])} modified, "
+          f"{len(changeset['deleted'])} deleted, {len(changeset['retired'])} retired, "
+          f"{changeset['unchanged']} unchanged "
+          f"({changeset['uploadBytes'] / 2 ** 20:.1f} MiB to upload)")
+
+    ok = True
+    if not args.dry_run:
+        ok = sync.sync()
+    write_changeset(args.changeset, sync)
+    print(f"Change set: {args.changeset} ({len(changeset['invalidate'])} paths to invalidate)")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Content Pipeline Tests
+
+Builds a small site in a temporary directory through the plugins and checks
+the stages, the shared JSON cache and the manifests they write.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import copy
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import content_pipeline
+from content_pipeline import BuildContext, CampaignPlugin, ContentPlugin, DirectoryPlugin, run_pipeline
+from csv_to_json_converter import read_manifest
+
+CSV = ("title,name,category,status,date,event,description\n"
+       "Asha - Surgery,Asha,Medical,active,2024-02-01,Admitted,\n"
+       "Ravi - Transplant,Ravi,Medical,active,2024-01-05,Launched,\n")
+EXISTING = {"id": "asha-surgery", "title": "Asha - Surgery", "status": "active",
+            "patientDetails": {"name": "Asha", "hospital": "City Hospital"},
+            "timeline": [{"date": "2024-01-01", "event": "Launched", "description": "By hand"}],
+            "tags": ["featured"]}
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class PipelineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        with open("campaigns.csv", 'w', encoding='utf-8') as f:
+            f.write(CSV)
+        write_json("campaigns/active/asha-surgery.json", EXISTING)
+
+
+class ContentPluginTest(unittest.TestCase):
+
+    def test_source_and_sink_must_be_implemented(self):
+        class SourceOnly(ContentPlugin):
+            def source(self, context):
+                return iter(())
+
+        with self.assertRaises(TypeError):
+            SourceOnly()
+
+
+class BuildContextTest(PipelineTestCase):
+
+    def test_read_json_is_cached_and_bounded(self):
+        for name in ("a", "b", "c"):
+            write_json(f"data/{name}.json", {"name": name})
+        context = BuildContext()
+        self.addCleanup(context.close)
+        with mock.patch.object(content_pipeline, "JSON_CACHE_ENTRIES", 2):
+            first = context.read_json("data/a.json")
+            self.assertIs(context.read_json("data/a.json"), first)
+            context.read_json("data/b.json")
+            context.read_json("data/c.json")
+            self.assertIsNot(context.read_json("data/a.json"), first)
+
+    def test_write_json_skips_identical_content(self):
+        context = BuildContext()
+        self.addCleanup(context.close)
+        self.assertTrue(context.write_json("out.json", {"a": 1}).result())
+        self.assertFalse(context.write_json("out.json", {"a": 1}).result())
+        self.assertEqual(read_json("out.json"), {"a": 1})
+
+
+class CampaignPluginTest(PipelineTestCase):
+
+    def test_campaigns_flow_through_the_stages(self):
+        plugin = CampaignPlugin("campaigns.csv")
+        context = BuildContext()
+        self.addCleanup(context.close)
+        loaded = {}
+        real_read_json = context.read_json
+
+        def recording_read_json(path):
+            loaded[path] = real_read_json(path)
+            return loaded[path]
+
+        context.read_json = recording_read_json
+        with mock.patch.object(plugin, "transform", wraps=plugin.transform) as transform:
+            plugin.run(context)
+        self.assertEqual(sorted(call.args[1] for call in transform.call_args_list),
+                         ["Asha - Surgery", "Ravi - Transplant"])
+
+        # The existing file came from the shared cache and was not changed there
+        existing_path = os.path.join("campaigns", "active", "asha-surgery.json")
+        self.assertEqual(loaded[existing_path], EXISTING)
+
+        asha = read_json(existing_path)
+        self.assertEqual([event["event"] for event in asha["timeline"]], ["Launched", "Admitted"])
+        self.assertEqual(asha["patientDetails"]["hospital"], "City Hospital")
+        self.assertIn("featured", asha["tags"])
+        self.assertEqual(sorted(read_json("campaigns/active/manifest.json")["campaigns"]),
+                         ["asha-surgery.json", "ravi-transplant.json"])
+        self.assertTrue(os.path.exists("campaigns/_search_index.json"))
+
+    def test_unchanged_campaigns_are_dropped_by_the_transform(self):
+        self.assertTrue(run_pipeline([CampaignPlugin("campaigns.csv")]))
+        plugin = CampaignPlugin("campaigns.csv")
+        context = BuildContext(incremental=True)
+        self.addCleanup(context.close)
+        self.assertEqual(list(plugin.items(context)), [])
+        self.assertEqual(plugin.converter.unchanged_count, 2)
+
+
+class DirectoryPluginTest(PipelineTestCase):
+
+    def test_manifest_keeps_order_and_appends_new_files(self):
+        write_json("news/b.json", {"id": "b", "title": "B"})
+        write_json("news/a.json", {"id": "a", "title": "A"})
+        write_json("news/bad.json", {"id": "bad"})
+        write_json("news/manifest.json", {"articles": ["b.json", "gone.json"]})
+        original = copy.deepcopy(read_json("news/a.json"))
+
+        self.assertTrue(run_pipeline([DirectoryPlugin("news", "news", "articles", ("id", "title"))]))
+        manifest = read_manifest("news")
+        self.assertEqual(manifest["articles"], ["b.json", "a.json"])
+        with open(os.path.join("news", manifest["bundle"]), 'r', encoding='utf-8') as f:
+            self.assertEqual([item["id"] for item in json.load(f)["articles"]], ["b", "a"])
+        # Items the transform left alone are not rewritten
+        self.assertEqual(read_json("news/a.json"), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Converter Output Tests
+
+Converts a small CSV in a temporary directory and checks the incremental
+build state, atomic writes, content-addressed bundles, listing pages, the
+search index and the on-disk records a run keeps per campaign.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csv_to_json_converter
+from csv_to_json_converter import (STATE_VERSION, CampaignConverter, CampaignRecords, _atomic_write,
+                                   _atomic_write_chunks, publish_directory, read_manifest, write_bundle,
+                                   write_json_file)
+
+HEADER = "title,name,location,hospital,category,shortDescription,status,date,event,description\n"
+ROWS = {
+    "Asha - Surgery": "Asha,Pune,City Hospital,Medical,Heart surgery for Asha,active,2024-02-01,Admitted,",
+    "Ravi - Transplant": "Ravi,Delhi,AIIMS,Medical,Kidney transplant,ended,2024-03-10,Discharged,",
+    "Meena - Treatment": "Meena,Pune,Ruby Hall,Education,Treatment and school fees,ended,2024-05-20,Recovered,"
+}
+
+
+def write_csv(rows):
+    with open("campaigns.csv", 'w', encoding='utf-8') as f:
+        f.write(HEADER + "".join(f"{title},{row}\n" for title, row in rows.items()))
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def temp_files(directory):
+    return [name for name in os.listdir(directory) if name.endswith('.tmp')]
+
+
+class ConverterTestCase(unittest.TestCase):
+    """Runs conversions of ROWS in a temporary directory."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        write_csv(ROWS)
+
+    def converter(self, **options):
+        return CampaignConverter("campaigns.csv", asset_images={}, verbose=False, **options)
+
+    def convert(self, **options):
+        converter = self.converter(**options)
+        converter.convert(content_bundles=False)
+        return converter
+
+
+class IncrementalStateTest(ConverterTestCase):
+
+    def test_unchanged_campaigns_are_skipped(self):
+        self.convert()
+        self.assertEqual(self.convert(incremental=True).unchanged_count, 3)
+
+        rows = dict(ROWS)
+        rows["Asha - Surgery"] = rows["Asha - Surgery"].replace("City Hospital", "Ruby Hall")
+        write_csv(rows)
+        converter = self.convert(incremental=True)
+        self.assertEqual(converter.unchanged_count, 2)
+        asha = read_json("campaigns/active/asha-surgery.json")
+        self.assertEqual(asha["patientDetails"]["hospital"], "Ruby Hall")
+
+    def test_is_unchanged_checks_rows_and_output_file(self):
+        self.convert()
+        converter = self.converter(incremental=True)
+        entry = converter.state["asha-surgery"]
+        self.assertTrue(converter._is_unchanged("asha-surgery", entry["rowHash"]))
+        self.assertFalse(converter._is_unchanged("asha-surgery", "other"))
+        self.assertFalse(converter._is_unchanged("new-campaign", entry["rowHash"]))
+
+        # A touched file with the same content is hashed and still unchanged
+        path = entry["path"]
+        os.utime(path, ns=(entry["mtime"] + 10 ** 9, entry["mtime"] + 10 ** 9))
+        self.assertTrue(converter._is_unchanged("asha-surgery", entry["rowHash"]))
+        self.assertEqual(entry["mtime"], os.stat(path).st_mtime_ns)
+
+        # An edited file is not
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("\n")
+        self.assertFalse(converter._is_unchanged("asha-surgery", entry["rowHash"]))
+
+    def test_state_version_change_reprocesses_everything(self):
+        self.convert()
+        self.assertEqual(read_json("campaigns/_build_state.json")["version"], STATE_VERSION)
+        with mock.patch.object(csv_to_json_converter, "STATE_VERSION", STATE_VERSION + 1):
+            converter = self.converter(incremental=True)
+            self.assertEqual(converter.state, {})
+            converter.convert(content_bundles=False)
+        self.assertEqual(converter.unchanged_count, 0)
+        self.assertEqual(read_json("campaigns/_build_state.json")["version"], STATE_VERSION + 1)
+
+    def test_run_leaves_no_temp_files(self):
+        self.convert(streaming=True)
+        self.convert(incremental=True)
+        for directory in ("campaigns", "campaigns/active", "campaigns/completed"):
+            self.assertEqual(temp_files(directory), [])
+
+
+class AtomicWriteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.path = os.path.join(self.root, "data.json")
+        _atomic_write(self.path, b"old")
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_file_is_replaced(self):
+        _atomic_write(self.path, b"new")
+        self.assertEqual(self.read(), b"new")
+        self.assertEqual(temp_files(self.root), [])
+
+    def test_failed_write_keeps_the_old_file(self):
+        def chunks():
+            yield b"partial"
+            raise IOError("disk full")
+
+        with self.assertRaises(IOError):
+            _atomic_write_chunks(self.path, chunks())
+        self.assertEqual(self.read(), b"old")
+        self.assertEqual(temp_files(self.root), [])
+
+    def test_same_content_is_not_rewritten(self):
+        self.assertEqual(_atomic_write_chunks(self.path, [b"o", b"ld"], only_if_changed=True), (False, 3))
+        self.assertTrue(write_json_file(self.path, {"a": 1}))
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertFalse(write_json_file(self.path, {"a": 1}))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+
+
+class BundleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for name in ("a", "b"):
+            self.write(f"{name}.json", {"id": name})
+
+    def write(self, filename, data):
+        with open(os.path.join(self.root, filename), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def bundle(self, files):
+        return write_bundle(self.root, "stories", [os.path.join(self.root, f) for f in files])
+
+    def test_bundle_is_content_addressed(self):
+        name = self.bundle(["a.json", "b.json"])
+        self.assertRegex(name, r'^bundle\.[0-9a-f]{16}\.json$')
+        self.assertEqual(self.bundle(["a.json", "b.json"]), name)
+        self.assertNotEqual(self.bundle(["b.json", "a.json"]), name)
+
+        bundle_path = os.path.join(self.root, name)
+        self.assertEqual(read_json(bundle_path), {"stories": [{"id": "a"}, {"id": "b"}]})
+        with open(bundle_path, 'rb') as f, gzip.open(bundle_path + ".gz", 'rb') as compressed:
+            self.assertEqual(compressed.read(), f.read())
+
+    def test_publish_replaces_the_old_bundle(self):
+        first, written = publish_directory(self.root, "stories", ["a.json"], log=lambda message: None)
+        self.assertTrue(written)
+        self.assertEqual(publish_directory(self.root, "stories", ["a.json"], log=lambda message: None),
+                         (first, False))
+
+        second, written = publish_directory(self.root, "stories", ["a.json", "b.json"], log=lambda message: None)
+        self.assertTrue(written)
+        manifest = read_manifest(self.root)
+        self.assertEqual((manifest["stories"], manifest["bundle"]), (["a.json", "b.json"], second))
+        bundles = sorted(name for name in os.listdir(self.root) if name.startswith("bundle."))
+        self.assertEqual(bundles, [second, second + ".gz"])
+
+
+class PaginationTest(ConverterTestCase):
+
+    def setUp(self):
+        super().setUp()
+        write_csv({f"Patient {number} - Surgery": f"P{number},Pune,,Medical,,ended,2024-01-{number:02d},Done,"
+                   for number in range(1, 6)})
+
+    def pages(self):
+        return sorted(name for name in os.listdir("campaigns/completed") if name.startswith("page-"))
+
+    def test_pages_list_newest_completion_first(self):
+        self.convert(page_size=2)
+        self.assertEqual(self.pages(), ["page-0001.json", "page-0002.json", "page-0003.json"])
+        manifest = read_manifest("campaigns/completed")
+        self.assertEqual((manifest["pageCount"], manifest["pageSize"]), (3, 2))
+
+        ids = []
+        for number, name in enumerate(self.pages(), 1):
+            page = read_json(os.path.join("campaigns/completed", name))
+            self.assertEqual((page["page"], page["totalPages"], page["totalCampaigns"]), (number, 3, 5))
+            ids.extend(summary["id"] for summary in page["campaigns"])
+        self.assertEqual(ids, [f"patient-{number}-surgery" for number in range(5, 0, -1)])
+
+    def test_pages_beyond_the_new_count_are_removed(self):
+        self.convert(page_size=2)
+        self.convert(incremental=True, page_size=5)
+        self.assertEqual(self.pages(), ["page-0001.json"])
+        self.assertEqual(len(read_json("campaigns/completed/page-0001.json")["campaigns"]), 5)
+
+
+class SearchIndexTest(ConverterTestCase):
+
+    def test_fields_map_values_to_campaign_numbers(self):
+        self.convert()
+        index = read_json("campaigns/_search_index.json")
+        self.assertEqual(index["ids"], ["asha-surgery", "meena-treatment", "ravi-transplant"])
+        fields = index["fields"]
+        self.assertEqual(fields["status"], {"active": [0], "ended": [1, 2]})
+        self.assertEqual(fields["location"], {"delhi": [2], "pune": [0, 1]})
+        self.assertEqual(fields["category"], {"education": [1], "medical": [0, 2]})
+        self.assertEqual(fields["hospital"], {"aiims": [2], "city hospital": [0], "ruby hall": [1]})
+        self.assertEqual(fields["term"]["treatment"], [1])
+        self.assertEqual(fields["term"]["surgery"], [0])
+        # Stopwords and single letters are not indexed
+        self.assertNotIn("for", fields["term"])
+        self.assertNotIn("and", fields["term"])
+
+    def test_streaming_writes_the_same_index(self):
+        self.convert()
+        batch = read_json("campaigns/_search_index.json")
+        shutil.rmtree("campaigns")
+        self.convert(streaming=True)
+        self.assertEqual(read_json("campaigns/_search_index.json"), batch)
+
+
+class CampaignRecordsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.records = CampaignRecords(self.root, ".test.")
+        self.addCleanup(self.records.close)
+
+    def record(self, status, completed):
+        return {"status": status, "summary": {"completedDate": completed}}
+
+    def test_records_are_listed_by_status(self):
+        self.assertEqual((len(self.records), list(self.records)), (0, []))
+        self.records["b"] = self.record("ended", "2024-01-01")
+        self.records["a"] = self.record("ended", "2024-01-01")
+        self.records["c"] = self.record("ended", "2024-03-01")
+        self.records["d"] = self.record("active", "2024-02-01")
+        self.records["e"] = None
+
+        self.assertEqual(list(self.records), ["a", "b", "c", "d", "e"])
+        self.assertEqual(self.records["c"], self.record("ended", "2024-03-01"))
+        self.assertIsNone(self.records["e"])
+        self.assertNotIn("f", self.records)
+        with self.assertRaises(KeyError):
+            self.records["f"]
+        self.assertEqual(list(self.records.ids("ended")), ["a", "b", "c"])
+        self.assertEqual(self.records.count("active"), 1)
+        newest = [record["summary"]["completedDate"] for record in self.records.newest("ended")]
+        self.assertEqual(newest, ["2024-03-01", "2024-01-01", "2024-01-01"])
+
+        # A record can be replaced
+        self.records["c"] = self.record("archived", "2024-03-01")
+        self.assertEqual(self.records.count("ended"), 2)
+
+    def test_close_removes_the_file(self):
+        self.records["a"] = self.record("active", "2024-01-01")
+        self.assertEqual(len(temp_files(self.root)), 1)
+        self.records.close()
+        self.assertEqual(temp_files(self.root), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
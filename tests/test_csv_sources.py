@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Multiple CSV Source Tests
+
+Checks which source wins when a campaign is found in several groups, how
+their timelines and amounts combine, how input patterns are expanded, and
+that reading the files with the process pool gives the same campaigns.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_to_json_converter import CampaignConverter, expand_csv_inputs, merge_campaign_groups
+
+HEADER = "title,name,raisedAmount,targetAmount,status,date,event,description\n"
+
+
+def group(order, last_updated, timeline=(), row_hash="h", **data):
+    fields = {"name": "", "raisedAmount": "", "targetAmount": "", "status": ""}
+    fields.update(data)
+    fields["timeline"] = [{"date": date, "event": name, "description": ""} for date, name in timeline]
+    return {"title": "Asha - Surgery", "rowHash": row_hash + str(order), "lastUpdated": last_updated,
+            "order": (order, 0), "data": fields}
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+class MergeCampaignGroupsTest(unittest.TestCase):
+
+    def test_single_group_is_returned_as_is(self):
+        only = group(0, "2024-01-01", raisedAmount="100")
+        self.assertIs(merge_campaign_groups([only]), only)
+
+    def test_most_recently_updated_group_wins(self):
+        older = group(1, "2024-01-01", raisedAmount="100", targetAmount="1000", status="active")
+        newer = group(0, "2024-03-01", raisedAmount="700", status="ended")
+        merged = merge_campaign_groups([newer, older])
+        # Amounts are replaced, not added up
+        self.assertEqual(merged["data"]["raisedAmount"], "700")
+        self.assertEqual(merged["data"]["status"], "ended")
+        self.assertEqual(merged["lastUpdated"], "2024-03-01")
+
+    def test_empty_fields_fall_back_to_lower_ranked_groups(self):
+        older = group(0, "2024-01-01", name="Asha", targetAmount="1000")
+        newer = group(1, "2024-03-01", raisedAmount="700")
+        data = merge_campaign_groups([older, newer])["data"]
+        self.assertEqual(data["name"], "Asha")
+        self.assertEqual(data["targetAmount"], "1000")
+        self.assertEqual(data["raisedAmount"], "700")
+
+    def test_ties_go_to_the_later_source(self):
+        first = group(0, "2024-02-01", raisedAmount="100")
+        second = group(1, "2024-02-01", raisedAmount="200")
+        self.assertEqual(merge_campaign_groups([first, second])["data"]["raisedAmount"], "200")
+        self.assertEqual(merge_campaign_groups([second, first])["data"]["raisedAmount"], "200")
+
+    def test_timelines_are_unioned_in_date_order(self):
+        first = group(0, "2024-03-01", [("2024-01-01", "Launched"), ("2024-03-01", "Surgery")])
+        second = group(1, "2024-02-01", [("2024-02-01", "Admitted"), ("2024-01-01", "Launched")])
+        timeline = merge_campaign_groups([first, second])["data"]["timeline"]
+        self.assertEqual([event["event"] for event in timeline], ["Launched", "Admitted", "Surgery"])
+
+    def test_row_hash_covers_every_group(self):
+        merged = merge_campaign_groups([group(0, "2024-01-01"), group(1, "2024-01-01")])
+        changed = merge_campaign_groups([group(0, "2024-01-01"), group(1, "2024-01-01", row_hash="x")])
+        self.assertNotEqual(merged["rowHash"], changed["rowHash"])
+
+
+class ExpandCsvInputsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for name in ("b.csv", "a.csv", "c.txt"):
+            write(os.path.join(self.root, name), HEADER)
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def test_patterns_are_sorted_and_order_is_kept(self):
+        inputs = [self.path("main.csv"), self.path("*.csv")]
+        self.assertEqual(expand_csv_inputs(inputs), [self.path("main.csv"), self.path("a.csv"), self.path("b.csv")])
+
+    def test_duplicates_are_dropped(self):
+        inputs = [self.path("b.csv"), self.path("*.csv")]
+        self.assertEqual(expand_csv_inputs(inputs), [self.path("b.csv"), self.path("a.csv")])
+
+    def test_unmatched_pattern_is_kept_to_be_reported(self):
+        self.assertEqual(expand_csv_inputs([self.path("*.xlsx")]), [self.path("*.xlsx")])
+
+
+class ReadCampaignGroupsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        write("one.csv", HEADER + "Asha - Surgery,Asha,100,1000,active,2024-01-01,Launched,\n"
+                                  "Ravi - Transplant,Ravi,0,500,active,2024-01-05,Launched,\n")
+        write("two.csv", HEADER + "Asha - surgery,,400,,,2024-02-01,Admitted,\n")
+
+    def read(self, workers):
+        converter = CampaignConverter("*.csv", workers=workers, asset_images={}, verbose=False)
+        return sorted(converter.read_campaign_groups(), key=lambda merged: merged["title"])
+
+    def test_groups_are_merged_by_id(self):
+        asha, ravi = self.read(workers=1)
+        self.assertEqual(asha["data"]["raisedAmount"], "400")
+        self.assertEqual(asha["data"]["targetAmount"], "1000")
+        self.assertEqual([event["event"] for event in asha["data"]["timeline"]], ["Launched", "Admitted"])
+        self.assertEqual(ravi["data"]["name"], "Ravi")
+
+    def test_process_pool_reads_the_same_groups(self):
+        self.assertEqual(self.read(workers=2), self.read(workers=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Dev Server Tests
+
+Runs the production handler of dev-server.py on a temporary site and checks
+its Cache-Control choices, ETag revalidation, Range requests and the
+bounded ETag/page caches, and which content sections a change rebuilds in
+--watch mode.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import functools
+import gzip
+import http.client
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# dev-server.py is a script, not an importable module name
+spec = importlib.util.spec_from_file_location("dev_server", os.path.join(REPO_ROOT, "dev-server.py"))
+dev_server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(dev_server)
+
+SITE = {
+    "index.html": '<link rel="stylesheet" href="styles.css"><script src="script.js"></script>',
+    "script.js": "console.log('site');" * 100,
+    "styles.css": "body { color: black; }",
+    "script.0123456789ab.js": "console.log('hashed');",
+    "campaigns/active/manifest.json": '{"campaigns": []}'
+}
+
+
+class QuietHandler(dev_server.ProductionHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProductionServerTestCase(unittest.TestCase):
+    """Serves SITE from a temporary directory for the duration of a test."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for path, text in SITE.items():
+            self.write(path, text)
+        handler = functools.partial(QuietHandler, directory=self.root)
+        self.server = dev_server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def write(self, path, text):
+        full_path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def request(self, path, headers=None, method="GET"):
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+        self.addCleanup(conn.close)
+        conn.request(method, path, headers=headers or {})
+        response = conn.getresponse()
+        return response, response.read()
+
+    def current_version(self, path):
+        etag = self.request(path)[0].getheader("ETag")
+        return dev_server.ProductionHTTPRequestHandler.version(etag)
+
+
+class CacheControlTest(ProductionServerTestCase):
+
+    def test_current_version_is_immutable(self):
+        version = self.current_version("/script.js")
+        response, _ = self.request(f"/script.js?v={version}")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.IMMUTABLE_CACHE_CONTROL)
+
+    def test_stale_or_made_up_version_is_revalidated(self):
+        response, _ = self.request("/script.js?v=000000000000")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.REVALIDATE_CACHE_CONTROL)
+
+        version = self.current_version("/styles.css")
+        self.write("styles.css", "body { color: red; }")
+        response, _ = self.request(f"/styles.css?v={version}")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.REVALIDATE_CACHE_CONTROL)
+
+    def test_html_references_carry_the_current_version(self):
+        _, body = self.request("/")
+        self.assertIn(f'script.js?v={self.current_version("/script.js")}', body.decode('utf-8'))
+
+    def test_hashed_names_and_data(self):
+        response, _ = self.request("/script.0123456789ab.js")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.IMMUTABLE_CACHE_CONTROL)
+        response, _ = self.request("/campaigns/active/manifest.json")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.REVALIDATE_CACHE_CONTROL)
+        response, _ = self.request("/script.js")
+        self.assertEqual(response.getheader("Cache-Control"), dev_server.DEFAULT_CACHE_CONTROL)
+
+
+class ConditionalRequestTest(ProductionServerTestCase):
+
+    def test_matching_etag_is_not_modified(self):
+        response, body = self.request("/script.js")
+        etag = response.getheader("ETag")
+        self.assertEqual(body, SITE["script.js"].encode('utf-8'))
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response, body = self.request("/script.js", {"If-None-Match": if_none_match})
+            self.assertEqual((response.status, body), (304, b""))
+            self.assertEqual(response.getheader("ETag"), etag)
+
+        response, _ = self.request("/script.js", {"If-None-Match": '"other"'})
+        self.assertEqual(response.status, 200)
+
+    def test_changed_file_gets_a_new_etag(self):
+        etag = self.request("/styles.css")[0].getheader("ETag")
+        self.write("styles.css", "body { color: red; }")
+        response, body = self.request("/styles.css", {"If-None-Match": etag})
+        self.assertEqual((response.status, body), (200, b"body { color: red; }"))
+        self.assertNotEqual(response.getheader("ETag"), etag)
+
+    def test_html_etag_covers_the_rewritten_page(self):
+        response, _ = self.request("/")
+        etag = response.getheader("ETag")
+        self.assertEqual(self.request("/", {"If-None-Match": etag})[0].status, 304)
+        # A new script version changes the page that references it
+        self.write("script.js", "console.log('new');")
+        self.assertEqual(self.request("/", {"If-None-Match": etag})[0].status, 200)
+
+    def test_each_encoding_has_its_own_etag(self):
+        identity = self.request("/script.js")[0].getheader("ETag")
+        response, body = self.request("/script.js", {"Accept-Encoding": "gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(response.getheader("ETag"), f'{identity[:-1]}-gzip"')
+        self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+        self.assertEqual(gzip.decompress(body), SITE["script.js"].encode('utf-8'))
+
+    def test_byte_ranges(self):
+        data = SITE["script.js"].encode('utf-8')
+        response, body = self.request("/script.js", {"Range": "bytes=0-9"})
+        self.assertEqual((response.status, body), (206, data[:10]))
+        self.assertEqual(response.getheader("Content-Range"), f"bytes 0-9/{len(data)}")
+
+        response, body = self.request("/script.js", {"Range": "bytes=-5"})
+        self.assertEqual((response.status, body), (206, data[-5:]))
+        response, body = self.request("/script.js", {"Range": f"bytes={len(data) - 3}-"})
+        self.assertEqual((response.status, body), (206, data[-3:]))
+
+        # Malformed or multiple ranges get the whole file
+        response, body = self.request("/script.js", {"Range": "bytes=0-1,4-5"})
+        self.assertEqual((response.status, body), (200, data))
+
+    def test_unsatisfiable_range(self):
+        size = len(SITE["script.js"])
+        response, body = self.request("/script.js", {"Range": f"bytes={size}-"})
+        self.assertEqual((response.status, body), (416, b""))
+        self.assertEqual(response.getheader("Content-Range"), f"bytes */{size}")
+
+    def test_if_range_with_an_old_etag_sends_the_whole_file(self):
+        etag = self.request("/styles.css")[0].getheader("ETag")
+        response, body = self.request("/styles.css", {"Range": "bytes=0-3", "If-Range": etag})
+        self.assertEqual((response.status, body), (206, b"body"))
+
+        self.write("styles.css", "main { color: red; }")
+        response, body = self.request("/styles.css", {"Range": "bytes=0-3", "If-Range": etag})
+        self.assertEqual((response.status, body), (200, b"main { color: red; }"))
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = dev_server.LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+
+class AffectedSectionsTest(unittest.TestCase):
+
+    def test_source_files_select_their_section(self):
+        paths = {"master_campaign_details.csv", "news/a.json", "news/manifest.json",
+                 "success-stories/bundle.0123456789abcdef.json", "styles.css"}
+        self.assertEqual(dev_server.affected_sections(paths, "master_campaign_details.csv"),
+                         {"campaigns", "news"})
+
+    def test_lost_events_rebuild_every_section(self):
+        sections = dev_server.affected_sections({dev_server.RESCAN}, "master_campaign_details.csv")
+        self.assertEqual(sections, set(dev_server.CONTENT_SECTIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
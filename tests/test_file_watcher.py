@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - File Watcher Tests
+
+Feeds raw inotify events to the watcher through a pipe and checks the
+reported paths, including the RESCAN marker for a queue overflow, and the
+polling fallback.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_watcher import (EVENT_HEADER, IN_CLOSE_WRITE, IN_Q_OVERFLOW, RESCAN, InotifyWatcher,
+                          PollingWatcher)
+
+
+def event(wd, mask, name=b""):
+    if name:
+        name += b"\0" * (16 - len(name))
+    return EVENT_HEADER.pack(wd, mask, 0, len(name)) + name
+
+
+class InotifyEventsTest(unittest.TestCase):
+
+    def setUp(self):
+        # A watcher reading from a pipe instead of an inotify descriptor
+        read_fd, self.write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        self.addCleanup(os.close, self.write_fd)
+        self.watcher = InotifyWatcher.__new__(InotifyWatcher)
+        self.watcher._fd = read_fd
+        self.watcher._directories = {1: "campaigns/active"}
+        self.addCleanup(self.watcher.close)
+
+    def test_changed_files_are_reported(self):
+        os.write(self.write_fd, event(1, IN_CLOSE_WRITE, b"a.json") + event(1, IN_CLOSE_WRITE, b".a.tmp"))
+        self.assertEqual(self.watcher.wait(1), {os.path.join("campaigns", "active", "a.json")})
+
+    def test_overflow_reports_rescan(self):
+        os.write(self.write_fd, event(1, IN_CLOSE_WRITE, b"a.json") + event(-1, IN_Q_OVERFLOW))
+        changed = self.watcher.wait(1)
+        self.assertIn(RESCAN, changed)
+        self.assertIn(os.path.join("campaigns", "active", "a.json"), changed)
+
+    def test_timeout_reports_nothing(self):
+        self.assertEqual(self.watcher.wait(0), set())
+
+
+class PollingWatcherTest(unittest.TestCase):
+
+    def test_modified_file_is_reported(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        path = os.path.join(root, "a.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("{}")
+        watcher = PollingWatcher([root], interval=0.01)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"changed": true}')
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        self.assertIn(path, watcher.wait(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
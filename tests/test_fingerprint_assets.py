@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Asset Fingerprinting Tests
+
+Builds a small site in a temporary directory, with and without the admin
+panel, and checks the hashed names, rewritten references, precompressed
+copies and asset map, and that a changed asset replaces its old copy.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fingerprint_assets import ASSET_MAP_FILENAME, AssetFingerprinter, hashed_name
+
+SITE = {
+    "index.html": '<link href="styles.css"><script src="script.js"></script>',
+    "admin.html": '<script src="admin-auth.js"></script><script src="admin.js"></script>',
+    "styles.css": "body { background: url('assets/logo.png'); }",
+    "script.js": "fetch('campaigns/active/manifest.json');",
+    "admin.js": "console.log('admin');",
+    "admin-auth.js": "console.log('auth');",
+    "assets/logo.png": "png",
+    "campaigns/active/manifest.json": '{"campaigns": []}',
+    "campaigns/_build_state.json": "{}"
+}
+
+
+class FingerprintTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        for path, text in SITE.items():
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    def read(self, path):
+        with open(os.path.join("dist", path), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_default_build_leaves_admin_out(self):
+        asset_map = AssetFingerprinter("dist").build()
+        self.assertEqual(sorted(asset_map), ["assets/logo.png", "script.js", "styles.css"])
+        self.assertFalse([name for name in os.listdir("dist") if name.startswith("admin")])
+
+        index = self.read("index.html")
+        self.assertIn(asset_map["script.js"], index)
+        self.assertIn(asset_map["styles.css"], index)
+        self.assertIn(asset_map["assets/logo.png"], self.read(asset_map["styles.css"]))
+        self.assertTrue(os.path.exists(os.path.join("dist", asset_map["script.js"] + ".gz")))
+
+        # Data keeps its name, converter bookkeeping is not deployed
+        self.assertTrue(os.path.exists("dist/campaigns/active/manifest.json"))
+        self.assertFalse(os.path.exists("dist/campaigns/_build_state.json"))
+        with open(os.path.join("dist", ASSET_MAP_FILENAME), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["assets"], asset_map)
+
+    def test_include_admin_fingerprints_the_panel(self):
+        asset_map = AssetFingerprinter("dist", include_admin=True).build()
+        with open("admin.js", 'rb') as f:
+            self.assertEqual(asset_map["admin.js"], hashed_name("admin.js", f.read()))
+        admin = self.read("admin.html")
+        self.assertIn(asset_map["admin.js"], admin)
+        self.assertIn(asset_map["admin-auth.js"], admin)
+
+        # A later default build removes the panel again
+        AssetFingerprinter("dist").build()
+        self.assertFalse([name for name in os.listdir("dist") if name.startswith("admin")])
+
+    def test_rebuild_without_changes_writes_nothing(self):
+        AssetFingerprinter("dist").build()
+        rebuild = AssetFingerprinter("dist")
+        rebuild.build()
+        self.assertEqual(rebuild.written, 0)
+
+    def test_changed_asset_replaces_its_hashed_copy(self):
+        old_name = AssetFingerprinter("dist").build()["script.js"]
+        with open("script.js", 'w', encoding='utf-8') as f:
+            f.write("fetch('campaigns/ended/manifest.json');")
+        asset_map = AssetFingerprinter("dist").build()
+        self.assertNotEqual(asset_map["script.js"], old_name)
+        self.assertIn(asset_map["script.js"], self.read("index.html"))
+        self.assertFalse(os.path.exists(os.path.join("dist", old_name)))
+        self.assertFalse(os.path.exists(os.path.join("dist", old_name + ".gz")))
+        with gzip.open(os.path.join("dist", asset_map["script.js"] + ".gz"), 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "fetch('campaigns/ended/manifest.json');")
+
+    def test_only_whole_paths_are_rewritten(self):
+        for path, text in (("assets/logo.0123456789ab.png", "png"),
+                           ("index.html", '<script src="script.js"></script><a href="my-script.js">')):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        asset_map = AssetFingerprinter("dist").build()
+        # Already hashed names are copied as they are
+        self.assertNotIn("assets/logo.0123456789ab.png", asset_map)
+        self.assertTrue(os.path.exists("dist/assets/logo.0123456789ab.png"))
+        self.assertIn('href="my-script.js"', self.read("index.html"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Image Optimizer Tests
+
+Checks how image paths are matched to the asset manifest, and (with
+Pillow) that the optimizer builds variants, skips unchanged images,
+rebuilds or drops changed and deleted ones and rewrites content files and
+bundles.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_to_json_converter import image_variants, read_manifest
+from optimize_assets import AssetOptimizer, Image
+
+ENTRY = {"width": 640, "height": 480, "srcset": {"webp": "a.webp 640w"}, "variants": []}
+
+
+class ImageVariantsTest(unittest.TestCase):
+
+    def test_matches_with_and_without_dot_slash(self):
+        images = {"assets/x.jpg": ENTRY}
+        expected = {"width": 640, "height": 480, "srcset": {"webp": "a.webp 640w"}}
+        self.assertEqual(image_variants(images, "assets/x.jpg"), expected)
+        self.assertEqual(image_variants(images, "./assets/x.jpg"), expected)
+
+    def test_only_the_dot_slash_prefix_is_removed(self):
+        images = {"assets/x.jpg": ENTRY, "images/x.jpg": ENTRY, "hidden.jpg": ENTRY}
+        self.assertIsNone(image_variants(images, "../images/x.jpg"))
+        self.assertIsNone(image_variants(images, ".hidden.jpg"))
+        self.assertIsNone(image_variants(images, ""))
+        self.assertIsNone(image_variants(images, None))
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class AssetOptimizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+        os.makedirs("assets")
+        Image.new("RGB", (800, 600), (200, 40, 40)).save("assets/photo.jpg")
+        os.makedirs("news")
+        with open("news/a.json", 'w', encoding='utf-8') as f:
+            json.dump({"id": "a", "title": "A", "image": "assets/photo.jpg"}, f)
+        with open("news/manifest.json", 'w', encoding='utf-8') as f:
+            json.dump({"articles": ["a.json"]}, f)
+
+    def test_variants_are_built_once_and_referenced(self):
+        optimizer = AssetOptimizer([320, 640], workers=1)
+        manifest = optimizer.optimize()
+        entry = manifest["assets/photo.jpg"]
+        self.assertEqual((entry["width"], entry["height"]), (800, 600))
+        self.assertTrue(all(os.path.exists(variant["path"]) for variant in entry["variants"]))
+        self.assertLessEqual(max(variant["width"] for variant in entry["variants"]), 800)
+
+        optimizer.rewrite_references()
+        with open("news/a.json", 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["imageVariants"]["width"], 800)
+        bundle = read_manifest("news")["bundle"]
+        with open(os.path.join("news", bundle), 'r', encoding='utf-8') as f:
+            self.assertIn("imageVariants", json.load(f)["articles"][0])
+
+        # Unchanged sources are not processed again
+        again = AssetOptimizer([320, 640], workers=1)
+        self.assertEqual(again.optimize()["assets/photo.jpg"], entry)
+
+    def test_changed_and_removed_sources(self):
+        entry = AssetOptimizer([320], workers=1).optimize()["assets/photo.jpg"]
+
+        # A touched but identical image is kept, an edited one is rebuilt
+        os.utime("assets/photo.jpg", ns=(entry["mtime"] + 10 ** 9, entry["mtime"] + 10 ** 9))
+        self.assertEqual(AssetOptimizer([320], workers=1).optimize()["assets/photo.jpg"]["sourceHash"],
+                         entry["sourceHash"])
+        Image.new("RGB", (400, 300), (40, 40, 200)).save("assets/photo.jpg")
+        changed = AssetOptimizer([320], workers=1).optimize()["assets/photo.jpg"]
+        self.assertNotEqual(changed["sourceHash"], entry["sourceHash"])
+        self.assertEqual((changed["width"], changed["height"]), (400, 300))
+        self.assertFalse(any(os.path.exists(variant["path"]) for variant in entry["variants"]))
+
+        # Variants of a deleted image are removed with it
+        os.remove("assets/photo.jpg")
+        self.assertEqual(AssetOptimizer([320], workers=1).optimize(), {})
+        self.assertFalse(any(os.path.exists(variant["path"]) for variant in changed["variants"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Campaign Statistics Tests
+
+Checks the nearest-rank percentiles reported in _stats.json and how the
+derived figures are merged into the hand-maintained ones.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import collections
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_to_json_converter import CampaignStats, merge_stats
+
+MANUAL = {"totalCampaigns": 48, "activeCampaigns": 8, "livesImpacted": 156, "successRate": 92}
+
+
+def stats_with_days(days):
+    return CampaignStats({"completionDays": {str(day): count for day, count in collections.Counter(days).items()}})
+
+
+def ended(start, end):
+    return {"summary": {"status": "ended", "startDate": start, "completedDate": end}}
+
+
+class PercentileTest(unittest.TestCase):
+
+    def test_even_count(self):
+        # Nearest rank: p50 of 2n values is the n-th, whatever the parity of n
+        self.assertEqual(stats_with_days([10, 20])._percentile(0.5), 10)
+        self.assertEqual(stats_with_days([10, 20, 30, 40])._percentile(0.5), 20)
+        stats = stats_with_days([10, 20, 30, 40, 50, 60])
+        self.assertEqual(stats._percentile(0.5), 30)
+        self.assertEqual(stats._percentile(0.9), 60)
+
+    def test_odd_count(self):
+        stats = stats_with_days([10, 20, 30, 40, 50])
+        self.assertEqual(stats._percentile(0.5), 30)
+        self.assertEqual(stats._percentile(0.9), 50)
+
+    def test_single_and_empty(self):
+        self.assertEqual(stats_with_days([7])._percentile(0.5), 7)
+        self.assertIsNone(stats_with_days([])._percentile(0.5))
+
+    def test_repeated_days_are_counted(self):
+        stats = stats_with_days([10, 10, 10, 40])
+        self.assertEqual(stats._percentile(0.5), 10)
+        self.assertEqual(stats._percentile(0.9), 40)
+
+    def test_removed_campaigns_leave_the_counts(self):
+        stats = CampaignStats()
+        stats.add(ended("2024-01-01", "2024-01-11"))
+        stats.add(ended("2024-01-01", "2024-01-11"))
+        stats.add(ended("2024-01-01", "2024-01-31"))
+        stats.remove(ended("2024-01-01", "2024-01-11"))
+        self.assertEqual(stats.to_dict()["completionDays"], {"10": 1, "30": 1})
+        self.assertEqual(stats.report()["completionTimeDays"]["mean"], 20.0)
+        stats.remove(ended("2024-01-01", "2024-01-11"))
+        self.assertEqual(CampaignStats(stats.to_dict()).completion_days, {30: 1})
+
+
+class MergeStatsTest(unittest.TestCase):
+
+    def test_hand_maintained_figures_are_kept(self):
+        derived = {"totalCampaigns": 3, "activeCampaigns": 1, "livesImpacted": 2,
+                   "successRate": 50, "byStatus": {"active": {"count": 1}}}
+        stats, filled = merge_stats(MANUAL, derived, {})
+        self.assertEqual(stats["livesImpacted"], 156)
+        self.assertEqual(stats["totalCampaigns"], 48)
+        self.assertEqual(stats["successRate"], 92)
+        # The CSV lists every active campaign
+        self.assertEqual(stats["activeCampaigns"], 1)
+        self.assertEqual(stats["byStatus"], {"active": {"count": 1}})
+        self.assertEqual(filled, {})
+
+    def test_missing_figures_are_filled_and_refreshed(self):
+        stats, filled = merge_stats({"livesImpacted": 156}, {"livesImpacted": 2, "totalCampaigns": 3}, {})
+        self.assertEqual(stats, {"livesImpacted": 156, "totalCampaigns": 3})
+        self.assertEqual(filled, {"totalCampaigns": 3})
+
+        # Still the value filled in last time: refreshed from the data
+        stats, filled = merge_stats(stats, {"livesImpacted": 2, "totalCampaigns": 4}, filled)
+        self.assertEqual(stats["totalCampaigns"], 4)
+
+        # Edited by hand since: kept
+        stats, filled = merge_stats(dict(stats, totalCampaigns=50), {"totalCampaigns": 5}, filled)
+        self.assertEqual(stats["totalCampaigns"], 50)
+        self.assertEqual(filled, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
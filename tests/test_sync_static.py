@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Static Sync Tests
+
+Checks the change set, the hash reuse of the source scan, and the order
+and failure handling of a sync against a temporary target directory.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sync_static
+from sync_static import StaticSync, compute_changeset, file_hash, read_deploy_state, scan_source
+
+SCRIPT_V1 = "script.0123456789ab.js"
+SCRIPT_V2 = "script.ba9876543210.js"
+
+
+def write(root, path, text):
+    full_path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def entry(digest, size=1):
+    return {"hash": digest, "size": size, "mtime": 0}
+
+
+class ScanSourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source)
+        write(self.source, "index.html", "<html></html>")
+        write(self.source, "campaigns/active/a.json", "{}")
+        write(self.source, ".hidden", "x")
+
+    def test_hashes_every_visible_file(self):
+        files = scan_source(self.source, {})
+        self.assertEqual(sorted(files), ["campaigns/active/a.json", "index.html"])
+        self.assertEqual(files["index.html"]["hash"], file_hash(os.path.join(self.source, "index.html")))
+
+    def test_reuses_hash_when_size_and_mtime_match(self):
+        stat = os.stat(os.path.join(self.source, "index.html"))
+        deployed = {"index.html": {"hash": "recorded", "size": stat.st_size, "mtime": stat.st_mtime_ns}}
+        self.assertEqual(scan_source(self.source, deployed)["index.html"]["hash"], "recorded")
+
+        deployed["index.html"]["mtime"] -= 1
+        self.assertNotEqual(scan_source(self.source, deployed)["index.html"]["hash"], "recorded")
+
+
+class ComputeChangesetTest(unittest.TestCase):
+
+    def test_added_modified_deleted(self):
+        files = {"index.html": entry("new", 10), "news/b.json": entry("b", 5), "about.html": entry("same", 3)}
+        deployed = {"index.html": entry("old"), "about.html": entry("same"), "news/old.json": entry("o")}
+        changeset = compute_changeset(files, deployed)
+        self.assertEqual(changeset["added"], {"news/b.json": "b"})
+        self.assertEqual(changeset["modified"], {"index.html": "new"})
+        self.assertEqual(changeset["deleted"], ["news/old.json"])
+        self.assertEqual(changeset["retired"], [])
+        self.assertEqual(changeset["unchanged"], 1)
+        self.assertEqual(changeset["uploadBytes"], 15)
+        self.assertEqual(changeset["invalidate"], ["/index.html", "/news/old.json"])
+
+    def test_replaced_fingerprinted_files_are_retired_then_deleted(self):
+        files = {SCRIPT_V2: entry("v2")}
+        changeset = compute_changeset(files, {SCRIPT_V1: entry("v1")})
+        self.assertEqual(changeset["retired"], [SCRIPT_V1])
+        self.assertEqual(changeset["deleted"], [])
+        self.assertEqual(changeset["invalidate"], [])
+
+        changeset = compute_changeset(files, {SCRIPT_V1: dict(entry("v1"), retired=True), SCRIPT_V2: entry("v2")})
+        self.assertEqual(changeset["retired"], [])
+        self.assertEqual(changeset["deleted"], [SCRIPT_V1])
+
+
+class StaticSyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.source = os.path.join(self.root, "dist")
+        self.target = os.path.join(self.root, "target")
+        self.state = os.path.join(self.root, "state.json")
+        write(self.source, "index.html", f'<script src="{SCRIPT_V1}"></script>')
+        write(self.source, SCRIPT_V1, "v1")
+        write(self.source, "campaigns/active/manifest.json", "{}")
+        write(self.source, "campaigns/active/a.json", "{}")
+
+    def sync(self, **kwargs):
+        return StaticSync(self.source, self.target, workers=1, state_path=self.state, **kwargs)
+
+    def test_entry_points_are_copied_last(self):
+        order = []
+        with mock.patch.object(sync_static, "copy_file", lambda source, target, path: order.append(path)):
+            self.assertTrue(self.sync().sync())
+        self.assertEqual(order[-2:], ["campaigns/active/manifest.json", "index.html"])
+        self.assertEqual(sorted(order[:-2]), ["campaigns/active/a.json", SCRIPT_V1])
+
+    def test_state_is_kept_outside_the_target(self):
+        self.sync().sync()
+        self.assertFalse(any(name.startswith('.') for name in os.listdir(self.target)))
+        self.assertEqual(sorted(read_deploy_state(self.state)),
+                         ["campaigns/active/a.json", "campaigns/active/manifest.json", "index.html", SCRIPT_V1])
+        self.assertEqual(self.sync().changeset["unchanged"], 4)
+
+    def test_failed_copy_holds_back_pages_and_deletions(self):
+        self.sync().sync()
+        os.remove(os.path.join(self.source, "campaigns/active/a.json"))
+        write(self.source, "campaigns/active/b.json", '{"b": 1}')
+        write(self.source, "index.html", "<html>v2</html>")
+
+        real_copy = sync_static.copy_file
+        copied = []
+
+        def failing_copy(source, target, path):
+            if path == "campaigns/active/b.json":
+                raise OSError("bucket unavailable")
+            copied.append(path)
+            real_copy(source, target, path)
+
+        with mock.patch.object(sync_static, "copy_file", failing_copy):
+            self.assertFalse(self.sync().sync())
+        self.assertNotIn("index.html", copied)
+        self.assertTrue(os.path.exists(os.path.join(self.target, "campaigns/active/a.json")))
+
+        # The next sync retries what failed and only then deletes
+        state = read_deploy_state(self.state)
+        self.assertIn("campaigns/active/a.json", state)
+        self.assertNotIn("campaigns/active/b.json", state)
+        retry = self.sync()
+        self.assertEqual(sorted(retry.changeset["added"]), ["campaigns/active/b.json"])
+        self.assertTrue(retry.sync())
+        self.assertFalse(os.path.exists(os.path.join(self.target, "campaigns/active/a.json")))
+
+    def test_replaced_script_survives_one_deploy(self):
+        self.sync().sync()
+        os.remove(os.path.join(self.source, SCRIPT_V1))
+        write(self.source, SCRIPT_V2, "v2")
+        write(self.source, "index.html", f'<script src="{SCRIPT_V2}"></script>')
+
+        self.assertTrue(self.sync().sync())
+        self.assertTrue(os.path.exists(os.path.join(self.target, SCRIPT_V1)))
+        self.assertTrue(read_deploy_state(self.state)[SCRIPT_V1]["retired"])
+
+        self.assertTrue(self.sync().sync())
+        self.assertFalse(os.path.exists(os.path.join(self.target, SCRIPT_V1)))
+        self.assertTrue(os.path.exists(os.path.join(self.target, SCRIPT_V2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
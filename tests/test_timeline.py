@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Sevabrata Foundation - Timeline Merge Tests
+
+Checks the timeline dedupe keys, ordering and merging of new events, the
+sorted key index kept in the build state, and that an incremental run only
+merges the CSV events added since the last run.
+
+Usage:
+    python3 -m unittest discover tests
+
+Author: Generated for Sevabrata Foundation
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csv_to_json_converter
+from csv_to_json_converter import (CampaignConverter, TimelineKeys, condition_tags, index_timeline,
+                                   merge_timeline, timeline_key)
+
+HEADER = "title,name,condition,category,status,date,event,description\n"
+FIRST = "Asha - Surgery,Asha,Right eye surgery (caused by accident),Medical,active,2024-01-01,Launched,\n"
+
+
+def event(date, name="Update"):
+    return {"date": date, "event": name, "description": ""}
+
+
+class TimelineKeyTest(unittest.TestCase):
+
+    def test_key_depends_on_date_and_event_only(self):
+        key = timeline_key(event("2024-01-01"))
+        self.assertEqual(len(key), csv_to_json_converter.TIMELINE_KEY_WIDTH)
+        self.assertEqual(key, timeline_key(dict(event("2024-01-01"), description="other")))
+        self.assertNotEqual(key, timeline_key(event("2024-01-02")))
+        self.assertNotEqual(key, timeline_key(event("2024-01-01", "Other")))
+
+
+class TimelineKeysTest(unittest.TestCase):
+
+    def test_added_keys_stay_sorted_and_unique(self):
+        keys = TimelineKeys.from_keys(["c" * 12, "a" * 12])
+        keys.add("b" * 12)
+        keys.add("a" * 12)
+        keys.add("d" * 12)
+        self.assertEqual(len(keys), 4)
+        self.assertIn("b" * 12, keys)
+        self.assertNotIn("e" * 12, keys)
+        self.assertEqual(keys.pack(), "a" * 12 + "b" * 12 + "c" * 12 + "d" * 12)
+
+    def test_round_trip_through_packed_string(self):
+        keys = TimelineKeys(TimelineKeys.from_keys(["b" * 12, "a" * 12]).pack())
+        self.assertIn("a" * 12, keys)
+        self.assertEqual(keys.pack(), "a" * 12 + "b" * 12)
+
+
+class IndexTimelineTest(unittest.TestCase):
+
+    def test_out_of_order_timeline_is_sorted(self):
+        timeline = [event("2024-03-01"), event("2024-01-01"), event("2024-02-01")]
+        keys = index_timeline(timeline)
+        self.assertEqual([item["date"] for item in timeline], ["2024-01-01", "2024-02-01", "2024-03-01"])
+        self.assertEqual(len(keys), 3)
+        self.assertTrue(all(timeline_key(item) in keys for item in timeline))
+
+
+class MergeTimelineTest(unittest.TestCase):
+
+    def test_duplicates_are_skipped(self):
+        timeline = [event("2024-01-01"), event("2024-02-01")]
+        merged = merge_timeline(timeline, [event("2024-02-01"), event("2024-03-01"), event("2024-03-01")])
+        self.assertEqual([item["date"] for item in merged], ["2024-01-01", "2024-02-01", "2024-03-01"])
+
+    def test_out_of_order_events_are_inserted_by_date(self):
+        timeline = [event("2024-01-01", "A"), event("2024-03-01", "C")]
+        keys = index_timeline(timeline)
+        merge_timeline(timeline, [event("2024-04-01", "D"), event("2024-02-01", "B"), event("2024-01-01", "A2")], keys)
+        self.assertEqual([item["event"] for item in timeline], ["A", "A2", "B", "C", "D"])
+        self.assertEqual(len(keys), 5)
+
+    def test_later_events_are_appended(self):
+        timeline = [event("2024-01-01")]
+        keys = index_timeline(timeline)
+        merge_timeline(timeline, [event("2024-01-01", "Same day"), event("2024-02-01")], keys)
+        self.assertEqual([item["event"] for item in timeline], ["Update", "Same day", "Update"])
+        self.assertEqual(keys.pack(), index_timeline(list(timeline)).pack())
+
+
+class ConditionTagsTest(unittest.TestCase):
+
+    def test_splits_on_separators_and_drops_remarks(self):
+        self.assertEqual(condition_tags("Right eye surgery (caused by accident)"), ["right eye surgery"])
+        self.assertEqual(condition_tags("Throat cancer;  Chemotherapy, kidney / liver"),
+                         ["throat cancer", "chemotherapy", "kidney", "liver"])
+        self.assertEqual(condition_tags("(unknown)"), [])
+
+
+class IncrementalTimelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.root)
+
+    def convert(self, rows):
+        with open("campaigns.csv", 'w', encoding='utf-8') as f:
+            f.write(HEADER + "".join(rows))
+        converter = CampaignConverter("campaigns.csv", incremental=True, asset_images={}, verbose=False)
+        converter.convert()
+        with open("campaigns/active/asha-surgery.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_only_new_csv_events_are_merged(self):
+        campaign = self.convert([FIRST, "Asha - Surgery,,,,,2024-02-01,Admitted,\n"])
+        self.assertEqual(campaign["tags"], ["medical", "right eye surgery"])
+
+        hashed = []
+        real_key = csv_to_json_converter.timeline_key
+
+        def counting_key(item):
+            hashed.append(item["event"])
+            return real_key(item)
+
+        with mock.patch.object(csv_to_json_converter, "timeline_key", counting_key):
+            campaign = self.convert([FIRST, "Asha - Surgery,,,,,2024-02-01,Admitted,\n",
+                                     "Asha - Surgery,,,,,2024-01-15,Tests,\n"])
+        self.assertEqual([item["event"] for item in campaign["timeline"]], ["Launched", "Tests", "Admitted"])
+        # Head and tail checks of the merged events, the new event, the new head and tail
+        self.assertEqual(hashed, ["Launched", "Admitted", "Tests", "Launched", "Tests"])
+
+
+if __name__ == "__main__":
+    unittest.main()